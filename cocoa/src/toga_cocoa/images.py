@@ -18,6 +18,11 @@ def nsdata_to_bytes(data: NSData) -> bytes:
     return cast(data.bytes, POINTER(c_char))[: data.length]
 
 
+# Ownership of native images: every Image owns one reference to its NSImage, which
+# is released when the Image is deleted. An NSImage may be shared by several images
+# (e.g., by images that are loaded from the core image cache); each of them takes its
+# own reference. The core image cache holds the Image that loaded the NSImage, rather
+# than the NSImage itself, so a cached NSImage remains valid until it is evicted.
 class Image:
     RAW_TYPE = NSImage
 
@@ -50,7 +55,11 @@ class Image:
                 else:
                     self._needs_release = True
             else:
+                # The native image is shared with other images, so hold a reference
+                # for as long as this image exists.
                 self.native = raw
+                self.native.retain()
+                self._needs_release = True
         finally:
             # Calling `release` here disabled Rubicon's "release on delete" automation.
             # We therefore add an explicit `release` call in __del__ if the NSImage was
@@ -185,6 +185,13 @@ class Table(Widget):
             index_set, withAnimation=NSTableViewAnimation.EffectNone
         )
 
+    def insert_range(self, index, items):
+        index_set = NSIndexSet.indexSetWithIndexesInRange(NSRange(index, len(items)))
+
+        self.native_table.insertRowsAtIndexes(
+            index_set, withAnimation=NSTableViewAnimation.EffectNone
+        )
+
     def change(self, item):
         row_index = self.interface.data.index(item)
         row_indexes = NSIndexSet.indexSetWithIndex(row_index)
@@ -202,6 +209,12 @@ class Table(Widget):
             indexes, withAnimation=NSTableViewAnimation.EffectNone
         )
 
+    def remove_range(self, index, items):
+        indexes = NSIndexSet.indexSetWithIndexesInRange(NSRange(index, len(items)))
+        self.native_table.removeRowsAtIndexes(
+            indexes, withAnimation=NSTableViewAnimation.EffectNone
+        )
+
     def clear(self):
         self.native_table.reloadData()
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import importlib
 import warnings
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from .app import App, DocumentApp
 from .colors import hsl, hsla, rgb, rgba
@@ -16,40 +18,94 @@ from .dialogs import (
     SelectFolderDialog,
     StackTraceDialog,
 )
-from .documents import Document
 from .fonts import Font
 from .icons import Icon
 from .images import Image
 from .keys import Key
 from .types import LatLng, Position, Size
-from .widgets.activityindicator import ActivityIndicator
 from .widgets.base import Widget
-from .widgets.box import Box
-from .widgets.button import Button
-from .widgets.canvas import Canvas
-from .widgets.dateinput import DateInput, DatePicker
-from .widgets.detailedlist import DetailedList
-from .widgets.divider import Divider
-from .widgets.imageview import ImageView
-from .widgets.label import Label
-from .widgets.mapview import MapPin, MapView
-from .widgets.multilinetextinput import MultilineTextInput
-from .widgets.numberinput import NumberInput
-from .widgets.optioncontainer import OptionContainer, OptionItem
-from .widgets.passwordinput import PasswordInput
-from .widgets.progressbar import ProgressBar
-from .widgets.scrollcontainer import ScrollContainer
-from .widgets.selection import Selection
-from .widgets.slider import Slider
-from .widgets.splitcontainer import SplitContainer
-from .widgets.switch import Switch
-from .widgets.table import Table
-from .widgets.textinput import TextInput
-from .widgets.timeinput import TimeInput, TimePicker
-from .widgets.tree import Tree
-from .widgets.webview import WebView
 from .window import DocumentMainWindow, MainWindow, Window
 
+if TYPE_CHECKING:
+    from .documents import Document
+    from .widgets.activityindicator import ActivityIndicator
+    from .widgets.box import Box
+    from .widgets.button import Button
+    from .widgets.canvas import Canvas, OffscreenCanvas
+    from .widgets.dateinput import DateInput, DatePicker
+    from .widgets.detailedlist import DetailedList
+    from .widgets.divider import Divider
+    from .widgets.imageview import ImageView
+    from .widgets.label import Label
+    from .widgets.mapview import MapPin, MapView
+    from .widgets.multilinetextinput import MultilineTextInput
+    from .widgets.numberinput import NumberInput
+    from .widgets.optioncontainer import OptionContainer, OptionItem
+    from .widgets.passwordinput import PasswordInput
+    from .widgets.progressbar import ProgressBar
+    from .widgets.scrollcontainer import ScrollContainer
+    from .widgets.selection import Selection
+    from .widgets.slider import Slider
+    from .widgets.splitcontainer import SplitContainer
+    from .widgets.switch import Switch
+    from .widgets.table import Table
+    from .widgets.textinput import TextInput
+    from .widgets.timeinput import TimeInput, TimePicker
+    from .widgets.tree import Tree
+    from .widgets.webview import WebView
+
+# Most widgets (and other classes that an app may never use) are only imported when
+# they are first accessed, so that they don't slow down the startup of every app. This
+# is the module that defines each of them.
+_LAZY_IMPORTS = {
+    "Document": ".documents",
+    "ActivityIndicator": ".widgets.activityindicator",
+    "Box": ".widgets.box",
+    "Button": ".widgets.button",
+    "Canvas": ".widgets.canvas",
+    "OffscreenCanvas": ".widgets.canvas",
+    "DateInput": ".widgets.dateinput",
+    "DatePicker": ".widgets.dateinput",
+    "DetailedList": ".widgets.detailedlist",
+    "Divider": ".widgets.divider",
+    "ImageView": ".widgets.imageview",
+    "Label": ".widgets.label",
+    "MapPin": ".widgets.mapview",
+    "MapView": ".widgets.mapview",
+    "MultilineTextInput": ".widgets.multilinetextinput",
+    "NumberInput": ".widgets.numberinput",
+    "OptionContainer": ".widgets.optioncontainer",
+    "OptionItem": ".widgets.optioncontainer",
+    "PasswordInput": ".widgets.passwordinput",
+    "ProgressBar": ".widgets.progressbar",
+    "ScrollContainer": ".widgets.scrollcontainer",
+    "Selection": ".widgets.selection",
+    "Slider": ".widgets.slider",
+    "SplitContainer": ".widgets.splitcontainer",
+    "Switch": ".widgets.switch",
+    "Table": ".widgets.table",
+    "TextInput": ".widgets.textinput",
+    "TimeInput": ".widgets.timeinput",
+    "TimePicker": ".widgets.timeinput",
+    "Tree": ".widgets.tree",
+    "WebView": ".widgets.webview",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Store the value, so that this is only called the first time it's accessed.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 class NotImplementedWarning(RuntimeWarning):
     # pytest.warns() requires that Warning() subclasses are constructed by passing a
@@ -90,6 +146,7 @@ __all__ = [
     "Font",
     "Icon",
     "Image",
+    "OffscreenCanvas",
     # Types
     "LatLng",
     "Position",
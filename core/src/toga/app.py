@@ -7,25 +7,27 @@ import sys
 import warnings
 import webbrowser
 from collections.abc import Coroutine, Iterator
+from contextlib import AbstractContextManager, nullcontext
 from email.message import Message
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, MutableSet, Protocol
 from weakref import WeakValueDictionary
 
-from toga.command import CommandSet
+from toga.command import CommandSet, CommandSetChange
 from toga.handlers import simple_handler, wrapped_handler
-from toga.hardware.camera import Camera
-from toga.hardware.location import Location
 from toga.icons import Icon
 from toga.paths import Paths
 from toga.platform import get_platform_factory
 from toga.screens import Screen
+from toga.tracing import StartupTrace
 from toga.widgets.base import Widget
 from toga.window import MainWindow, Window
 
 if TYPE_CHECKING:
     from toga.dialogs import Dialog
     from toga.documents import Document
+    from toga.hardware.camera import Camera
+    from toga.hardware.location import Location
     from toga.icons import IconContentT
 
 # Make sure deprecation warnings are shown by default
@@ -217,6 +219,7 @@ class App:
     _camera: Camera
     _location: Location
     _main_window: Window | str | None
+    _startup_trace: StartupTrace | None
 
     #: A constant that can be used as the main window to indicate that an app will
     #: run in the background without a main window.
@@ -280,6 +283,9 @@ class App:
         :param windows: **DEPRECATED** – Windows are now automatically added to the
             current app. Passing this argument will cause an exception.
         """
+        # Start tracing as early as possible, so that the trace covers all of startup.
+        self._startup_trace = StartupTrace.from_environment()
+
         ######################################################################
         # 2023-10: Backwards compatibility
         ######################################################################
@@ -305,39 +311,8 @@ class App:
         # Keep an accessible copy of the app singleton instance
         App.app = self
 
-        # We need a distribution name to load app metadata.
-        if app_name is None:
-            # If the code is contained in appname.py, and you start the app using
-            # `python -m appname`, then __main__.__package__ will be an empty string.
-            #
-            # If the code is contained in appname.py, and you start the app using
-            # `python appname.py`, then __main__.__package__ will be None.
-            #
-            # If the code is contained in appname/__main__.py, and you start the app
-            # using `python -m appname`, then __main__.__package__ will be "appname".
-            try:
-                main_module_pkg = sys.modules["__main__"].__package__
-                if main_module_pkg:
-                    app_name = main_module_pkg
-            except KeyError:
-                # If there's no __main__ module, we're probably in a test.
-                pass
-
-        # Try deconstructing the distribution name from the app ID
-        if (app_name is None) and app_id:
-            app_name = app_id.split(".")[-1]
-
-        # If we still don't have a distribution name, fall back to ``toga`` as a
-        # last resort.
-        if app_name is None:
-            app_name = "toga"
-
-        # Try to load the app metadata with our best guess of the distribution name.
-        self._app_name = app_name
-        try:
-            self.metadata = importlib.metadata.metadata(app_name)
-        except importlib.metadata.PackageNotFoundError:
-            self.metadata = Message()
+        with self._trace("metadata"):
+            self._load_metadata(app_name, app_id)
 
         # If a formal name has been provided, use it; otherwise, look to
         # the metadata. However, a formal name *must* be provided.
@@ -379,15 +354,18 @@ class App:
             self._description = self.metadata.get("Summary", None)
 
         # Get a platform factory.
-        self.factory = get_platform_factory()
+        with self._trace("get_platform_factory"):
+            self.factory = get_platform_factory()
 
         # Instantiate the paths instance for this app.
-        self._paths = Paths()
+        with self._trace("Paths"):
+            self._paths = Paths()
 
-        if icon is None:
-            self.icon = Icon.APP_ICON
-        else:
-            self.icon = icon
+        with self._trace("icon"):
+            if icon is None:
+                self.icon = Icon.APP_ICON
+            else:
+                self.icon = icon
 
         # Install the lifecycle handlers. If passed in as an argument, or assigned using
         # `app.on_event = my_handler`, the event handler will take the app as the first
@@ -415,11 +393,56 @@ class App:
         self._full_screen_windows: tuple[Window, ...] | None = None
 
         # Create the implementation. This will trigger any startup logic.
-        self._create_impl()
+        with self._trace("_create_impl"):
+            self._create_impl()
+
+        if self._startup_trace:
+            self._startup_trace.add_phase("App.__init__", self._startup_trace.start)
+
+    def _load_metadata(self, app_name: str | None, app_id: str | None) -> None:
+        # We need a distribution name to load app metadata.
+        if app_name is None:
+            # If the code is contained in appname.py, and you start the app using
+            # `python -m appname`, then __main__.__package__ will be an empty string.
+            #
+            # If the code is contained in appname.py, and you start the app using
+            # `python appname.py`, then __main__.__package__ will be None.
+            #
+            # If the code is contained in appname/__main__.py, and you start the app
+            # using `python -m appname`, then __main__.__package__ will be "appname".
+            try:
+                main_module_pkg = sys.modules["__main__"].__package__
+                if main_module_pkg:
+                    app_name = main_module_pkg
+            except KeyError:
+                # If there's no __main__ module, we're probably in a test.
+                pass
+
+        # Try deconstructing the distribution name from the app ID
+        if (app_name is None) and app_id:
+            app_name = app_id.split(".")[-1]
+
+        # If we still don't have a distribution name, fall back to ``toga`` as a
+        # last resort.
+        if app_name is None:
+            app_name = "toga"
+
+        # Try to load the app metadata with our best guess of the distribution name.
+        self._app_name = app_name
+        try:
+            self.metadata = importlib.metadata.metadata(app_name)
+        except importlib.metadata.PackageNotFoundError:
+            self.metadata = Message()
 
     def _create_impl(self) -> None:
         self.factory.App(interface=self)
 
+    def _trace(self, name: str) -> AbstractContextManager[None]:
+        # Record a phase of startup, if startup is being traced.
+        if self._startup_trace and self._startup_trace.end is None:
+            return self._startup_trace.phase(name)
+        return nullcontext()
+
     ######################################################################
     # App properties
     ######################################################################
@@ -586,12 +609,24 @@ class App:
                 raise ValueError("App doesn't define any initial windows.")
 
     def _startup(self) -> None:
+        with self._trace("_startup"):
+            self._startup_phases()
+
+        # Queue a task to run as soon as the event loop starts.
+        self.loop.call_soon_threadsafe(wrapped_handler(self, self.on_running))
+        if self._startup_trace:
+            # The trace is finished once the on_running handler has been invoked.
+            self.loop.call_soon_threadsafe(self._startup_trace.finish)
+
+    def _startup_phases(self) -> None:
         # Install the platform-specific app commands. This is done *before* startup so
         # the user's code has the opporuntity to remove/change the default commands.
-        self._impl.create_app_commands()
+        with self._trace("create_app_commands"):
+            self._impl.create_app_commands()
 
         # Invoke the user's startup method (or the default implementation)
-        self.startup()
+        with self._trace("startup"):
+            self.startup()
 
         # Validate that the startup requirements have been met.
         # Accessing the main window attribute will raise an exception if the app hasn't
@@ -599,24 +634,32 @@ class App:
         _ = self.main_window
 
         # Create any initial windows
-        self._create_initial_windows()
+        with self._trace("create_initial_windows"):
+            self._create_initial_windows()
 
         # Manifest the initial state of the menus. This will cascade down to all
         # open windows if the platform has window-based menus. Then install the
         # on-change handler for menus to respond to any future changes.
-        self._impl.create_menus()
-        self.commands.on_change = self._impl.create_menus
+        with self._trace("create_menus"):
+            self._impl.create_menus()
+        self.commands.on_change = self._update_menus
 
         # Manifest the initial state of toolbars (on the windows that have
         # them), then install a change listener so that any future changes to
         # the toolbar cause a change in toolbar items.
-        for window in self.windows:
-            if hasattr(window, "toolbar"):
-                window._impl.create_toolbar()
-                window.toolbar.on_change = window._impl.create_toolbar
-
-        # Queue a task to run as soon as the event loop starts.
-        self.loop.call_soon_threadsafe(wrapped_handler(self, self.on_running))
+        with self._trace("create_toolbars"):
+            for window in self.windows:
+                if hasattr(window, "toolbar"):
+                    window._impl.create_toolbar()
+                    window.toolbar.on_change = window._update_toolbar
+
+    def _update_menus(self, change: CommandSetChange, **kwargs: Any) -> None:
+        # Backends that can update menus in place only patch the menus whose content
+        # has changed; other backends rebuild all the menus.
+        if update_menus := getattr(self._impl, "update_menus", None):
+            update_menus(change)
+        else:
+            self._impl.create_menus()
 
     def startup(self) -> None:
         """Create and show the main window for the application.
@@ -644,10 +687,22 @@ class App:
         except AttributeError:
             # Instantiate the camera instance for this app on first access
             # This will raise an exception if the platform doesn't implement
-            # the Camera API.
+            # the Camera API. Most apps don't use the camera, so it's only imported
+            # when it's needed.
+            from toga.hardware.camera import Camera
+
             self._camera = Camera(self)
         return self._camera
 
+    @property
+    def startup_trace(self) -> StartupTrace | None:
+        """The time taken by each phase of the app's startup (read-only).
+
+        Startup is only traced if the ``TOGA_STARTUP_TRACE`` environment variable is
+        set when the app is created; otherwise, this is ``None``.
+        """
+        return self._startup_trace
+
     @property
     def commands(self) -> CommandSet:
         """The commands available in the app."""
@@ -662,6 +717,8 @@ class App:
             # Instantiate the location service for this app on first access
             # This will raise an exception if the platform doesn't implement
             # the Location API.
+            from toga.hardware.location import Location
+
             self._location = Location(self)
         return self._location
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, MutableMapping, MutableSet, Protocol
 
 from toga.handlers import wrapped_handler
@@ -316,11 +317,94 @@ class Separator:
         return False
 
 
+class CommandSetChange:
+    def __init__(self):
+        """A description of the changes made to a CommandSet.
+
+        A change is passed to the ``on_change`` handler of a :class:`CommandSet`, so
+        that menus and toolbars can be updated without being rebuilt from scratch.
+        Groups are added when the first command in the group (or any of its
+        subgroups) is added, and removed when the last such command is removed.
+        """
+        self._added: dict[Command, None] = {}
+        self._removed: dict[Command, None] = {}
+        self._added_groups: dict[Group, None] = {}
+        self._removed_groups: dict[Group, None] = {}
+
+    @property
+    def added(self) -> list[Command]:
+        """The commands that have been added to the CommandSet."""
+        return list(self._added)
+
+    @property
+    def removed(self) -> list[Command]:
+        """The commands that have been removed from the CommandSet."""
+        return list(self._removed)
+
+    @property
+    def added_groups(self) -> list[Group]:
+        """The groups that contain commands, but didn't before the change."""
+        return list(self._added_groups)
+
+    @property
+    def removed_groups(self) -> list[Group]:
+        """The groups that contained commands, but don't after the change."""
+        return list(self._removed_groups)
+
+    @property
+    def groups(self) -> set[Group | None]:
+        """The groups whose content has changed.
+
+        This includes the group of every command that was added or removed, and the
+        parent of every group that was added or removed. ``None`` is included if a
+        root-level group was added or removed.
+        """
+        groups = {cmd.group for cmd in self._added}
+        groups.update(cmd.group for cmd in self._removed)
+        groups.update(group.parent for group in self._added_groups)
+        groups.update(group.parent for group in self._removed_groups)
+        return groups
+
+    def __bool__(self) -> bool:
+        return bool(
+            self._added or self._removed or self._added_groups or self._removed_groups
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<CommandSetChange added={self.added!r} removed={self.removed!r} "
+            f"added_groups={self.added_groups!r} "
+            f"removed_groups={self.removed_groups!r}>"
+        )
+
+    @staticmethod
+    def _record(item, added: dict, removed: dict) -> None:
+        # An item that is added after being removed in the same change (or vice
+        # versa) hasn't changed.
+        if item in removed:
+            del removed[item]
+        else:
+            added[item] = None
+
+    def _add(self, command: Command) -> None:
+        self._record(command, self._added, self._removed)
+
+    def _remove(self, command: Command) -> None:
+        self._record(command, self._removed, self._added)
+
+    def _add_group(self, group: Group) -> None:
+        self._record(group, self._added_groups, self._removed_groups)
+
+    def _remove_group(self, group: Group) -> None:
+        self._record(group, self._removed_groups, self._added_groups)
+
+
 class CommandSetChangeHandler(Protocol):
-    def __call__(self, **kwargs) -> object:
+    def __call__(self, change: CommandSetChange, **kwargs) -> object:
         """A handler that will be invoked when a Command or Group is added to the
         CommandSet.
 
+        :param change: The commands and groups that have been added and removed.
         :param kwargs: Ensures compatibility with arguments added in future versions.
         """
 
@@ -358,6 +442,113 @@ class CommandSet(MutableSet[Command], MutableMapping[str, Command]):
         self._commands: dict[str:Command] = {}
         self.on_change = on_change
 
+        # The number of commands in each group, including the commands in subgroups.
+        self._group_sizes: dict[Group, int] = {}
+        # The commands directly in each group, and the subgroups of each group (or of
+        # the menu bar, ``None``) that contain commands.
+        self._group_commands: dict[Group, dict[Command, None]] = {}
+        self._subgroups: dict[Group | None, dict[Group, None]] = {}
+        # The changes that haven't been notified yet, and the depth of nested
+        # batches.
+        self._change = CommandSetChange()
+        self._batch_depth = 0
+
+    def _added(self, command: Command) -> None:
+        self._change._add(command)
+        group = command.group
+        self._group_commands.setdefault(group, {})[command] = None
+        while group is not None:
+            size = self._group_sizes.get(group, 0)
+            self._group_sizes[group] = size + 1
+            if size == 0:
+                self._change._add_group(group)
+                self._subgroups.setdefault(group.parent, {})[group] = None
+            group = group.parent
+
+    def _removed(self, command: Command) -> None:
+        self._change._remove(command)
+        group = command.group
+        self._discard_member(self._group_commands, group, command)
+        while group is not None:
+            size = self._group_sizes.pop(group, 0) - 1
+            if size > 0:
+                self._group_sizes[group] = size
+            elif size == 0:
+                self._change._remove_group(group)
+                self._discard_member(self._subgroups, group.parent, group)
+            group = group.parent
+
+    @staticmethod
+    def _discard_member(index: dict, key, member) -> None:
+        # Remove a member from one of the per-group indexes, dropping the entry for
+        # the group when it becomes empty.
+        members = index.get(key)
+        if members is not None:
+            members.pop(member, None)
+            if not members:
+                del index[key]
+
+    def _changed(self) -> None:
+        # Notify the change handler of the changes that have been made, unless the
+        # changes are part of a batch.
+        if not self._batch_depth:
+            change, self._change = self._change, CommandSetChange()
+            if self.on_change:
+                self.on_change(change=change)
+
+    @contextmanager
+    def batch(self) -> Iterator[CommandSet]:
+        """Make a series of changes to the command set, with a single notification.
+
+        Inside a ``with commands.batch():`` block, adding and removing commands
+        doesn't invoke the ``on_change`` handler. When the outermost block exits, the
+        handler is invoked once, describing all the changes made in the block (if
+        there were any). This means a menu is only updated once when many commands
+        are added::
+
+            with app.commands.batch():
+                for plugin in plugins:
+                    app.commands.add(plugin.command)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._change:
+                self._changed()
+
+    def group_items(self, group: Group | None) -> list[Command | Group | Separator]:
+        """The content of the menu for a single group.
+
+        Only the commands and subgroups directly in the group are sorted, so this is
+        cheaper than iterating over the whole CommandSet when only a few menus need to
+        be rebuilt.
+
+        :param group: The group, or ``None`` for the top-level menu bar.
+        :returns: The commands in the group, and the subgroups that contain commands,
+            in their sort order, with :class:`~toga.command.Separator` instances
+            inserted between sections. The menu bar only contains root groups, so it
+            has no separators.
+        """
+        items = list(self._subgroups.get(group, ()))
+        if group is not None:
+            items.extend(self._group_commands.get(group, ()))
+        # A command sorts before a subgroup with the same key, as it does when
+        # iterating over the CommandSet.
+        items.sort(key=lambda item: (item.key, isinstance(item, Group)))
+        if group is None:
+            return items
+
+        result = []
+        section = None
+        for item in items:
+            if section is not None and section != item.section:
+                result.append(Separator(group))
+            section = item.section
+            result.append(item)
+        return result
+
     def add(self, *commands: Command):
         """Add a collection of commands to the command set.
 
@@ -365,15 +556,21 @@ class CommandSet(MutableSet[Command], MutableMapping[str, Command]):
         """
         if self.app:
             self.app.commands.add(*commands)
-        self._commands.update({cmd.id: cmd for cmd in commands})
-        if self.on_change:
-            self.on_change()
+        for cmd in commands:
+            existing = self._commands.get(cmd.id)
+            if existing is not cmd:
+                if existing is not None:
+                    self._removed(existing)
+                self._commands[cmd.id] = cmd
+                self._added(cmd)
+        self._changed()
 
     def clear(self) -> None:
         """Remove all commands from the command set."""
+        for cmd in self._commands.values():
+            self._removed(cmd)
         self._commands = {}
-        if self.on_change:
-            self.on_change()
+        self._changed()
 
     @property
     def app(self) -> App | None:
@@ -399,15 +596,13 @@ class CommandSet(MutableSet[Command], MutableMapping[str, Command]):
         self.add(command)
 
     def __delitem__(self, id: str) -> Command:
-        del self._commands[id]
-        if self.on_change:
-            self.on_change()
+        self._removed(self._commands.pop(id))
+        self._changed()
 
     def discard(self, command: Command):
         try:
-            self._commands.pop(command.id)
-            if self.on_change:
-                self.on_change()
+            self._removed(self._commands.pop(command.id))
+            self._changed()
         except KeyError:
             pass
 
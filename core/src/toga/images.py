@@ -1,23 +1,20 @@
 from __future__ import annotations
 
+import hashlib
 import importlib
 import os
 import sys
+import threading
 import warnings
+from collections import OrderedDict
+from collections.abc import Hashable
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, TypeVar
 from warnings import warn
 
 import toga
-from toga.platform import get_platform_factory
-
-if sys.version_info >= (3, 10):  # pragma: no-cover-if-lt-py310
-    from importlib.metadata import entry_points
-else:  # pragma: no-cover-if-gte-py310
-    # Before Python 3.10, entry_points did not support the group argument;
-    # so, the backport package must be used on older versions.
-    from importlib_metadata import entry_points
+from toga.platform import get_entry_points, get_platform_factory
 
 # Make sure deprecation warnings are shown by default
 warnings.filterwarnings("default", category=DeprecationWarning)
@@ -78,10 +75,139 @@ class ImageConverter(Protocol):
         """
 
 
+class ImagePixels(NamedTuple):
+    """The uncompressed pixels of an image.
+
+    The pixels are stored in rows, from the top of the image to the bottom; each row
+    starts ``stride`` bytes after the previous row. Each pixel is stored as one byte
+    per channel, in the order given by the format; alpha values are not premultiplied.
+    """
+
+    #: The pixel data.
+    data: memoryview
+    #: The width of the image, in pixels.
+    width: int
+    #: The height of the image, in pixels.
+    height: int
+    #: The number of bytes from the start of one row to the start of the next.
+    stride: int
+    #: The channels of each pixel: either ``"RGBA"`` or ``"RGB"``.
+    format: str
+
+
+# The pixel formats that are supported, and the number of bytes in each pixel.
+PIXEL_FORMATS = {"RGBA": 4, "RGB": 3}
+
+
+def _checked_pixels(pixels: ImagePixels) -> ImagePixels:
+    """Check that image pixels are consistent with their description.
+
+    :returns: The pixels, with the data as a memoryview of bytes.
+    :raises ValueError: If the pixels aren't consistent.
+    """
+    data, width, height, stride, format = pixels
+    try:
+        pixel_size = PIXEL_FORMATS[format]
+    except KeyError:
+        raise ValueError(f"Unsupported pixel format {format!r}") from None
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Invalid image size {width}x{height}")
+    if stride < width * pixel_size:
+        raise ValueError(f"A stride of {stride} is too small for {width} pixels")
+
+    data = memoryview(data)
+    if not data.c_contiguous:
+        # Only contiguous buffers can be viewed as bytes; others (e.g., a slice of a
+        # NumPy array) are copied, in C order.
+        data = memoryview(data.tobytes())
+    data = data.cast("B")
+    size = stride * (height - 1) + width * pixel_size
+    if len(data) < size:
+        raise ValueError(f"Pixel data has {len(data)} bytes; expected {size}")
+    return ImagePixels(data, width, height, stride, format)
+
+
+def _pil_converter() -> type[ImageConverter]:
+    """The converter used to access pixels on backends that can't provide them."""
+    # Pillow is only imported if it's needed.
+    from toga.plugins.image_formats import PILConverter
+
+    if PILConverter.image_class is None:  # pragma: no cover
+        raise RuntimeError(
+            "Pillow must be installed to access the pixels of images on this platform"
+        )
+    return PILConverter
+
+
+class ImageCacheInfo(NamedTuple):
+    """Statistics about the use of the cache of decoded images."""
+
+    #: The number of images that were loaded from the cache.
+    hits: int
+    #: The number of images that had to be decoded.
+    misses: int
+    #: The maximum number of images in the cache.
+    maxsize: int
+    #: The number of images currently in the cache.
+    currsize: int
+
+
+class _ImageCache:
+    """A process-wide cache of decoded images, evicting the least recently used image
+    once it is full.
+
+    The cache holds the backend image that decoded each native image, rather than the
+    native image itself. The backend image owns a reference to its native image, so
+    the native image stays valid for as long as it is cached, and is released by the
+    backend when it is evicted.
+
+    The cache can be used from any thread.
+    """
+
+    def __init__(self):
+        self._images: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the backend image cached under a key, or ``None``."""
+        with self._lock:
+            try:
+                image = self._images[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._images.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key: Hashable, image: Any, maxsize: int) -> None:
+        with self._lock:
+            self._images[key] = image
+            while len(self._images) > maxsize:
+                self._images.popitem(last=False)
+
+    def info(self, maxsize: int) -> ImageCacheInfo:
+        with self._lock:
+            return ImageCacheInfo(self.hits, self.misses, maxsize, len(self._images))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+            self.hits = self.misses = 0
+
+
+_cache = _ImageCache()
+
 NOT_PROVIDED = object()
 
 
 class Image:
+    #: The maximum number of decoded images that are kept in the cache shared by all
+    #: images. Set to 0 to disable the cache.
+    CACHE_SIZE = 128
+
     def __init__(
         self,
         src: ImageContentT = NOT_PROVIDED,
@@ -131,16 +257,25 @@ class Image:
 
         # Any "lump of bytes" should be valid here.
         if isinstance(src, (bytes, bytearray, memoryview)):
-            self._impl = self.factory.Image(interface=self, data=src)
+            self._load_data(src)
+
+        elif isinstance(src, ImagePixels):
+            self._load_pixels(_checked_pixels(src))
 
         elif isinstance(src, (str, Path)):
             self._path = toga.App.app.paths.app / src
             if not self._path.is_file():
                 raise FileNotFoundError(f"Image file {self._path} does not exist")
-            self._impl = self.factory.Image(interface=self, path=self._path)
+            # A file that has been modified since it was cached is loaded again.
+            stat = self._path.stat()
+            self._load(
+                ("path", self._path, stat.st_mtime_ns, stat.st_size), path=self._path
+            )
 
         elif isinstance(src, Image):
-            self._impl = self.factory.Image(interface=self, data=src.data)
+            # Images can't be modified, so the native image can be shared, rather than
+            # copied.
+            self._impl = self.factory.Image(interface=self, raw=src._impl.native)
 
         elif isinstance(src, self.factory.Image.RAW_TYPE):
             self._impl = self.factory.Image(interface=self, raw=src)
@@ -148,19 +283,127 @@ class Image:
         else:
             for converter in self._converters():
                 if isinstance(src, converter.image_class):
-                    data = converter.convert_from_format(src)
-                    self._impl = self.factory.Image(interface=self, data=data)
+                    to_pixels = getattr(converter, "convert_to_pixels", None)
+                    if to_pixels is not None and self._supports_pixels:
+                        self._load_pixels(_checked_pixels(to_pixels(src)))
+                    else:
+                        self._load_data(converter.convert_from_format(src))
                     return
 
             raise TypeError("Unsupported source type for Image")
 
+    def _load(self, key: Hashable, **kwargs: Any) -> None:
+        """Create the backend image, using the native image cached under a key if there
+        is one.
+
+        :param key: The key identifying the content of the image.
+        :param kwargs: The arguments used to create the backend image if the image
+            isn't cached.
+        """
+        if self.CACHE_SIZE <= 0:
+            self._impl = self.factory.Image(interface=self, **kwargs)
+            return
+
+        cached = _cache.get(key)
+        if cached is None:
+            self._impl = self.factory.Image(interface=self, **kwargs)
+            _cache.put(key, self._impl, self.CACHE_SIZE)
+        else:
+            self._impl = self.factory.Image(interface=self, raw=cached.native)
+
+    def _load_data(self, data: BytesLikeT) -> None:
+        # Images that are loaded from data are identified by a hash of their content.
+        key = ("data", hashlib.blake2b(data, digest_size=16).digest())
+        self._load(key, data=data)
+
+    @property
+    def _supports_pixels(self) -> bool:
+        # Can the backend create images from pixels, and provide the pixels of images?
+        return getattr(self.factory.Image, "SUPPORTS_PIXELS", False)
+
+    def _load_pixels(self, pixels: ImagePixels) -> None:
+        if self._supports_pixels:
+            self._impl = self.factory.Image(interface=self, pixels=pixels)
+        else:
+            # Convert the pixels to image data that the backend can load.
+            converter = _pil_converter()
+            pil_image = converter.convert_from_pixels(pixels, converter.image_class)
+            data = converter.convert_from_format(pil_image)
+            self._impl = self.factory.Image(interface=self, data=data)
+
+    @classmethod
+    def from_buffer(
+        cls,
+        data: BytesLikeT,
+        width: int,
+        height: int,
+        format: str = "RGBA",
+        stride: int | None = None,
+    ) -> Image:
+        """Create an image from uncompressed pixel data.
+
+        This is equivalent to creating an image from an :class:`ImagePixels`.
+
+        :param data: The pixel data, as any object that supports the buffer protocol
+            (for example, a :any:`bytes` object, or a NumPy array).
+        :param width: The width of the image, in pixels.
+        :param height: The height of the image, in pixels.
+        :param format: The channels of each pixel: either ``"RGBA"`` or ``"RGB"``.
+        :param stride: The number of bytes from the start of one row of pixels to the
+            start of the next. Defaults to the size of a row of pixels.
+        :raises ValueError: If the format isn't supported, or there isn't enough data
+            for an image of the given size.
+        """
+        if stride is None:
+            stride = width * PIXEL_FORMATS.get(format, 0)
+        return cls(ImagePixels(data, width, height, stride, format))
+
+    def pixels(self) -> ImagePixels:
+        """Return the uncompressed pixels of the image.
+
+        This provides access to the pixels of the image without encoding them into an
+        image file format, and decoding them again. An image created from the pixels
+        (or from a modified copy of them) is loaded without being decoded either.
+
+        On platforms that can't provide the pixels of their native images directly,
+        Pillow is used to decode the :attr:`data` of the image.
+
+        :returns: The pixels of the image. The data is read-only.
+        """
+        if self._supports_pixels:
+            data, width, height, stride, format = self._impl.get_pixels()
+            data = memoryview(data).toreadonly()
+            return ImagePixels(data, width, height, stride, format)
+
+        converter = _pil_converter()
+        pil_image = converter.convert_to_format(self.data, converter.image_class)
+        data, width, height, stride, format = converter.convert_to_pixels(pil_image)
+        return ImagePixels(memoryview(data).toreadonly(), width, height, stride, format)
+
+    @classmethod
+    def cache_info(cls) -> ImageCacheInfo:
+        """Report statistics about the cache of decoded images.
+
+        Images loaded from a file or from data are decoded into the platform's native
+        image format. The native image is cached, and shared by any other image loaded
+        from the same unmodified file, or from identical data. The
+        :attr:`CACHE_SIZE` most recently used native images are kept.
+        """
+        return _cache.info(cls.CACHE_SIZE)
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Remove all images from the cache of decoded images, and reset its
+        statistics."""
+        _cache.clear()
+
     @classmethod
     @lru_cache(maxsize=None)
     def _converters(cls) -> list[ImageConverter]:
         """Return list of registered image plugin converters. Only loaded once."""
         converters = []
 
-        for image_plugin in entry_points(group="toga.image_formats"):
+        for image_plugin in get_entry_points("toga.image_formats"):
             module_name, class_name = image_plugin.value.rsplit(".", 1)
             module = importlib.import_module(module_name)
             converter = getattr(module, class_name)
@@ -217,10 +460,13 @@ class Image:
         """
         if isinstance(format, type):
             if issubclass(format, Image):
-                return format(self.data)
+                return format(self)
 
             for converter in self._converters():
                 if issubclass(format, converter.image_class):
+                    from_pixels = getattr(converter, "convert_from_pixels", None)
+                    if from_pixels is not None and self._supports_pixels:
+                        return from_pixels(self.pixels(), format)
                     return converter.convert_to_format(self.data, format)
 
         raise TypeError(f"Unknown conversion format for Image: {format}")
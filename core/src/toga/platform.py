@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import hashlib
 import importlib
+import json
 import os
 import sys
+import tempfile
 from functools import lru_cache
+from pathlib import Path
 from types import ModuleType
 
 if sys.version_info >= (3, 10):  # pragma: no-cover-if-lt-py310
-    from importlib.metadata import entry_points
+    from importlib.metadata import EntryPoint, entry_points
 else:  # pragma: no-cover-if-gte-py310
     # Before Python 3.10, entry_points did not support the group argument;
     # so, the backport package must be used on older versions.
-    from importlib_metadata import entry_points
+    from importlib_metadata import EntryPoint, entry_points
 
 
 # Map python sys.platform with toga platforms names
@@ -43,12 +47,139 @@ def get_current_platform() -> str | None:
 current_platform = get_current_platform()
 
 
+# The version of the format of the entry point cache file.
+_ENTRY_POINT_CACHE_VERSION = 1
+
+
+def _entry_point_cache_dir() -> Path | None:
+    """The directory where the entry point cache is stored, or ``None`` if entry
+    points shouldn't be cached between processes.
+
+    The location can be set with the ``TOGA_ENTRY_POINT_CACHE`` environment variable;
+    setting it to an empty string disables the cache.
+    """
+    if (cache_dir := os.environ.get("TOGA_ENTRY_POINT_CACHE")) is not None:
+        return Path(cache_dir) if cache_dir else None
+
+    home = Path.home()
+    if current_platform == "macOS":
+        return home / "Library/Caches/org.beeware.toga"
+    elif current_platform == "windows":
+        return Path(os.environ.get("LOCALAPPDATA", home / "AppData/Local")) / "toga"
+    elif current_platform in {"linux", "freeBSD"}:
+        return Path(os.environ.get("XDG_CACHE_HOME", home / ".cache")) / "toga"
+    else:
+        # Packages are fixed when mobile and web apps are built; there's nothing to
+        # gain from a cache.
+        return None
+
+
+def _installed_distributions() -> str:
+    """A digest of the distributions installed on ``sys.path``.
+
+    The digest changes whenever a distribution is installed, removed or upgraded,
+    without reading the metadata of any distribution.
+    """
+    digest = hashlib.blake2b(str(_ENTRY_POINT_CACHE_VERSION).encode())
+    for path in sys.path:
+        try:
+            if os.path.isdir(path or "."):
+                with os.scandir(path or ".") as entries:
+                    for entry in entries:
+                        if entry.name.endswith((".dist-info", ".egg-info")):
+                            mtime = entry.stat().st_mtime_ns
+                            digest.update(f"{path}\0{entry.name}\0{mtime}\0".encode())
+            else:
+                # A zip file; its content changes with its modification time.
+                digest.update(f"{path}\0{os.stat(path).st_mtime_ns}\0".encode())
+        except OSError:
+            # The path doesn't exist, or can't be read.
+            pass
+    return digest.hexdigest()
+
+
+def _read_entry_point_cache(cache_file: Path, key: str) -> dict | None:
+    try:
+        with cache_file.open(encoding="utf-8") as f:
+            content = json.load(f)
+        if content["key"] == key:
+            return content["entry_points"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_entry_point_cache(cache_file: Path, key: str, groups: dict) -> None:
+    # The cache is only an optimization; if it can't be written, entry points will be
+    # scanned again by the next process.
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file, so that other processes never see a partially
+        # written cache.
+        fd, temp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "entry_points": groups}, f)
+            os.replace(temp_name, cache_file)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=1)
+def _toga_entry_points() -> dict[str, list[tuple[str, str]]]:
+    """Read the entry points in every ``toga.*`` group, as a dictionary mapping each
+    group to a list of (name, value) pairs.
+
+    Reading the entry points requires the metadata of every installed distribution
+    to be read; so all groups are read at the same time, and the result is cached on
+    disk until the distributions on ``sys.path`` change.
+    """
+    if cache_dir := _entry_point_cache_dir():
+        key = _installed_distributions()
+        path_digest = hashlib.blake2b("\0".join(sys.path).encode(), digest_size=8)
+        cache_file = cache_dir / f"entry-points-{path_digest.hexdigest()}.json"
+        if (groups := _read_entry_point_cache(cache_file, key)) is not None:
+            return groups
+
+    groups = {}
+    installed = entry_points()
+    for name in sorted(installed.groups):
+        if name.startswith("toga."):
+            group = groups[name] = []
+            for entry_point in installed.select(group=name):
+                # As of Setuptools 65.5, entry points are returned duplicated if the
+                # package is installed editable. Ensure that each entry point is only
+                # returned once.
+                # See https://github.com/pypa/setuptools/issues/3649
+                if (pair := [entry_point.name, entry_point.value]) not in group:
+                    group.append(pair)
+
+    if cache_dir:
+        _write_entry_point_cache(cache_file, key, groups)
+    return groups
+
+
+def get_entry_points(group: str) -> list[EntryPoint]:
+    """Return the entry points registered in one of Toga's entry point groups.
+
+    The entry points of every ``toga.*`` group are read from the installed
+    distributions once per process, and are cached between processes until a
+    distribution is installed, upgraded or removed.
+
+    :param group: The name of the entry point group (e.g., ``"toga.backends"``).
+    :returns: The entry points in the group, in the order they were discovered.
+    """
+    return [
+        EntryPoint(name=name, value=value, group=group)
+        for name, value in _toga_entry_points().get(group, [])
+    ]
+
+
 def find_backends():
-    # As of Setuptools 65.5, entry points are returned duplicated if the
-    # package is installed editable. Use a set to ensure that each entry point
-    # is only returned once.
-    # See https://github.com/pypa/setuptools/issues/3649
-    return sorted(set(entry_points(group="toga.backends")))
+    return sorted(get_entry_points("toga.backends"))
 
 
 @lru_cache(maxsize=1)
@@ -3,6 +3,8 @@ from __future__ import annotations
 from io import BytesIO
 from typing import TYPE_CHECKING
 
+from toga.images import PIXEL_FORMATS, ImagePixels
+
 if TYPE_CHECKING:
     from toga.images import BytesLikeT
 
@@ -38,3 +40,30 @@ class PILConverter:
         with PIL.Image.open(buffer) as pil_image:
             pil_image.load()
         return pil_image
+
+    @staticmethod
+    def convert_to_pixels(image_in_format: PIL.Image.Image) -> ImagePixels:
+        if image_in_format.mode not in PIXEL_FORMATS:
+            image_in_format = image_in_format.convert("RGBA")
+        mode = image_in_format.mode
+        return ImagePixels(
+            image_in_format.tobytes(),
+            image_in_format.width,
+            image_in_format.height,
+            image_in_format.width * PIXEL_FORMATS[mode],
+            mode,
+        )
+
+    @staticmethod
+    def convert_from_pixels(
+        pixels: ImagePixels,
+        image_class: type[PIL.Image.Image],
+    ) -> PIL.Image.Image:
+        return PIL.Image.frombytes(
+            pixels.format,
+            (pixels.width, pixels.height),
+            pixels.data,
+            "raw",
+            pixels.format,
+            pixels.stride,
+        )
@@ -1,16 +1,24 @@
 from .accessors import to_accessor  # noqa: F401
 from .base import Listener, Source  # noqa: F401
+from .columnar_source import ColumnarListSource, ColumnarRow  # noqa: F401
 from .list_source import ListSource, Row  # noqa: F401
 from .tree_source import Node, TreeSource  # noqa: F401
 from .value_source import ValueSource  # noqa: F401
+from .views import FilteredView, SortedView  # noqa: F401
+from .virtual_source import VirtualListSource  # noqa: F401
 
 __all__ = [
+    "ColumnarListSource",
+    "ColumnarRow",
+    "FilteredView",
     "ListSource",
     "Listener",
     "Node",
     "Row",
+    "SortedView",
     "Source",
     "TreeSource",
     "ValueSource",
+    "VirtualListSource",
     "to_accessor",
 ]
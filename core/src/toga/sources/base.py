@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Protocol
 
 
@@ -31,10 +32,60 @@ class Listener(Protocol):
     def clear(self) -> object:
         """All items have been removed from the data source."""
 
+    # The range notifications are optional. If a listener doesn't implement them, the
+    # source will deliver the equivalent sequence of ``insert``/``remove``
+    # notifications instead.
+
+    def insert_range(self, index: int, items: list[object]) -> object:
+        """A contiguous range of items has been added to the data source.
+
+        This notification is optional; if it is not implemented, the listener will
+        receive an ``insert`` notification for each item in the range.
+
+        :param index: The 0-index position of the first added item.
+        :param items: The data objects that were added, in order.
+        """
+
+    def remove_range(self, index: int, items: list[object]) -> object:
+        """A contiguous range of items has been removed from the data source.
+
+        This notification is optional; if it is not implemented, the listener will
+        receive a ``remove`` notification for each item in the range.
+
+        :param index: The 0-index position of the first removed item.
+        :param items: The data objects that were removed, in order.
+        """
+
+
+def _insert_range_fallback(listener: Listener, index: int, items: list) -> None:
+    method = getattr(listener, "insert", None)
+    if method:
+        for offset, item in enumerate(items):
+            method(index=index + offset, item=item)
+
+
+def _remove_range_fallback(listener: Listener, index: int, items: list) -> None:
+    method = getattr(listener, "remove", None)
+    if method:
+        # Each removal shifts the rest of the range down into ``index``.
+        for item in items:
+            method(index=index, item=item)
+
+
+_RANGE_FALLBACKS = {
+    "insert_range": _insert_range_fallback,
+    "remove_range": _remove_range_fallback,
+}
+
 
 class Source:
     """A base class for data sources, providing an implementation of data notifications."""
 
+    # Change notifications that are waiting to be delivered, keyed by the id of the
+    # changed item; or None if change notifications are delivered immediately.
+    _deferred_changes: dict[int, object] | None = None
+    _flush_scheduled = False
+
     def __init__(self) -> None:
         self._listeners: list[Listener] = []
 
@@ -64,12 +115,71 @@ class Source:
         """
         self._listeners.remove(listener)
 
+    @property
+    def defer_changes(self) -> bool:
+        """Should ``change`` notifications be deferred to the next iteration of the
+        event loop?
+
+        When enabled, a ``change`` notification isn't delivered immediately; all the
+        changes made during an iteration of the event loop are collected, and
+        delivered as a single ``change`` notification for each changed item. If no
+        event loop is running, change notifications are delivered immediately.
+
+        Notifications for items that are no longer part of the source when the
+        changes are delivered are discarded.
+        """
+        return self._deferred_changes is not None
+
+    @defer_changes.setter
+    def defer_changes(self, value: bool) -> None:
+        if value:
+            if self._deferred_changes is None:
+                self._deferred_changes = {}
+        else:
+            self.flush_changes()
+            self._deferred_changes = None
+
+    def flush_changes(self) -> None:
+        """Immediately deliver any deferred ``change`` notifications."""
+        self._flush_scheduled = False
+        if self._deferred_changes:
+            pending = list(self._deferred_changes.values())
+            self._deferred_changes.clear()
+            for item in pending:
+                if self._is_current(item):
+                    self._notify_listeners("change", item=item)
+
+    def _is_current(self, item: object) -> bool:
+        """Is ``item`` still part of this source?
+
+        Used to discard deferred change notifications for items that have been
+        removed. Sources that can determine membership should override this method.
+        """
+        return True
+
     def notify(self, notification: str, **kwargs: object) -> None:
         """Notify all listeners an event has occurred.
 
         :param notification: The notification to emit.
         :param kwargs: The data associated with the notification.
         """
+        if notification == "change" and self._deferred_changes is not None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Without an event loop, there's no "next iteration" to defer to.
+                pass
+            else:
+                item = kwargs["item"]
+                self._deferred_changes[id(item)] = item
+                if not self._flush_scheduled:
+                    self._flush_scheduled = True
+                    loop.call_soon(self.flush_changes)
+                return
+
+        self._notify_listeners(notification, **kwargs)
+
+    def _notify_listeners(self, notification: str, **kwargs: object) -> None:
         for listener in self._listeners:
             try:
                 method = getattr(listener, notification)
@@ -78,3 +188,5 @@ class Source:
 
             if method:
                 method(**kwargs)
+            elif notification in _RANGE_FALLBACKS:
+                _RANGE_FALLBACKS[notification](listener, **kwargs)
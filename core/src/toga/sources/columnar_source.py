@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import weakref
+from collections.abc import Iterable, Iterator
+
+from .list_source import ListSource
+
+# Marker for a column that has no value for a given row.
+_MISSING = object()
+
+
+class ColumnarRow:
+    # A row has no instance dictionary. Public attributes are stored in the columns
+    # of the store that holds the row; ``_values`` only holds the attributes of a row
+    # that isn't part of a store. ``_impl`` is available for use by backends.
+    __slots__ = ("_source", "_store", "_index", "_values", "_impl", "__weakref__")
+
+    def __init__(self, **data: object):
+        """Create a new ColumnarRow object.
+
+        A ColumnarRow behaves like a :class:`~toga.sources.Row`; the keyword arguments
+        specified in the constructor will be converted into attributes on the new
+        object, and modifying any public attribute will notify the source to which
+        the row belongs.
+
+        However, while the row is part of a
+        :class:`~toga.sources.ColumnarListSource`, its attribute values are stored
+        by the source, rather than by the row.
+        """
+        object.__setattr__(self, "_source", None)
+        object.__setattr__(self, "_store", None)
+        object.__setattr__(self, "_index", None)
+        object.__setattr__(self, "_values", data)
+
+    def _public_values(self) -> dict[str, object]:
+        if self._store is None:
+            return self._values
+        return self._store._row_values(self._index)
+
+    def __repr__(self) -> str:
+        values = self._public_values()
+        descriptor = " ".join(f"{attr}={values[attr]!r}" for attr in sorted(values))
+        return f"<Row {id(self):x} {descriptor if descriptor else '(no attributes)'}>"
+
+    def __getattr__(self, attr: str) -> object:
+        if not attr.startswith("_"):
+            if self._store is None:
+                try:
+                    return self._values[attr]
+                except KeyError:
+                    pass
+            else:
+                value = self._store._get(self._index, attr)
+                if value is not _MISSING:
+                    return value
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {attr!r}"
+        )
+
+    def __setattr__(self, attr: str, value: object) -> None:
+        """Set an attribute on the row, notifying the source of the change.
+
+        :param attr: The attribute to change.
+        :param value: The new attribute value.
+        """
+        if attr.startswith("_"):
+            object.__setattr__(self, attr, value)
+        else:
+            if self._store is None:
+                self._values[attr] = value
+            else:
+                self._store._set(self._index, attr, value)
+
+            if self._source is not None:
+                self._source.notify("change", item=self)
+
+    def update(self, **values: object) -> None:
+        """Set multiple attributes on the row, notifying the source of the change
+        once.
+
+        :param values: The attributes to change, and their new values.
+        """
+        changed = False
+        for attr, value in values.items():
+            if attr.startswith("_"):
+                object.__setattr__(self, attr, value)
+            else:
+                changed = True
+                if self._store is None:
+                    self._values[attr] = value
+                else:
+                    self._store._set(self._index, attr, value)
+
+        if changed and self._source is not None:
+            self._source.notify("change", item=self)
+
+    def __delattr__(self, attr: str) -> None:
+        """Remove an attribute from the row, notifying the source of the change.
+
+        :param attr: The attribute to remove.
+        """
+        if attr.startswith("_"):
+            object.__delattr__(self, attr)
+        else:
+            if self._store is None:
+                try:
+                    del self._values[attr]
+                except KeyError:
+                    raise AttributeError(attr)
+            else:
+                if self._store._get(self._index, attr) is _MISSING:
+                    raise AttributeError(attr)
+                self._store._set(self._index, attr, _MISSING)
+
+            if self._source is not None:
+                self._source.notify("change", item=self)
+
+
+class _ColumnStore:
+    """A list-like container of rows that stores the values of each attribute in a
+    separate column.
+
+    Row objects are only constructed when they are requested. A row is only
+    retained by the store for as long as something else holds a reference to it;
+    while a row is alive, its identity is stable, and it tracks its own position in
+    the store.
+    """
+
+    def __init__(self, source: ColumnarListSource):
+        self._source = source
+        self._length = 0
+        self._columns: dict[str, list] = {}
+        self._rows: weakref.WeakValueDictionary[int, ColumnarRow] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[ColumnarRow]:
+        for index in range(self._length):
+            yield self[index]
+
+    ######################################################################
+    # Value access
+    ######################################################################
+
+    def _get(self, index: int, attr: str) -> object:
+        try:
+            return self._columns[attr][index]
+        except KeyError:
+            return _MISSING
+
+    def _set(self, index: int, attr: str, value: object) -> None:
+        try:
+            column = self._columns[attr]
+        except KeyError:
+            column = self._columns[attr] = [_MISSING] * self._length
+        column[index] = value
+
+    def _row_values(self, index: int) -> dict[str, object]:
+        return {
+            attr: column[index]
+            for attr, column in self._columns.items()
+            if column[index] is not _MISSING
+        }
+
+    ######################################################################
+    # Row bookkeeping
+    ######################################################################
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("list index out of range")
+        return index
+
+    def _attach(self, row: ColumnarRow, index: int) -> None:
+        row._source = self._source
+        row._store = self
+        row._index = index
+        row._values = None
+        self._rows[index] = row
+
+    def _detach(self, row: ColumnarRow) -> None:
+        # Take a copy of the row's values, so that the row remains usable once it is
+        # no longer part of the store. A detached row doesn't notify the source.
+        values = self._row_values(row._index)
+        row._source = None
+        row._store = None
+        row._index = None
+        row._values = values
+
+    def _shift(self, start: int, delta: int) -> None:
+        """Adjust the position of all live rows at or after ``start``."""
+        moved = [(index, row) for index, row in self._rows.items() if index >= start]
+        for index, _ in moved:
+            del self._rows[index]
+        for index, row in moved:
+            row._index = index + delta
+            self._rows[index + delta] = row
+
+    ######################################################################
+    # List interface
+    ######################################################################
+
+    def __getitem__(self, index: int | slice) -> ColumnarRow | list[ColumnarRow]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+
+        index = self._normalize(index)
+        row = self._rows.get(index)
+        if row is None:
+            row = ColumnarRow()
+            self._attach(row, index)
+        return row
+
+    def append_values(self, values: dict[str, object]) -> None:
+        """Append a row's values, without constructing a row object."""
+        for attr, column in self._columns.items():
+            column.append(values.pop(attr, _MISSING))
+        for attr, value in values.items():
+            column = self._columns[attr] = [_MISSING] * self._length
+            column.append(value)
+        self._length += 1
+
+    def insert(self, index: int, row: ColumnarRow) -> None:
+        if index < 0:
+            index = max(self._length + index, 0)
+        else:
+            index = min(self._length, index)
+
+        values = dict(row._public_values())
+        if index == self._length:
+            self.append_values(values)
+        else:
+            self._shift(index, 1)
+            for attr, column in self._columns.items():
+                column.insert(index, values.pop(attr, _MISSING))
+            for attr, value in values.items():
+                column = self._columns[attr] = [_MISSING] * self._length
+                column.insert(index, value)
+            self._length += 1
+
+        self._attach(row, index)
+
+    def extend(self, rows: Iterable[ColumnarRow]) -> None:
+        for row in rows:
+            self.insert(self._length, row)
+
+    def _delete_range(self, start: int, stop: int) -> None:
+        if start >= stop:
+            return
+
+        for index in range(start, stop):
+            row = self._rows.pop(index, None)
+            if row is not None:
+                self._detach(row)
+
+        for column in self._columns.values():
+            del column[start:stop]
+        self._length -= stop - start
+        self._shift(stop, start - stop)
+
+    def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step == 1:
+                self._delete_range(start, stop)
+            else:
+                for i in sorted(range(start, stop, step), reverse=True):
+                    self._delete_range(i, i + 1)
+        else:
+            index = self._normalize(index)
+            self._delete_range(index, index + 1)
+
+    def __setitem__(self, index: int | slice, value: object) -> None:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            rows = list(value)
+            if step == 1:
+                self._delete_range(start, max(start, stop))
+                for offset, row in enumerate(rows):
+                    self.insert(start + offset, row)
+            else:
+                indices = range(start, stop, step)
+                if len(rows) != len(indices):
+                    raise ValueError(
+                        f"attempt to assign sequence of size {len(rows)} "
+                        f"to extended slice of size {len(indices)}"
+                    )
+                for i, row in zip(indices, rows):
+                    self[i] = row
+        else:
+            index = self._normalize(index)
+            self._delete_range(index, index + 1)
+            self.insert(index, value)
+
+    def index(self, row: ColumnarRow) -> int:
+        if getattr(row, "_store", None) is self:
+            return row._index
+        raise ValueError(f"{row!r} is not in list")
+
+    def clear(self) -> None:
+        for row in list(self._rows.values()):
+            self._detach(row)
+        self._rows.clear()
+        self._columns = {}
+        self._length = 0
+
+
+class ColumnarListSource(ListSource):
+    _data: _ColumnStore
+
+    def __init__(self, accessors: Iterable[str], data: Iterable | None = None):
+        """A data source to store an ordered list of multiple data values, using a
+        compact column-based representation.
+
+        A ColumnarListSource has the same interface as a :any:`ListSource`. However,
+        rather than creating a :class:`~toga.sources.Row` object for every item, the
+        values of each attribute are stored in a separate list, and
+        :class:`~toga.sources.ColumnarRow` objects are only created when an item is
+        accessed.
+
+        :param accessors: A list of attribute names for accessing the value
+            in each column of the row.
+        :param data: The initial list of items in the source. Items are converted as
+            shown :ref:`here <listsource-item>`.
+        """
+        super().__init__(accessors)
+
+        self._data = _ColumnStore(self)
+        for column in self._accessors:
+            self._data._columns[column] = []
+
+        if data is not None:
+            for item in data:
+                self._data.append_values(self._row_data(item))
+
+    def _create_row(self, data: object) -> ColumnarRow:
+        row = ColumnarRow(**self._row_data(data))
+        row._source = self
+        return row
+
+    def __iter__(self) -> Iterator[ColumnarRow]:
+        return iter(self._data)
+
+    def index(self, row: ColumnarRow) -> int:
+        """The index of a specific row in the data source.
+
+        Unlike :meth:`ListSource.index() <toga.sources.ListSource.index>`, this is a
+        constant time operation, as each row tracks its own position.
+
+        :param row: The row to find in the data source.
+        :returns: The index of the row in the data source.
+        :raises ValueError: If the row cannot be found in the data source.
+        """
+        return self._data.index(row)
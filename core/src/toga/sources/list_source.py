@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
-from typing import Generic, TypeVar
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from typing import Callable, Generic, TypeVar
 
 from .base import Source
 
@@ -14,36 +15,227 @@ def _find_item(
     accessors: Sequence[str],
     start: T | None,
     error: str,
+    position: Callable[[T], int] | None = None,
 ) -> T:
     """Find-by-value implementation helper; find an item matching ``data`` in
-    ``candidates``, starting with item ``start``."""
+    ``candidates``, starting with item ``start``.
+
+    ``position`` is used to find the index of ``start`` in ``candidates``; by
+    default, ``candidates.index()`` is used."""
     if start is not None:
-        start_index = candidates.index(start) + 1
+        start_index = (position or candidates.index)(start) + 1
     else:
         start_index = 0
 
-    for item in candidates[start_index:]:
-        try:
-            if isinstance(data, Mapping):
-                found = all(
-                    getattr(item, attr) == value for attr, value in data.items()
-                )
-            elif hasattr(data, "__iter__") and not isinstance(data, str):
-                found = all(
-                    getattr(item, attr) == value for value, attr in zip(data, accessors)
-                )
-            else:
-                found = getattr(item, accessors[0]) == data
-
-            if found:
-                return item
-        except AttributeError:
-            # Attribute didn't exist, so it's not a match
-            pass
+    for i in range(start_index, len(candidates)):
+        item = candidates[i]
+        if _item_matches(item, data, accessors):
+            return item
 
     raise ValueError(error)
 
 
+def _find_indexed(
+    matches: Iterable[T],
+    data: object,
+    accessors: Sequence[str],
+    start: T | None,
+    error: str,
+    position: Callable[[T], int],
+) -> T:
+    """Find-by-value implementation helper for indexed sources; find the first item
+    of ``matches`` (in the order given by ``position``) that matches ``data``,
+    after item ``start``.
+
+    ``matches`` must include every item that could match ``data``."""
+    start_index = -1 if start is None else position(start)
+    found_index, found = None, None
+    for item in matches:
+        index = position(item)
+        if (
+            index > start_index
+            and (found_index is None or index < found_index)
+            and _item_matches(item, data, accessors)
+        ):
+            found_index, found = index, item
+
+    if found_index is None:
+        raise ValueError(error)
+    return found
+
+
+def _item_matches(item: object, data: object, accessors: Sequence[str]) -> bool:
+    """Does ``item`` have all the values described by ``data``?"""
+    try:
+        if isinstance(data, Mapping):
+            return all(getattr(item, attr) == value for attr, value in data.items())
+        elif hasattr(data, "__iter__") and not isinstance(data, str):
+            return all(
+                getattr(item, attr) == value for value, attr in zip(data, accessors)
+            )
+        else:
+            return getattr(item, accessors[0]) == data
+    except AttributeError:
+        # Attribute didn't exist, so it's not a match
+        return False
+
+
+class _RowIndex:
+    """Hash indexes over the values of some of the attributes of a set of rows."""
+
+    def __init__(self, attrs: Iterable[str]):
+        # attr -> value -> rows with that value (as an insertion-ordered set)
+        self._buckets: dict[str, dict[object, dict[Row, None]]] = {
+            attr: {} for attr in attrs
+        }
+        # row -> the values under which the row is currently indexed
+        self._indexed: dict[Row, dict[str, object]] = {}
+
+    def add(self, row: Row) -> None:
+        values = {}
+        for attr, buckets in self._buckets.items():
+            try:
+                value = getattr(row, attr)
+                buckets.setdefault(value, {})[row] = None
+            except (AttributeError, TypeError):
+                # A missing attribute can't be matched; and an unhashable value
+                # can't be indexed.
+                continue
+            values[attr] = value
+        self._indexed[row] = values
+
+    def discard(self, row: Row) -> None:
+        for attr, value in self._indexed.pop(row, {}).items():
+            bucket = self._buckets[attr][value]
+            del bucket[row]
+            if not bucket:
+                del self._buckets[attr][value]
+
+    def update(self, row: Row) -> None:
+        # Only rows that are currently indexed are re-indexed; a change notification
+        # can be generated by a row that has been removed from the source.
+        if row in self._indexed:
+            self.discard(row)
+            self.add(row)
+
+    def clear(self) -> None:
+        for buckets in self._buckets.values():
+            buckets.clear()
+        self._indexed.clear()
+
+    def lookup(self, data: object, accessors: Sequence[str]) -> list[Row] | None:
+        """Return every row that could match ``data``, or ``None`` if the index
+        can't be used to answer the query."""
+        if isinstance(data, Mapping):
+            criteria = data
+        elif hasattr(data, "__iter__") and not isinstance(data, str):
+            criteria = dict(zip(accessors, data))
+        else:
+            criteria = {accessors[0]: data}
+
+        for attr, value in criteria.items():
+            if attr in self._buckets:
+                try:
+                    return list(self._buckets[attr].get(value, ()))
+                except TypeError:
+                    # Unhashable values can't be looked up.
+                    return None
+        return None
+
+
+class _Positions:
+    """A lazily maintained map from each item of a list to its position.
+
+    Modifying the list only invalidates the positions from the point of the
+    modification onwards; they are recomputed the next time a position is needed.
+    Appending to the list therefore doesn't invalidate any existing position.
+    """
+
+    def __init__(self) -> None:
+        self._positions: dict[object, int] = {}
+        # The positions of all items before this index are known to be correct.
+        self._valid = 0
+
+    def invalidate(self, index: int) -> None:
+        self._valid = min(self._valid, max(index, 0))
+
+    def discard(self, item: object) -> None:
+        self._positions.pop(item, None)
+
+    def clear(self) -> None:
+        self._positions.clear()
+        self._valid = 0
+
+    def index(self, items: Sequence, item: object) -> int:
+        try:
+            position = self._positions.get(item)
+        except TypeError:
+            position = None
+
+        if position is None or position >= self._valid:
+            for i in range(self._valid, len(items)):
+                self._positions[items[i]] = i
+            self._valid = len(items)
+            try:
+                position = self._positions.get(item)
+            except TypeError:
+                position = None
+
+        if position is None or items[position] is not item:
+            raise ValueError(f"{item!r} is not in list")
+        return position
+
+
+def _coalesce(
+    pending: list[tuple[str, dict[str, object]]]
+) -> list[tuple[str, dict[str, object]]]:
+    """Merge a list of deferred notifications into the shortest equivalent list.
+
+    Change notifications are delivered last, once for each changed item, so that they
+    are received when listeners have been told about every structural change."""
+    result: list[tuple[str, dict[str, object]]] = []
+    changes: dict[int, object] = {}
+    for notification, kwargs in pending:
+        if notification == "change":
+            changes[id(kwargs["item"])] = kwargs["item"]
+            continue
+        elif notification == "clear":
+            # Nothing that happened before the clear is visible anymore.
+            result = []
+            changes = {}
+        elif notification in {"insert", "remove"}:
+            notification = f"{notification}_range"
+            kwargs = {"index": kwargs["index"], "items": [kwargs["item"]]}
+
+        if result and notification == result[-1][0]:
+            previous = result[-1][1]
+            if notification == "insert_range":
+                index, items = kwargs["index"], kwargs["items"]
+                # An insert at either end of the previous range extends it.
+                if index == previous["index"] + len(previous["items"]):
+                    previous["items"] = previous["items"] + items
+                    continue
+                elif index == previous["index"]:
+                    previous["items"] = items + previous["items"]
+                    continue
+            elif notification == "remove_range":
+                index, items = kwargs["index"], kwargs["items"]
+                # Forward deletion (repeatedly at the same index), or backward
+                # deletion (immediately before the previous range).
+                if index == previous["index"]:
+                    previous["items"] = previous["items"] + items
+                    continue
+                elif index + len(items) == previous["index"]:
+                    previous["index"] = index
+                    previous["items"] = items + previous["items"]
+                    continue
+
+        result.append((notification, dict(kwargs)))
+
+    result.extend(("change", {"item": item}) for item in changes.values())
+    return result
+
+
 class Row(Generic[T]):
     def __init__(self, **data: T):
         """Create a new Row object.
@@ -85,6 +277,19 @@ class Row(Generic[T]):
     def __getattr__(self, attr: str) -> T:
         return super().__getattr__(attr)
 
+    def update(self, **values: T) -> None:
+        """Set multiple attributes on the Row object, notifying the source of the
+        change once.
+
+        :param values: The attributes to change, and their new values.
+        """
+        for attr, value in values.items():
+            super().__setattr__(attr, value)
+
+        if any(not attr.startswith("_") for attr in values):
+            if self._source is not None:
+                self._source.notify("change", item=self)
+
     def __delattr__(self, attr: str) -> None:
         """Remove an attribute from the Row object, notifying the source of the change.
 
@@ -99,13 +304,21 @@ class Row(Generic[T]):
 class ListSource(Source):
     _data: list[Row]
 
-    def __init__(self, accessors: Iterable[str], data: Iterable | None = None):
+    def __init__(
+        self,
+        accessors: Iterable[str],
+        data: Iterable | None = None,
+        index: Iterable[str] | None = None,
+    ):
         """A data source to store an ordered list of multiple data values.
 
         :param accessors: A list of attribute names for accessing the value
             in each column of the row.
         :param data: The initial list of items in the source. Items are converted as
             shown :ref:`above <listsource-item>`.
+        :param index: A list of attribute names whose values should be indexed, so
+            that :meth:`find()` can locate matching rows without scanning the
+            source.
         """
         super().__init__()
         if isinstance(accessors, str) or not hasattr(accessors, "__iter__"):
@@ -116,12 +329,25 @@ class ListSource(Source):
         if len(self._accessors) == 0:
             raise ValueError("ListSource must be provided a list of accessors")
 
+        if index is not None:
+            if isinstance(index, str) or not hasattr(index, "__iter__"):
+                raise ValueError("index should be a list of attribute names")
+            self._index: _RowIndex | None = _RowIndex(index)
+        else:
+            self._index = None
+        self._positions = _Positions()
+
         # Convert the data into row objects
         if data is not None:
             self._data = [self._create_row(value) for value in data]
+            self._rows_added(0, self._data)
         else:
             self._data = []
 
+        # Notifications deferred by an active batch().
+        self._batch_depth = 0
+        self._pending: list[tuple[str, dict[str, object]]] = []
+
     ######################################################################
     # Methods required by the ListSource interface
     ######################################################################
@@ -130,15 +356,59 @@ class ListSource(Source):
         """Returns the number of items in the list."""
         return len(self._data)
 
-    def __getitem__(self, index: int) -> Row:
-        """Returns the item at position ``index`` of the list."""
+    def __getitem__(self, index: int | slice) -> Row | list[Row]:
+        """Returns the item at position ``index`` of the list.
+
+        If ``index`` is a slice, a list of the matching rows is returned.
+        """
         return self._data[index]
 
-    def __delitem__(self, index: int) -> None:
-        """Deletes the item at position ``index`` of the list."""
-        row = self._data[index]
-        del self._data[index]
-        self.notify("remove", index=index, item=row)
+    def __delitem__(self, index: int | slice) -> None:
+        """Deletes the item at position ``index`` of the list.
+
+        If ``index`` is a contiguous slice, listeners will receive a single
+        ``remove_range`` notification for all the deleted rows.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._data))
+            rows = self._data[index]
+            del self._data[index]
+            self._rows_removed(min(start, stop), rows)
+            if step == 1:
+                if rows:
+                    self.notify("remove_range", index=start, items=rows)
+            else:
+                # Notify from the highest index down, so that each index is still
+                # valid when the notification is received.
+                for i, row in sorted(
+                    zip(range(start, stop, step), rows),
+                    key=lambda pair: pair[0],
+                    reverse=True,
+                ):
+                    self.notify("remove", index=i, item=row)
+        else:
+            row = self._data[index]
+            del self._data[index]
+            position = index if index >= 0 else len(self._data) + index + 1
+            self._rows_removed(position, [row])
+            self.notify("remove", index=index, item=row)
+
+    ######################################################################
+    # Index maintenance
+    ######################################################################
+
+    def _rows_added(self, index: int, rows: Iterable[Row]) -> None:
+        self._positions.invalidate(index)
+        if self._index is not None:
+            for row in rows:
+                self._index.add(row)
+
+    def _rows_removed(self, index: int, rows: Iterable[Row]) -> None:
+        self._positions.invalidate(index)
+        for row in rows:
+            self._positions.discard(row)
+            if self._index is not None:
+                self._index.discard(row)
 
     ######################################################################
     # Factory methods for new rows
@@ -146,35 +416,114 @@ class ListSource(Source):
 
     # This behavior is documented in list_source.rst.
     def _create_row(self, data: object) -> Row:
+        row = Row(**self._row_data(data))
+        row._source = self
+        return row
+
+    def _row_data(self, data: object) -> dict[str, object]:
         if isinstance(data, Mapping):
-            row = Row(**data)
+            return dict(data)
         elif hasattr(data, "__iter__") and not isinstance(data, str):
-            row = Row(**dict(zip(self._accessors, data)))
+            return dict(zip(self._accessors, data))
         else:
-            row = Row(**{self._accessors[0]: data})
-        row._source = self
-        return row
+            return {self._accessors[0]: data}
 
     ######################################################################
     # Utility methods to make ListSources more list-like
     ######################################################################
 
-    def __setitem__(self, index: int, value: object) -> None:
+    def __setitem__(self, index: int | slice, value: object) -> None:
         """Set the value of a specific item in the data source.
 
-        :param index: The item to change
+        If ``index`` is a contiguous slice, ``value`` must be an iterable of items;
+        listeners will receive a single ``remove_range`` notification for the
+        replaced rows, followed by a single ``insert_range`` notification for the
+        new rows.
+
+        :param index: The item (or slice of items) to change
         :param value: The data for the updated item. This data will be converted
             into a Row object.
         """
-        row = self._create_row(value)
-        self._data[index] = row
-        self.notify("insert", index=index, item=row)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._data))
+            rows = [self._create_row(item) for item in value]
+            old_rows = self._data[index]
+            # This will raise a ValueError for an extended slice of the wrong size;
+            # that must happen before any notification is sent.
+            self._data[index] = rows
+            self._rows_removed(min(start, stop), old_rows)
+            self._rows_added(min(start, stop), rows)
+            if step == 1:
+                if old_rows:
+                    self.notify("remove_range", index=start, items=old_rows)
+                if rows:
+                    self.notify("insert_range", index=start, items=rows)
+            else:
+                for i, old_row, row in zip(range(start, stop, step), old_rows, rows):
+                    self.notify("remove", index=i, item=old_row)
+                    self.notify("insert", index=i, item=row)
+        else:
+            row = self._create_row(value)
+            old_row = self._data[index]
+            self._data[index] = row
+            position = index if index >= 0 else len(self._data) + index
+            self._rows_removed(position, [old_row])
+            self._rows_added(position, [row])
+            self.notify("insert", index=index, item=row)
 
     def clear(self) -> None:
         """Clear all data from the data source."""
-        self._data = []
+        self._data.clear()
+        self._positions.clear()
+        if self._index is not None:
+            self._index.clear()
         self.notify("clear")
 
+    ######################################################################
+    # Batched notifications
+    ######################################################################
+
+    def notify(self, notification: str, **kwargs: object) -> None:
+        if notification == "change" and self._index is not None:
+            self._index.update(kwargs["item"])
+
+        if self._batch_depth:
+            self._pending.append((notification, kwargs))
+        else:
+            super().notify(notification, **kwargs)
+
+    @contextmanager
+    def batch(self) -> Iterator[ListSource]:
+        """Group a series of modifications into a compact set of notifications.
+
+        Inside a ``with source.batch():`` block, notifications are held back. When
+        the outermost block exits, consecutive inserts of adjacent rows are
+        delivered as a single ``insert_range`` notification, and consecutive
+        removals of adjacent rows as a single ``remove_range`` notification. A
+        ``clear()`` inside the block supersedes any earlier pending notification.
+
+        Batches can be nested; notifications are delivered when the outermost
+        batch ends.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                pending, self._pending = self._pending, []
+                for notification, kwargs in _coalesce(pending):
+                    # A changed row may have been removed later in the batch.
+                    if notification != "change" or self._is_current(kwargs["item"]):
+                        super().notify(notification, **kwargs)
+
+    def _is_current(self, item: object) -> bool:
+        try:
+            self.index(item)
+            return True
+        except ValueError:
+            return False
+
     def insert(self, index: int, data: object) -> Row:
         """Insert a row into the data source at a specific index.
 
@@ -185,6 +534,7 @@ class ListSource(Source):
         """
         row = self._create_row(data)
         self._data.insert(index, row)
+        self._rows_added(index if index >= 0 else len(self._data) + index - 1, [row])
         self.notify("insert", index=index, item=row)
         return row
 
@@ -197,12 +547,30 @@ class ListSource(Source):
         """
         return self.insert(len(self), data)
 
+    def extend(self, data: Iterable) -> list[Row]:
+        """Insert multiple rows at the end of the data source.
+
+        Listeners will receive a single ``insert_range`` notification for all the new
+        rows.
+
+        :param data: The items to append to the ListSource. Each item will be
+            converted into a Row object.
+        :returns: The newly constructed Row objects.
+        """
+        rows = [self._create_row(item) for item in data]
+        if rows:
+            index = len(self._data)
+            self._data.extend(rows)
+            self._rows_added(index, rows)
+            self.notify("insert_range", index=index, items=rows)
+        return rows
+
     def remove(self, row: Row) -> None:
         """Remove a row from the data source.
 
         :param row: The row to remove from the data source.
         """
-        del self[self._data.index(row)]
+        del self[self.index(row)]
 
     def index(self, row: Row) -> int:
         """The index of a specific row in the data source.
@@ -212,11 +580,14 @@ class ListSource(Source):
         same Python instance will match. To search for values based on equality,
         use :meth:`~toga.sources.ListSource.find`.
 
+        The positions of rows are cached, so repeated lookups are constant time
+        operations until the source is modified.
+
         :param row: The row to find in the data source.
         :returns: The index of the row in the data source.
         :raises ValueError: If the row cannot be found in the data source.
         """
-        return self._data.index(row)
+        return self._positions.index(self._data, row)
 
     def find(self, data: object, start: Row | None = None) -> Row:
         """Find the first item in the data that matches all the provided
@@ -236,10 +607,24 @@ class ListSource(Source):
         :return: The matching Row object
         :raises ValueError: If no match is found.
         """
+        error = f"No row matching {data!r} in data"
+        if self._index is not None:
+            matches = self._index.lookup(data, self._accessors)
+            if matches is not None:
+                return _find_indexed(
+                    matches=matches,
+                    data=data,
+                    accessors=self._accessors,
+                    start=start,
+                    error=error,
+                    position=self.index,
+                )
+
         return _find_item(
             candidates=self._data,
             data=data,
             accessors=self._accessors,
             start=start,
-            error=f"No row matching {data!r} in data",
+            error=error,
+            position=self.index,
         )
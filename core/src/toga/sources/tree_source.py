@@ -1,14 +1,50 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator, Sequence
 from typing import Iterable, Mapping, TypeVar
 
 from .base import Source
-from .list_source import Row, _find_item
+from .list_source import Row, _find_indexed, _find_item, _Positions, _RowIndex
 
 T = TypeVar("T")
 
 
+def _find_node(
+    index: _RowIndex | None,
+    parent: Node | None,
+    candidates: list[Node],
+    data: object,
+    accessors: Sequence[str],
+    start: Node | None,
+    error: str,
+    position: Callable[[Node], int],
+) -> Node:
+    """Find a node matching ``data`` in ``candidates``, the children of ``parent``;
+    using the source's index if possible.
+
+    ``position`` is used to find the index of a node in ``candidates``."""
+    if index is not None:
+        matches = index.lookup(data, accessors)
+        if matches is not None:
+            return _find_indexed(
+                matches=[node for node in matches if node._parent is parent],
+                data=data,
+                accessors=accessors,
+                start=start,
+                error=error,
+                position=position,
+            )
+
+    return _find_item(
+        candidates=candidates,
+        data=data,
+        accessors=accessors,
+        start=start,
+        error=error,
+        position=position,
+    )
+
+
 class Node(Row[T]):
     _source: TreeSource
 
@@ -27,6 +63,7 @@ class Node(Row[T]):
         """
         super().__init__(**data)
         self._children: list[Node[T]] | None = None
+        self._child_positions = _Positions()
         self._parent: Node[T] | None = None
 
     def __repr__(self) -> str:
@@ -58,6 +95,9 @@ class Node(Row[T]):
 
         child = self._children[index]
         del self._children[index]
+        self._child_positions.invalidate(index % (len(self._children) + 1))
+        self._child_positions.discard(child)
+        self._source._forget(child)
 
         # Child isn't part of this source, or a child of this node anymore.
         child._parent = None
@@ -98,6 +138,9 @@ class Node(Row[T]):
             raise ValueError(f"{self} is a leaf node")
 
         old_node = self._children[index]
+        self._child_positions.invalidate(index % len(self._children))
+        self._child_positions.discard(old_node)
+        self._source._forget(old_node)
         old_node._parent = None
         old_node._source = None
 
@@ -124,6 +167,7 @@ class Node(Row[T]):
 
         node = self._source._create_node(parent=self, data=data, children=children)
         self._children.insert(index, node)
+        self._child_positions.invalidate(index)
         self._source.notify("insert", parent=self, index=index, item=node)
         return node
 
@@ -153,6 +197,9 @@ class Node(Row[T]):
         same Python instance will match. To search for values based on equality,
         use :meth:`~toga.sources.Node.find`.
 
+        The positions of children are cached, so repeated lookups are constant time
+        until the children of this node are modified.
+
         :param child: The node to find in the children of this node.
         :returns: The index of the node in the children of this node.
         :raises ValueError: If the node cannot be found in children of this node.
@@ -160,7 +207,7 @@ class Node(Row[T]):
         if self._children is None:
             raise ValueError(f"{self} is a leaf node")
 
-        return self._children.index(child)
+        return self._child_positions.index(self._children, child)
 
     def find(self, data: object, start: Node[T] | None = None) -> Node[T]:
         """Find the first item in the child nodes of this node that matches all the
@@ -184,19 +231,27 @@ class Node(Row[T]):
         if self._children is None:
             raise ValueError(f"{self} is a leaf node")
 
-        return _find_item(
+        return _find_node(
+            index=self._source._index,
+            parent=self,
             candidates=self._children,
             data=data,
             accessors=self._source._accessors,
             start=start,
             error=f"No child matching {data!r} in {self}",
+            position=self.index,
         )
 
 
 class TreeSource(Source):
     _roots: list[Node]
 
-    def __init__(self, accessors: Iterable[str], data: object | None = None):
+    def __init__(
+        self,
+        accessors: Iterable[str],
+        data: object | None = None,
+        index: Iterable[str] | None = None,
+    ):
         super().__init__()
         if isinstance(accessors, str) or not hasattr(accessors, "__iter__"):
             raise ValueError("accessors should be a list of attribute names")
@@ -206,6 +261,14 @@ class TreeSource(Source):
         if len(self._accessors) == 0:
             raise ValueError("TreeSource must be provided a list of accessors")
 
+        if index is not None:
+            if isinstance(index, str) or not hasattr(index, "__iter__"):
+                raise ValueError("index should be a list of attribute names")
+            self._index: _RowIndex | None = _RowIndex(index)
+        else:
+            self._index = None
+
+        self._positions = _Positions()
         if data is not None:
             self._roots = self._create_nodes(parent=None, value=data)
         else:
@@ -224,7 +287,9 @@ class TreeSource(Source):
     def __delitem__(self, index: int) -> None:
         node = self._roots[index]
         del self._roots[index]
-        node._source = None
+        self._positions.invalidate(index % (len(self._roots) + 1))
+        self._positions.discard(node)
+        self._forget(node)
         self.notify("remove", parent=None, index=index, item=node)
 
     ######################################################################
@@ -246,12 +311,36 @@ class TreeSource(Source):
 
         node._parent = parent
         node._source = self
+        if self._index is not None:
+            self._index.add(node)
 
         if children is not None:
             node._children = self._create_nodes(parent=node, value=children)
 
         return node
 
+    ######################################################################
+    # Index maintenance
+    ######################################################################
+
+    def _forget(self, node: Node) -> None:
+        """Disassociate a node, and all its descendants, from the source, and remove
+        them from the index."""
+        if self._index is not None:
+            self._index.discard(node)
+        node._source = None
+        for child in node:
+            self._forget(child)
+
+    def notify(self, notification: str, **kwargs: object) -> None:
+        if notification == "change" and self._index is not None:
+            self._index.update(kwargs["item"])
+        super().notify(notification, **kwargs)
+
+    def _is_current(self, item: object) -> bool:
+        # Nodes that are removed from the source are disassociated from it.
+        return getattr(item, "_source", None) is self
+
     def _create_nodes(self, parent: Node | None, value: object) -> list[Node]:
         if isinstance(value, Mapping):
             return [
@@ -278,8 +367,10 @@ class TreeSource(Source):
             into a Node object.
         """
         old_root = self._roots[index]
+        self._positions.invalidate(index % len(self._roots))
+        self._positions.discard(old_root)
+        self._forget(old_root)
         old_root._parent = None
-        old_root._source = None
 
         root = self._create_node(parent=None, data=data)
         self._roots[index] = root
@@ -287,7 +378,10 @@ class TreeSource(Source):
 
     def clear(self) -> None:
         """Clear all data from the data source."""
+        for root in self._roots:
+            self._forget(root)
         self._roots = []
+        self._positions.clear()
         self.notify("clear")
 
     def insert(self, index: int, data: object, children: object = None) -> Node:
@@ -309,6 +403,7 @@ class TreeSource(Source):
 
         node = self._create_node(parent=None, data=data, children=children)
         self._roots.insert(index, node)
+        self._positions.invalidate(index)
         node._parent = None
         self.notify("insert", parent=None, index=index, item=node)
 
@@ -350,11 +445,14 @@ class TreeSource(Source):
         same Python instance will match. To search for values based on equality,
         use :meth:`~toga.sources.TreeSource.find`.
 
+        The positions of root nodes are cached, so repeated lookups are constant time
+        until the root nodes are modified.
+
         :param node: The node to find in the data source.
         :returns: The index of the node in the child list it is a part of.
         :raises ValueError: If the node cannot be found in the data source.
         """
-        return self._roots.index(node)
+        return self._positions.index(self._roots, node)
 
     def find(self, data: object, start: Node | None = None) -> Node:
         """Find the first item in the child nodes of the given node that matches all the
@@ -375,10 +473,13 @@ class TreeSource(Source):
         :raises ValueError: If no match is found.
         :raises ValueError: If the provided parent is not part of this TreeSource.
         """
-        return _find_item(
+        return _find_node(
+            index=self._index,
+            parent=None,
             candidates=self._roots,
             data=data,
             accessors=self._accessors,
             start=start,
             error=f"No root node matching {data!r} in {self}",
+            position=self.index,
         )
@@ -0,0 +1,474 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from typing import Any, Callable
+
+from .base import Source
+from .list_source import Row, _coalesce, _find_item
+
+
+class _Reversed:
+    """A sort key wrapper that inverts the ordering of the wrapped key."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any):
+        self.key = key
+
+    def __lt__(self, other: _Reversed) -> bool:
+        return other.key < self.key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Reversed) and self.key == other.key
+
+
+class _View(Source):
+    """The common behavior of a view over the rows of another list-like source.
+
+    A view doesn't copy or re-create the rows of the source it is viewing; it keeps
+    a list of references to those rows, in the order they should be presented. It
+    listens to the source, and translates the source's notifications into
+    notifications describing the change to the view.
+    """
+
+    def __init__(self, source: Source):
+        super().__init__()
+        self._source = source
+        self._accessors = source._accessors
+        self._rows: list[Row] = []
+
+    ######################################################################
+    # Methods required by the ListSource interface
+    ######################################################################
+
+    @property
+    def source(self) -> Source:
+        """The source being viewed."""
+        return self._source
+
+    def __len__(self) -> int:
+        """Returns the number of rows in the view."""
+        return len(self._rows)
+
+    def __getitem__(self, index: int | slice) -> Row | list[Row]:
+        """Returns the row at position ``index`` of the view.
+
+        If ``index`` is a slice, a list of the matching rows is returned.
+        """
+        return self._rows[index]
+
+    def __iter__(self) -> Iterator[Row]:
+        return iter(self._rows)
+
+    def find(self, data: object, start: Row | None = None) -> Row:
+        """Find the first row in the view that matches all the provided attributes.
+
+        See :meth:`ListSource.find() <toga.sources.ListSource.find>` for details of
+        the matching criteria.
+
+        :param data: The data to search for.
+        :param start: The instance from which to start the search. Defaults to ``None``,
+            indicating that the first match should be returned.
+        :return: The matching Row object
+        :raises ValueError: If no match is found.
+        """
+        return _find_item(
+            candidates=self._rows,
+            data=data,
+            accessors=self._accessors,
+            start=start,
+            error=f"No row matching {data!r} in view",
+            position=self.index,
+        )
+
+    def detach(self) -> None:
+        """Stop tracking changes in the source being viewed."""
+        self._source.remove_listener(self)
+
+    def _is_current(self, item: object) -> bool:
+        try:
+            self.index(item)
+            return True
+        except ValueError:
+            return False
+
+    def _source_index(self, row: Row) -> int | None:
+        """The index of a row in the source, or ``None`` if the row isn't in the
+        source (e.g., because it has been removed or replaced)."""
+        try:
+            return self._source.index(row)
+        except ValueError:
+            return None
+
+    def _notify_all(self, pending: list[tuple[str, dict[str, object]]]) -> None:
+        """Deliver a list of notifications, merging adjacent ranges."""
+        for notification, kwargs in _coalesce(pending):
+            self.notify(notification, **kwargs)
+
+    ######################################################################
+    # Source listener interface
+    ######################################################################
+
+    def clear(self) -> None:
+        self._rows = []
+        self._reset()
+        self.notify("clear")
+
+    def _reset(self) -> None:
+        """Discard any bookkeeping for the rows of the view."""
+
+
+class SortedView(_View):
+    def __init__(
+        self,
+        source: Source,
+        key: Callable[[Row], Any],
+        reverse: bool = False,
+    ):
+        """A read-only view of a list-like data source, in sorted order.
+
+        The rows of the view are the rows of ``source``; they are not copied. As rows
+        are added to, removed from, or modified in the source, they are added to,
+        removed from, or repositioned in the view.
+
+        Rows with equal keys are kept in the order in which they were added to the
+        view.
+
+        :param source: The data source to view. It must have the interface of a
+            :any:`ListSource`.
+        :param key: A callable that returns the sort key for a row.
+        :param reverse: Should the rows be sorted in descending order?
+        """
+        super().__init__(source)
+        self._key = key
+        self._reverse = reverse
+        self._sort()
+        source.add_listener(self)
+
+    def _sort_key(self, row: Row) -> Any:
+        key = self._key(row)
+        return _Reversed(key) if self._reverse else key
+
+    def _sort(self) -> None:
+        keyed = sorted(
+            ((self._sort_key(row), row) for row in self._source),
+            key=lambda pair: pair[0],
+        )
+        self._keys = [key for key, _ in keyed]
+        self._rows = [row for _, row in keyed]
+        # The key under which each row is currently positioned.
+        self._row_keys = {row: key for key, row in keyed}
+
+    def _reset(self) -> None:
+        self._keys = []
+        self._row_keys = {}
+
+    @property
+    def key(self) -> Callable[[Row], Any]:
+        """The callable that returns the sort key for a row.
+
+        Changing the key re-sorts the view.
+        """
+        return self._key
+
+    @key.setter
+    def key(self, key: Callable[[Row], Any]) -> None:
+        self._key = key
+        self.resort()
+
+    @property
+    def reverse(self) -> bool:
+        """Are the rows sorted in descending order?
+
+        Changing the sort direction re-sorts the view.
+        """
+        return self._reverse
+
+    @reverse.setter
+    def reverse(self, reverse: bool) -> None:
+        self._reverse = bool(reverse)
+        self.resort()
+
+    def resort(self) -> None:
+        """Re-sort the view.
+
+        This is only required if the sort key of a row has changed without a change
+        notification (e.g., if the key depends on data outside the row). The rows
+        themselves are not re-created; listeners receive a ``clear`` notification,
+        followed by a single ``insert_range`` notification.
+        """
+        self._sort()
+        self.notify("clear")
+        if self._rows:
+            self.notify("insert_range", index=0, items=list(self._rows))
+
+    def index(self, row: Row) -> int:
+        """The index of a specific row in the view.
+
+        This search uses Row instances, and searches for an *instance* match.
+
+        :param row: The row to find in the view.
+        :returns: The index of the row in the view.
+        :raises ValueError: If the row cannot be found in the view.
+        """
+        try:
+            key = self._row_keys[row]
+        except KeyError:
+            raise ValueError(f"{row!r} is not in view")
+
+        # Search the run of rows that share the row's key.
+        index = bisect_left(self._keys, key)
+        while self._rows[index] is not row:
+            index += 1
+        return index
+
+    def _add(self, row: Row) -> int:
+        key = self._sort_key(row)
+        index = bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._rows.insert(index, row)
+        self._row_keys[row] = key
+        return index
+
+    def _discard(self, row: Row) -> int | None:
+        if row not in self._row_keys:
+            # The row has already been removed from the view.
+            return None
+        index = self.index(row)
+        del self._keys[index]
+        del self._rows[index]
+        del self._row_keys[row]
+        return index
+
+    def _remove_replaced(self, count: int) -> None:
+        """Remove any rows that are no longer in the source, before ``count`` rows are
+        inserted.
+
+        Replacing a row in a :any:`ListSource` is notified as an insertion of the new
+        row, without a notification for the row it replaced. If inserting the rows
+        would leave the view with more rows than the source, the rows that are no
+        longer in the source are found and removed.
+        """
+        if len(self._rows) + count > len(self._source):
+            for row in [row for row in self._rows if self._source_index(row) is None]:
+                self.notify("remove", index=self._discard(row), item=row)
+
+    ######################################################################
+    # Source listener interface
+    ######################################################################
+
+    def insert(self, index: int, item: Row) -> None:
+        self._remove_replaced(1)
+        self.notify("insert", index=self._add(item), item=item)
+
+    def insert_range(self, index: int, items: list[Row]) -> None:
+        self._remove_replaced(len(items))
+        self._notify_all(
+            [("insert", {"index": self._add(item), "item": item}) for item in items]
+        )
+
+    def remove(self, index: int, item: Row) -> None:
+        view_index = self._discard(item)
+        if view_index is not None:
+            self.notify("remove", index=view_index, item=item)
+
+    def remove_range(self, index: int, items: list[Row]) -> None:
+        pending = []
+        for item in items:
+            view_index = self._discard(item)
+            if view_index is not None:
+                pending.append(("remove", {"index": view_index, "item": item}))
+        self._notify_all(pending)
+
+    def change(self, item: Row) -> None:
+        if item not in self._row_keys:
+            # A row that has been removed from the view can still be modified.
+            return
+
+        old_index = self.index(item)
+        key = self._sort_key(item)
+        if key == self._keys[old_index]:
+            self.notify("change", item=item)
+        else:
+            self._discard(item)
+            new_index = self._add(item)
+            if new_index == old_index:
+                self.notify("change", item=item)
+            else:
+                self.notify("remove", index=old_index, item=item)
+                self.notify("insert", index=new_index, item=item)
+
+
+class FilteredView(_View):
+    def __init__(self, source: Source, predicate: Callable[[Row], bool]):
+        """A read-only view of the rows of a list-like data source that satisfy a
+        predicate.
+
+        The rows of the view are the rows of ``source``, in the same order; they are
+        not copied. As rows are added to, removed from, or modified in the source, the
+        view is updated to match.
+
+        :param source: The data source to view. It must have the interface of a
+            :any:`ListSource`.
+        :param predicate: A callable that accepts a row, and returns ``True`` if the
+            row should be included in the view.
+        """
+        super().__init__(source)
+        self._predicate = predicate
+        self._rows = [row for row in source if predicate(row)]
+        self._members = set(self._rows)
+        source.add_listener(self)
+
+    def _reset(self) -> None:
+        self._members = set()
+
+    @property
+    def predicate(self) -> Callable[[Row], bool]:
+        """The callable that decides whether a row is included in the view.
+
+        Changing the predicate re-filters the view. Listeners receive notifications
+        describing the rows that have been removed from, and added to, the view.
+        """
+        return self._predicate
+
+    @predicate.setter
+    def predicate(self, predicate: Callable[[Row], bool]) -> None:
+        self._predicate = predicate
+        self.refilter()
+
+    def refilter(self) -> None:
+        """Re-evaluate the predicate for every row in the source.
+
+        This is only required if the result of the predicate has changed without a
+        change notification (e.g., if it depends on data outside the row).
+        """
+        pending = []
+        rows = []
+        for row in self._source:
+            was_visible = row in self._members
+            visible = bool(self._predicate(row))
+            if visible:
+                if not was_visible:
+                    pending.append(("insert", {"index": len(rows), "item": row}))
+                rows.append(row)
+            elif was_visible:
+                pending.append(("remove", {"index": len(rows), "item": row}))
+
+        self._rows = rows
+        self._members = set(rows)
+        self._notify_all(pending)
+
+    def _position(self, source_index: int) -> int:
+        """The position in the view of the first row that is at or after
+        ``source_index`` in the source.
+
+        The view may still hold rows that have just been removed from, or replaced
+        in, the source at ``source_index``; those rows are treated as being at
+        ``source_index``.
+        """
+        lo, hi = 0, len(self._rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            index = self._source_index(self._rows[mid])
+            if index is not None and index < source_index:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def index(self, row: Row) -> int:
+        """The index of a specific row in the view.
+
+        This search uses Row instances, and searches for an *instance* match.
+
+        :param row: The row to find in the view.
+        :returns: The index of the row in the view.
+        :raises ValueError: If the row cannot be found in the view.
+        """
+        if row in self._members:
+            return self._position(self._source.index(row))
+        raise ValueError(f"{row!r} is not in view")
+
+    def _add(self, source_index: int, row: Row) -> int | None:
+        if not self._predicate(row):
+            return None
+        index = self._position(source_index)
+        self._rows.insert(index, row)
+        self._members.add(row)
+        return index
+
+    def _discard(self, index: int, items: list[Row]) -> tuple[int, list[Row]]:
+        # The rows have already been removed from the source, but all the rows before
+        # them are still in the same position. The removed rows were contiguous in
+        # the source, so the ones that are visible are also contiguous in the view.
+        visible = [item for item in items if item in self._members]
+        view_index = self._position(index)
+        del self._rows[view_index : view_index + len(visible)]
+        self._members.difference_update(visible)
+        return view_index, visible
+
+    def _remove_replaced(self, index: int) -> list[tuple[str, dict[str, object]]]:
+        """Remove the row that was replaced by an insertion at ``index``, if any.
+
+        Replacing a row in a :any:`ListSource` is notified as an insertion of the new
+        row, without a notification for the row it replaced. If the replaced row is
+        in the view, it is the first row at or after ``index``, and is no longer in
+        the source.
+        """
+        view_index = self._position(index)
+        if view_index < len(self._rows):
+            row = self._rows[view_index]
+            if self._source_index(row) is None:
+                del self._rows[view_index]
+                self._members.discard(row)
+                return [("remove", {"index": view_index, "item": row})]
+        return []
+
+    ######################################################################
+    # Source listener interface
+    ######################################################################
+
+    def insert(self, index: int, item: Row) -> None:
+        for notification, kwargs in self._remove_replaced(index):
+            self.notify(notification, **kwargs)
+        view_index = self._add(index, item)
+        if view_index is not None:
+            self.notify("insert", index=view_index, item=item)
+
+    def insert_range(self, index: int, items: list[Row]) -> None:
+        pending = []
+        for offset, item in enumerate(items):
+            pending.extend(self._remove_replaced(index + offset))
+            view_index = self._add(index + offset, item)
+            if view_index is not None:
+                pending.append(("insert", {"index": view_index, "item": item}))
+        self._notify_all(pending)
+
+    def remove(self, index: int, item: Row) -> None:
+        view_index, visible = self._discard(index, [item])
+        if visible:
+            self.notify("remove", index=view_index, item=item)
+
+    def remove_range(self, index: int, items: list[Row]) -> None:
+        view_index, visible = self._discard(index, items)
+        if visible:
+            self.notify("remove_range", index=view_index, items=visible)
+
+    def change(self, item: Row) -> None:
+        source_index = self._source_index(item)
+        if source_index is None:
+            # A row that has been removed from the source can still be modified.
+            return
+
+        visible = bool(self._predicate(item))
+        if item in self._members:
+            if visible:
+                self.notify("change", item=item)
+            else:
+                index = self._position(source_index)
+                del self._rows[index]
+                self._members.discard(item)
+                self.notify("remove", index=index, item=item)
+        elif visible:
+            self.insert(source_index, item)
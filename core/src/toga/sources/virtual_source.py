@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from typing import Callable
+
+from .base import Source
+from .list_source import ListSource, Row, _item_matches
+
+
+class VirtualListSource(Source):
+    def __init__(
+        self,
+        accessors: Iterable[str],
+        length: int,
+        fetch: Callable[[int, int], Iterable],
+        page_size: int = 100,
+        cache_pages: int = 32,
+    ):
+        """A read-only data source that materializes rows on demand.
+
+        Rather than holding all its data, a VirtualListSource knows how many items it
+        contains, and a callable that can retrieve a contiguous page of items. Rows
+        are only constructed when they are accessed; the most recently used pages of
+        rows are cached, and the least recently used pages are discarded once the
+        cache is full.
+
+        :param accessors: A list of attribute names for accessing the value
+            in each column of the row.
+        :param length: The number of items in the source.
+        :param fetch: A callable that accepts a start index and a count, and returns
+            an iterable of the items in that range. Items are converted as shown
+            :ref:`here <listsource-item>`.
+        :param page_size: The number of items to retrieve in each call to ``fetch``.
+        :param cache_pages: The maximum number of pages of rows to keep in memory.
+        """
+        super().__init__()
+        if isinstance(accessors, str) or not hasattr(accessors, "__iter__"):
+            raise ValueError("accessors should be a list of attribute names")
+
+        # Copy the list of accessors
+        self._accessors = [a for a in accessors]
+        if len(self._accessors) == 0:
+            raise ValueError("VirtualListSource must be provided a list of accessors")
+
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+        if cache_pages < 1:
+            raise ValueError("cache_pages must be a positive integer")
+
+        self._length = length
+        self._fetch = fetch
+        self._page_size = page_size
+        self._cache_pages = cache_pages
+        self._pages: OrderedDict[int, list[Row]] = OrderedDict()
+
+    # Rows are constructed in exactly the same way as for a ListSource.
+    _create_row = ListSource._create_row
+    _row_data = ListSource._row_data
+
+    ######################################################################
+    # Methods required by the ListSource interface
+    ######################################################################
+
+    def __len__(self) -> int:
+        """Returns the number of items in the source."""
+        return self._length
+
+    def __getitem__(self, index: int | slice) -> Row | list[Row]:
+        """Returns the item at position ``index`` of the source.
+
+        If ``index`` is a slice, a list of the matching rows is returned.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("VirtualListSource index out of range")
+
+        page, offset = divmod(index, self._page_size)
+        return self._page(page)[offset]
+
+    def __iter__(self) -> Iterator[Row]:
+        for page in range(0, (self._length + self._page_size - 1) // self._page_size):
+            yield from self._page(page)
+
+    ######################################################################
+    # Page cache
+    ######################################################################
+
+    def _page(self, page: int) -> list[Row]:
+        try:
+            rows = self._pages[page]
+            self._pages.move_to_end(page)
+        except KeyError:
+            start = page * self._page_size
+            count = min(self._page_size, self._length - start)
+            rows = [self._create_row(item) for item in self._fetch(start, count)]
+            if len(rows) != count:
+                raise ValueError(
+                    f"fetch({start}, {count}) returned {len(rows)} items; "
+                    f"expected {count}"
+                )
+
+            self._pages[page] = rows
+            while len(self._pages) > self._cache_pages:
+                self._pages.popitem(last=False)
+
+        return rows
+
+    @property
+    def cached_rows(self) -> int:
+        """The number of rows currently held in memory."""
+        return sum(len(rows) for rows in self._pages.values())
+
+    def invalidate(self, length: int | None = None) -> None:
+        """Discard all cached rows, so that they will be re-fetched when accessed.
+
+        Listeners will receive a ``clear`` notification, which indicates that any
+        previously retrieved rows are no longer valid.
+
+        :param length: The new number of items in the source. Defaults to ``None``,
+            indicating that the number of items hasn't changed.
+        """
+        if length is not None:
+            self._length = length
+        self._pages.clear()
+        self.notify("clear")
+
+    ######################################################################
+    # Utility methods to make VirtualListSource more list-like
+    ######################################################################
+
+    def index(self, row: Row) -> int:
+        """The index of a specific row in the data source.
+
+        This search uses Row instances, and searches for an *instance* match. Only rows
+        that are currently cached can be found; a row that has been discarded from the
+        cache is no longer part of the source.
+
+        :param row: The row to find in the data source.
+        :returns: The index of the row in the data source.
+        :raises ValueError: If the row cannot be found in the data source.
+        """
+        for page, rows in self._pages.items():
+            for offset, candidate in enumerate(rows):
+                if candidate is row:
+                    return page * self._page_size + offset
+
+        raise ValueError(f"{row} is not in the data source")
+
+    def find(self, data: object, start: Row | None = None) -> Row:
+        """Find the first item in the data that matches all the provided
+        attributes.
+
+        This is a value based search that materializes rows as it proceeds, so it
+        should be used sparingly on large sources. See
+        :meth:`~toga.sources.ListSource.find` for details of the matching criteria.
+
+        :param data: The data to search for.
+        :param start: The instance from which to start the search. Defaults to ``None``,
+            indicating that the first match should be returned.
+        :return: The matching Row object
+        :raises ValueError: If no match is found.
+        """
+        start_index = 0 if start is None else self.index(start) + 1
+        for index in range(start_index, self._length):
+            row = self[index]
+            if _item_matches(row, data, self._accessors):
+                return row
+
+        raise ValueError(f"No row matching {data!r} in data")
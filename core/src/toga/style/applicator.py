@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from toga.style import profiling
+
 if TYPE_CHECKING:
     from toga.widgets.base import Widget
 
@@ -9,21 +11,43 @@ if TYPE_CHECKING:
 class TogaApplicator:
     """Apply styles to a Toga widget."""
 
+    #: The total number of times the bounds of a native widget have been set. This
+    #: can be used to measure the cost of a layout change.
+    native_set_bounds_count = 0
+
     def __init__(self, widget: Widget):
         self.widget = widget
+        # The bounds that were most recently applied to the widget.
+        self._bounds: tuple[int, int, int, int] | None = None
 
     def refresh(self) -> None:
         # print("RE-EVALUATE LAYOUT", self.widget)
+        self.widget.layout.dirty()
         self.widget.refresh()
 
     def set_bounds(self) -> None:
         # print("  APPLY LAYOUT", self.widget, self.widget.layout)
-        self.widget._impl.set_bounds(
-            self.widget.layout.absolute_content_left,
-            self.widget.layout.absolute_content_top,
-            self.widget.layout.content_width,
-            self.widget.layout.content_height,
+        layout = self.widget.layout
+        bounds = (
+            layout.absolute_content_left,
+            layout.absolute_content_top,
+            layout.content_width,
+            layout.content_height,
         )
+        # If the widget hasn't moved, and nothing in the subtree has been laid out
+        # since the bounds were last applied, none of the descendants have moved.
+        if layout._applied and bounds == self._bounds:
+            return
+
+        # Native geometry updates can be expensive, and can trigger further native
+        # layout, so only update widgets whose bounds have changed.
+        if bounds != self._bounds:
+            self.widget._impl.set_bounds(*bounds)
+            self._bounds = bounds
+            TogaApplicator.native_set_bounds_count += 1
+            if profiling._active:
+                profiling.bounds_set(self.widget)
+        layout._applied = True
         for child in self.widget.children:
             child.applicator.set_bounds()
 
@@ -42,6 +42,7 @@ from toga.fonts import (
     SYSTEM_DEFAULT_FONTS,
     Font,
 )
+from toga.style import profiling
 
 ######################################################################
 # Display
@@ -78,7 +79,27 @@ FONT_SIZE_CHOICES = Choices(integer=True)
 
 class Pack(BaseStyle):
     class Box(BaseBox):
-        pass
+        def __init__(self, node: Node):
+            super().__init__(node)
+            # Does the layout of this node, or one of its descendants, need to be
+            # recomputed? A node that isn't dirty, and is laid out with the same
+            # arguments as its previous layout, will produce the same layout.
+            self._dirty = True
+            self._layout_args: tuple[int, int, bool, bool] | None = None
+            # Has the current layout of this node, and all its descendants, been
+            # applied to the widgets?
+            self._applied = False
+
+            # Any change in the intrinsic size of the node invalidates the layout.
+            node.intrinsic._layout = self
+
+        def dirty(self, **changes: object) -> None:
+            """Mark the layout of this node (and all its ancestors) as needing to be
+            recomputed."""
+            node = self.node
+            while node is not None:
+                node.layout._dirty = True
+                node = node.parent
 
     class IntrinsicSize(BaseIntrinsicSize):
         pass
@@ -105,6 +126,8 @@ class Pack(BaseStyle):
             elif prop == "text_direction":
                 if self.text_align is None:
                     self._applicator.set_text_alignment(RIGHT if value == RTL else LEFT)
+                # Text direction also determines the order of children in a row.
+                self._applicator.refresh()
             elif prop == "color":
                 self._applicator.set_color(value)
             elif prop == "background_color":
@@ -136,6 +159,8 @@ class Pack(BaseStyle):
         # self._debug("=" * 80)
         # self._debug(f"Layout root {node}, available {viewport.width}x{viewport.height}")
         self.__class__._depth = -1
+        if profiling._active:
+            profiling.layout_started(node)
 
         self._layout_node(
             node,
@@ -150,6 +175,9 @@ class Pack(BaseStyle):
         node.layout.content_left = node.style.padding_left
         node.layout.content_right = node.style.padding_right
 
+        if profiling._active:
+            profiling.layout_finished(node)
+
     def _layout_node(
         self,
         node: Node,
@@ -158,6 +186,17 @@ class Pack(BaseStyle):
         use_all_width: bool,
         use_all_height: bool,
     ) -> None:
+        # If nothing in this subtree has changed since it was last laid out with the
+        # same arguments, the existing layout is still valid.
+        layout_args = (alloc_width, alloc_height, use_all_width, use_all_height)
+        if not node.layout._dirty and node.layout._layout_args == layout_args:
+            if profiling._active:
+                profiling.node_visited(node, laid_out=False)
+            return
+
+        if profiling._active:
+            profiling.node_visited(node, laid_out=True)
+
         self.__class__._depth += 1
         # self._debug(
         #     f"COMPUTE LAYOUT for {node} available "
@@ -221,6 +260,8 @@ class Pack(BaseStyle):
                 min_height = 0
 
         if node.children:
+            if profiling._active:
+                profiling.children_started(self.direction)
             if self.direction == COLUMN:
                 min_width, width, min_height, height = self._layout_column_children(
                     node,
@@ -237,6 +278,8 @@ class Pack(BaseStyle):
                     use_all_height=use_all_height,
                     use_all_width=use_all_width,
                 )
+            if profiling._active:
+                profiling.children_finished()
             # self._debug(f"HAS CHILDREN {min_width=} {width=} {min_height=} {height=}")
         else:
             width = available_width
@@ -259,6 +302,10 @@ class Pack(BaseStyle):
         node.layout.min_content_width = int(min_width)
         node.layout.min_content_height = int(min_height)
 
+        node.layout._dirty = False
+        node.layout._layout_args = layout_args
+        node.layout._applied = False
+
         # self._debug("END LAYOUT", node, node.layout)
         self.__class__._depth -= 1
 
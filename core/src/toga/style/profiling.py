@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import atexit
+import os
+import sys
+from time import perf_counter
+from typing import TYPE_CHECKING, TextIO
+
+from travertino.constants import ROW
+
+if TYPE_CHECKING:
+    from travertino.node import Node
+
+    from toga.widgets.base import Widget
+
+# The profilers that are currently recording. The layout code only calls the hooks in
+# this module when this list isn't empty, so profiling has no cost when it isn't in
+# use.
+_active: list[LayoutProfiler] = []
+
+
+class LayoutPass:
+    def __init__(self, root: Node, trigger: Widget | None, rehints: int):
+        """A record of the work performed by a single layout pass.
+
+        :param root: The root node of the layout.
+        :param trigger: The widget whose ``refresh()`` started the layout pass, or
+            ``None`` if the layout pass wasn't started by a widget refresh (e.g., if
+            the window was resized).
+        :param rehints: The number of widgets that were refreshed, and may have
+            changed their intrinsic size, before the layout pass started.
+        """
+        self.root = root
+        self.trigger = trigger
+        self.rehints = rehints
+
+        #: The number of nodes that were visited by the layout.
+        self.nodes_visited = 0
+        #: The number of nodes whose layout was computed (rather than re-used).
+        self.nodes_laid_out = 0
+        #: The time spent laying out the children of row boxes, in seconds. This
+        #: excludes time spent laying out any nested column boxes.
+        self.row_time = 0.0
+        #: The time spent laying out the children of column boxes, in seconds. This
+        #: excludes time spent laying out any nested row boxes.
+        self.column_time = 0.0
+        #: The total duration of the layout computation, in seconds.
+        self.duration = 0.0
+        #: The number of native ``set_bounds()`` calls made to apply the layout.
+        self.set_bounds = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<LayoutPass root={self.root!r} trigger={self.trigger!r} "
+            f"rehints={self.rehints} nodes_visited={self.nodes_visited} "
+            f"nodes_laid_out={self.nodes_laid_out} set_bounds={self.set_bounds} "
+            f"row_time={self.row_time * 1000:.3f}ms "
+            f"column_time={self.column_time * 1000:.3f}ms "
+            f"duration={self.duration * 1000:.3f}ms>"
+        )
+
+
+class LayoutProfiler:
+    def __init__(self):
+        """Record the work performed by layout passes.
+
+        A profiler only records while it is active. It can be used as a context
+        manager::
+
+            with LayoutProfiler() as profiler:
+                window.size = (800, 600)
+
+            for layout_pass in profiler.passes:
+                print(layout_pass.nodes_laid_out, layout_pass.set_bounds)
+
+        or activated and deactivated explicitly with :meth:`start` and :meth:`stop`.
+
+        Multiple profilers can be active at the same time.
+        """
+        #: The layout passes that have been recorded.
+        self.passes: list[LayoutPass] = []
+
+        self._trigger: Widget | None = None
+        self._rehints = 0
+        # The layout pass that is currently being computed.
+        self._current: LayoutPass | None = None
+        self._start = 0.0
+        # A stack of [direction, start time, nested time] for each box whose
+        # children are being laid out.
+        self._boxes: list[list] = []
+
+    def __enter__(self) -> LayoutProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start recording layout passes."""
+        if self not in _active:
+            _active.append(self)
+
+    def stop(self) -> None:
+        """Stop recording layout passes."""
+        if self in _active:
+            _active.remove(self)
+
+    def clear(self) -> None:
+        """Discard all recorded layout passes."""
+        self.passes = []
+
+    ######################################################################
+    # Hooks invoked by the layout machinery
+    ######################################################################
+
+    def refresh(self, widget: Widget) -> None:
+        # The first widget refreshed since the last layout pass is the trigger for
+        # the next one.
+        if self._rehints == 0:
+            self._trigger = widget
+        self._rehints += 1
+
+    def layout_started(self, root: Node) -> None:
+        self._current = LayoutPass(root, self._trigger, self._rehints)
+        self._trigger = None
+        self._rehints = 0
+        self._boxes = []
+        self._start = perf_counter()
+
+    def layout_finished(self, root: Node) -> None:
+        if self._current is not None:
+            self._current.duration = perf_counter() - self._start
+            self.passes.append(self._current)
+            self._current = None
+
+    def node_visited(self, node: Node, laid_out: bool) -> None:
+        if self._current is not None:
+            self._current.nodes_visited += 1
+            if laid_out:
+                self._current.nodes_laid_out += 1
+
+    def children_started(self, direction: str) -> None:
+        self._boxes.append([direction, perf_counter(), 0.0])
+
+    def children_finished(self) -> None:
+        if self._current is not None and self._boxes:
+            direction, start, nested = self._boxes.pop()
+            elapsed = perf_counter() - start
+            if direction == ROW:
+                self._current.row_time += elapsed - nested
+            else:
+                self._current.column_time += elapsed - nested
+            if self._boxes:
+                self._boxes[-1][2] += elapsed
+
+    def bounds_set(self, widget: Widget) -> None:
+        # Bounds are applied once the layout has been computed; attribute them to
+        # the most recent layout pass.
+        if self.passes:
+            self.passes[-1].set_bounds += 1
+
+
+######################################################################
+# Hooks invoked by the layout machinery
+######################################################################
+
+
+def refresh(widget: Widget) -> None:
+    for profiler in _active:
+        profiler.refresh(widget)
+
+
+def layout_started(root: Node) -> None:
+    for profiler in _active:
+        profiler.layout_started(root)
+
+
+def layout_finished(root: Node) -> None:
+    for profiler in _active:
+        profiler.layout_finished(root)
+
+
+def node_visited(node: Node, laid_out: bool) -> None:
+    for profiler in _active:
+        profiler.node_visited(node, laid_out)
+
+
+def children_started(direction: str) -> None:
+    for profiler in _active:
+        profiler.children_started(direction)
+
+
+def children_finished() -> None:
+    for profiler in _active:
+        profiler.children_finished()
+
+
+def bounds_set(widget: Widget) -> None:
+    for profiler in _active:
+        profiler.bounds_set(widget)
+
+
+######################################################################
+# Environment-driven reporting
+######################################################################
+
+
+def report(profiler: LayoutProfiler, file: TextIO | None = None) -> None:
+    """Write a summary of every layout pass recorded by a profiler.
+
+    :param profiler: The profiler whose layout passes should be reported.
+    :param file: The file to write to. Defaults to ``sys.stderr``.
+    """
+    file = sys.stderr if file is None else file
+    print(f"{len(profiler.passes)} layout passes", file=file)
+    for layout_pass in profiler.passes:
+        print(f"  {layout_pass!r}", file=file)
+
+
+if os.environ.get("TOGA_LAYOUT_PROFILE"):  # pragma: no cover
+    _environment_profiler = LayoutProfiler()
+    _environment_profiler.start()
+    atexit.register(report, _environment_profiler)
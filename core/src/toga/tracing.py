@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from toga.style.profiling import LayoutProfiler
+
+if TYPE_CHECKING:
+    from travertino.node import Node
+
+
+class TracePhase:
+    def __init__(self, name: str, start: float, end: float):
+        """A phase of an app's startup.
+
+        :param name: The name of the phase.
+        :param start: The time when the phase started, in seconds, as reported by
+            :func:`time.perf_counter`.
+        :param end: The time when the phase ended, in seconds, as reported by
+            :func:`time.perf_counter`.
+        """
+        self.name = name
+        self.start = start
+        self.end = end
+
+    @property
+    def duration(self) -> float:
+        """The duration of the phase, in seconds."""
+        return self.end - self.start
+
+    def __repr__(self) -> str:
+        return (
+            f"<TracePhase {self.name!r} start={self.start:.6f} "
+            f"duration={self.duration * 1000:.3f}ms>"
+        )
+
+
+class _LayoutTracer(LayoutProfiler):
+    # Records each layout pass as a phase of the startup trace.
+    def __init__(self, trace: StartupTrace):
+        super().__init__()
+        self.trace = trace
+
+    def layout_finished(self, root: Node) -> None:
+        if self._current is not None:
+            name = "layout" if self.passes else "first layout"
+            self.trace.add_phase(name, self._start)
+        super().layout_finished(root)
+
+
+class StartupTrace:
+    def __init__(self, path: str | os.PathLike | None = None):
+        """A record of the time taken by each phase of an app's startup.
+
+        A trace is recorded when the ``TOGA_STARTUP_TRACE`` environment variable is
+        set, and can be retrieved from :any:`App.startup_trace`. Every layout pass
+        that occurs before the trace finishes is also recorded.
+
+        The trace finishes once the app's event loop is running, and the
+        :meth:`~toga.App.on_running` handler has been invoked.
+
+        :param path: If provided, the trace will be written to this file, in Chrome
+            trace event format, when it finishes.
+        """
+        self.path = None if path is None else Path(path)
+
+        #: The time when tracing started, in seconds, as reported by
+        #: :func:`time.perf_counter`.
+        self.start = perf_counter()
+        #: The time when the trace finished, or ``None`` if the app is still
+        #: starting up.
+        self.end: float | None = None
+        #: The phases that have been recorded, in the order they finished.
+        self.phases: list[TracePhase] = []
+
+        self._layout_tracer = _LayoutTracer(self)
+        self._layout_tracer.start()
+
+    @classmethod
+    def from_environment(cls) -> StartupTrace | None:
+        """Create a trace if the ``TOGA_STARTUP_TRACE`` environment variable is set.
+
+        If the variable is set to ``1``, the trace is recorded; any other value is
+        interpreted as the path of the file where the trace should be written.
+
+        :returns: A new trace, or ``None`` if startup shouldn't be traced.
+        """
+        if value := os.environ.get("TOGA_STARTUP_TRACE"):
+            return cls(None if value == "1" else value)
+        return None
+
+    def __getitem__(self, name: str) -> TracePhase:
+        """Return the first phase with the given name."""
+        for phase in self.phases:
+            if phase.name == name:
+                return phase
+        raise KeyError(name)
+
+    def __repr__(self) -> str:
+        return f"<StartupTrace phases={len(self.phases)}>"
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the time taken by the body of a ``with`` block as a phase.
+
+        :param name: The name of the phase.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, start)
+
+    def add_phase(self, name: str, start: float, end: float | None = None) -> None:
+        """Record a phase.
+
+        :param name: The name of the phase.
+        :param start: The time when the phase started, as reported by
+            :func:`time.perf_counter`.
+        :param end: The time when the phase ended. Defaults to the current time.
+        """
+        end = perf_counter() if end is None else end
+        self.phases.append(TracePhase(name, start, end))
+
+    def finish(self) -> None:
+        """Stop recording, and write the trace to a file if a path was provided."""
+        if self.end is None:
+            self.end = perf_counter()
+            self._layout_tracer.stop()
+            if self.path:
+                self.save(self.path)
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the trace in Chrome trace event format.
+
+        The result can be serialized as JSON and loaded into ``chrome://tracing`` or
+        `Perfetto <https://ui.perfetto.dev>`__. Timestamps are in microseconds,
+        relative to the start of the trace.
+        """
+        pid = os.getpid()
+
+        def timestamp(time: float) -> float:
+            return round((time - self.start) * 1e6, 3)
+
+        events = [
+            {
+                "name": phase.name,
+                "cat": "toga.startup",
+                "ph": "X",
+                "ts": timestamp(phase.start),
+                "dur": round(phase.duration * 1e6, 3),
+                "pid": pid,
+                "tid": 0,
+            }
+            for phase in self.phases
+        ]
+        if self.end is not None:
+            events.append(
+                {
+                    "name": "running",
+                    "cat": "toga.startup",
+                    "ph": "i",
+                    "s": "p",
+                    "ts": timestamp(self.end),
+                    "pid": pid,
+                    "tid": 0,
+                }
+            )
+        # Viewers nest phases that enclose one another; that requires events to be
+        # sorted by start time, with enclosing phases first.
+        events.sort(key=lambda event: (event["ts"], -event.get("dur", 0)))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the trace to a file in Chrome trace event format.
+
+        :param path: The path of the file to write.
+        """
+        with Path(path).open("w", encoding="utf-8") as f:
+            json.dump(self.as_chrome_trace(), f, indent=1)
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from builtins import id as identifier
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from travertino.declaration import BaseStyle
 from travertino.node import Node
 
 from toga.platform import get_platform_factory
-from toga.style import Pack, TogaApplicator
+from toga.style import Pack, TogaApplicator, profiling
 
 if TYPE_CHECKING:
     from toga.app import App
@@ -20,6 +22,11 @@ class Widget(Node):
     _MIN_WIDTH = 100
     _MIN_HEIGHT = 100
 
+    # While layout is deferred, the roots of any widget trees that need to be laid
+    # out are collected, so that each tree is only laid out once.
+    _layout_deferred = 0
+    _deferred_roots: dict[Widget, None] = {}
+
     def __init__(
         self,
         id: str | None = None,
@@ -107,6 +114,7 @@ class Widget(Node):
                 self._impl.add_child(child._impl)
 
         # Whatever layout we're a part of needs to be refreshed
+        self.layout.dirty()
         self.refresh()
 
     def insert(self, index: int, child: Widget) -> None:
@@ -140,6 +148,7 @@ class Widget(Node):
             self._impl.insert_child(index, child._impl)
 
         # Whatever layout we're a part of needs to be refreshed
+        self.layout.dirty()
         self.refresh()
 
     def index(self, child: Widget) -> int:
@@ -194,6 +203,7 @@ class Widget(Node):
 
         # If we removed something, whatever layout we're a part of needs to be refreshed
         if removed:
+            self.layout.dirty()
             self.refresh()
 
     def clear(self) -> None:
@@ -254,6 +264,9 @@ class Widget(Node):
 
         self._window = window
         self._impl.set_window(window)
+        # The widget may now be in a different native container, so its bounds
+        # will need to be applied again.
+        self.applicator._bounds = None
 
         for child in self.children:
             child.window = window
@@ -268,6 +281,8 @@ class Widget(Node):
         self._impl.set_enabled(bool(value))
 
     def refresh(self) -> None:
+        if profiling._active:
+            profiling.refresh(self)
         self._impl.refresh()
 
         # Refresh the layout
@@ -278,8 +293,34 @@ class Widget(Node):
         else:
             # We can't compute a layout until we have a container
             if self._impl.container:
-                super().refresh(self._impl.container)
-                self._impl.container.refreshed()
+                if Widget._layout_deferred:
+                    Widget._deferred_roots[self] = None
+                else:
+                    super().refresh(self._impl.container)
+                    self._impl.container.refreshed()
+
+    @staticmethod
+    @contextmanager
+    def deferred_layout() -> Iterator[None]:
+        """Defer layout while making a series of changes to widgets.
+
+        Adding, inserting or removing children, or changing a style property, will
+        normally cause the layout of the widget tree to be recomputed immediately.
+        Inside a ``with toga.Widget.deferred_layout():`` block, widget trees are only
+        marked as needing a new layout. When the outermost block exits, each tree that
+        was changed is laid out once, and the new geometry is applied to its widgets.
+        """
+        Widget._layout_deferred += 1
+        try:
+            yield
+        finally:
+            Widget._layout_deferred -= 1
+            if not Widget._layout_deferred:
+                roots, Widget._deferred_roots = Widget._deferred_roots, {}
+                for root in roots:
+                    # If the widget has been added to another tree in the meantime,
+                    # this will refresh the root of that tree instead.
+                    root.refresh()
 
     def focus(self) -> None:
         """Give this widget the input focus.
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import warnings
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from array import array
+from collections.abc import Collection, Iterator
 from contextlib import contextmanager
-from math import cos, pi, sin, tan
+from functools import partial
+from math import ceil, cos, floor, hypot, inf, isfinite, pi, sin, tan
+from operator import add
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -25,12 +30,325 @@ from toga.fonts import (
     Font,
 )
 from toga.handlers import wrapped_handler
+from toga.platform import get_platform_factory
 
 from .base import StyleT, Widget
 
 if TYPE_CHECKING:
     from toga.images import ImageT
 
+    # A rectangle on the canvas, as (left, top, right, bottom).
+    Extent = tuple[float, float, float, float]
+
+#######################################################################################
+# Extents
+#######################################################################################
+
+# The extent of a drawing operation whose effect can't be bounded.
+UNBOUNDED: Extent = (-inf, -inf, inf, inf)
+
+# The identity transformation, as an (xx, yx, xy, yy, x0, y0) affine matrix.
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+# Strokes use a miter join by default; at the default miter limit of 10, the tip of a
+# miter can extend up to 5 line widths from the path.
+_STROKE_MARGIN = 5.0
+
+
+def _union(first: Extent | None, second: Extent | None) -> Extent | None:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return (
+        min(first[0], second[0]),
+        min(first[1], second[1]),
+        max(first[2], second[2]),
+        max(first[3], second[3]),
+    )
+
+
+def _contains(outer: Extent, inner: Extent | None) -> bool:
+    return inner is None or (
+        outer[0] <= inner[0]
+        and outer[1] <= inner[1]
+        and inner[2] <= outer[2]
+        and inner[3] <= outer[3]
+    )
+
+
+def _pixels(extent: Extent) -> tuple[int, int, int, int]:
+    """Expand an extent to whole pixels, so that antialiased edges are included.
+
+    :returns: The (x, y, width, height) of the expanded region.
+    """
+    left, top = floor(extent[0]), floor(extent[1])
+    return left, top, ceil(extent[2]) - left, ceil(extent[3]) - top
+
+
+def _intersects(extent: Extent | None, clip: Extent) -> bool:
+    return (
+        extent is not None
+        and extent[0] < clip[2]
+        and clip[0] < extent[2]
+        and extent[1] < clip[3]
+        and clip[1] < extent[3]
+    )
+
+
+def _touches(extent: Extent | None, region: Extent) -> bool:
+    """Does an extent intersect or touch the edge of a region?"""
+    return (
+        extent is not None
+        and extent[0] <= region[2]
+        and region[0] <= extent[2]
+        and extent[1] <= region[3]
+        and region[1] <= extent[3]
+    )
+
+
+class _DrawState:
+    """The state of a canvas as it is being drawn, used to compute the region of the
+    canvas affected by each drawing object.
+
+    All extents are in canvas coordinates; the points of drawing objects are transformed
+    by the current transformation as they are added to the path.
+    """
+
+    __slots__ = ("canvas", "matrix", "path", "margin", "text")
+
+    def __init__(
+        self,
+        canvas: Canvas,
+        matrix: tuple[float, ...] = _IDENTITY,
+        path: Extent | None = None,
+        margin: float = 0.0,
+        text: bool = False,
+    ):
+        self.canvas = canvas
+        # The current transformation
+        self.matrix = matrix
+        # The extent of the current path
+        self.path = path
+        # The line width of the enclosing stroke context, if any
+        self.margin = margin
+        # Is text painted when it is written?
+        self.text = text
+
+    def copy(self) -> _DrawState:
+        return _DrawState(self.canvas, self.matrix, self.path, self.margin, self.text)
+
+    def transform(
+        self, xx: float, yx: float, xy: float, yy: float, x0: float, y0: float
+    ) -> None:
+        a, b, c, d, e, f = self.matrix
+        self.matrix = (
+            a * xx + c * yx,
+            b * xx + d * yx,
+            a * xy + c * yy,
+            b * xy + d * yy,
+            a * x0 + c * y0 + e,
+            b * x0 + d * y0 + f,
+        )
+
+    def bounds(self, *points: tuple[float, float]) -> Extent:
+        """The extent of a set of points, in canvas coordinates."""
+        a, b, c, d, e, f = self.matrix
+        xs = [a * x + c * y + e for x, y in points]
+        ys = [b * x + d * y + f for x, y in points]
+        return (min(xs), min(ys), max(xs), max(ys))
+
+    def add_points(self, *points: tuple[float, float]) -> None:
+        """Add the convex hull of a set of points to the current path."""
+        if self.path != UNBOUNDED:
+            self.path = _union(self.path, self.bounds(*points))
+
+    def add_rect(self, left: float, top: float, right: float, bottom: float) -> None:
+        self.add_points((left, top), (right, top), (left, bottom), (right, bottom))
+
+    def paint(self, line_width: float = 0.0) -> Extent | None:
+        """Paint the current path, clearing it.
+
+        :param line_width: The width of the stroke used to paint the path, or 0 if the
+            path is being filled.
+        :returns: The extent of the painted region.
+        """
+        extent, self.path = self.path, None
+        if extent is None or line_width == 0:
+            return extent
+        a, b, c, d = self.matrix[:4]
+        margin = _STROKE_MARGIN * line_width * max(hypot(a, b), hypot(c, d))
+        return (
+            extent[0] - margin,
+            extent[1] - margin,
+            extent[2] + margin,
+            extent[3] + margin,
+        )
+
+
+def _values(values: Any) -> array[float]:
+    """Convert a sequence of numbers, or an object that supports the buffer protocol
+    (e.g., a NumPy array), into a compact array of floats."""
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array("d", values)
+
+    if view.format == "d":
+        # The data is already in the right format; copy it in a single operation.
+        result = array("d")
+        result.frombytes(view.tobytes())
+        return result
+    return array("d", view.tolist())
+
+
+def _draw_ops(impl: Any, ops: list, kwargs: dict[str, Any]) -> None:
+    """Perform a list of compiled operations on a backend.
+
+    The arguments of each operation were set by the contexts inside the compiled
+    context, so they take precedence over the arguments it inherits.
+    """
+    op_kwargs: dict[str, Any] | None = None
+    for name, args, kwargs_for_op in ops:
+        if kwargs_for_op is not op_kwargs:
+            op_kwargs = kwargs_for_op
+            combined = {**kwargs, **op_kwargs}
+        getattr(impl, name)(*args, **combined)
+
+
+class _HitIndex:
+    """A spatial index of the drawing objects in a context, used to find the objects
+    that paint in a region of the canvas without checking every object.
+
+    The index is a uniform grid; each object is listed in every cell of the grid that
+    its painted extent overlaps. Objects that would be listed in too many cells, or
+    whose extent isn't finite, are checked individually.
+    """
+
+    # Contexts with fewer objects than this are searched by checking every object.
+    MIN_OBJECTS = 32
+    # The maximum number of cells an object is listed in.
+    MAX_CELLS = 64
+
+    def __init__(self, objects: list[DrawingObject]):
+        self.extents = [obj._painted for obj in objects]
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        self.others: list[int] = []
+
+        sizes = sorted(
+            max(extent[2] - extent[0], extent[3] - extent[1])
+            for extent in self.extents
+            if extent is not None and all(isfinite(value) for value in extent)
+        )
+        if len(sizes) < self.MIN_OBJECTS:
+            self.others = [
+                index for index, extent in enumerate(self.extents) if extent is not None
+            ]
+            return
+
+        # Cells are the size of a typical object, so that most objects are listed in
+        # a few cells, and most cells list a few objects.
+        self.cell_size = max(sizes[len(sizes) // 2], 1.0)
+        for index, extent in enumerate(self.extents):
+            if extent is None:
+                continue
+            cells = self._cells(extent)
+            if cells is None:
+                self.others.append(index)
+                continue
+            left, top, right, bottom = cells
+            if (right - left + 1) * (bottom - top + 1) > self.MAX_CELLS:
+                self.others.append(index)
+                continue
+            for column in range(left, right + 1):
+                for row in range(top, bottom + 1):
+                    self.cells.setdefault((column, row), []).append(index)
+
+    def _cells(self, extent: Extent) -> tuple[int, int, int, int] | None:
+        """The range of cells overlapped by an extent, as (left, top, right, bottom),
+        or ``None`` if the extent isn't finite."""
+        if not all(isfinite(value) for value in extent):
+            return None
+        size = self.cell_size
+        return (
+            floor(extent[0] / size),
+            floor(extent[1] / size),
+            floor(extent[2] / size),
+            floor(extent[3] / size),
+        )
+
+    def search(self, region: Extent) -> list[int]:
+        """Find the objects whose painted extent touches a region.
+
+        :returns: The indices of the objects, from the last object drawn (the topmost)
+            to the first.
+        """
+        candidates = set(self.others)
+        if self.cells:
+            cells = self._cells(region)
+            count = (
+                None
+                if cells is None
+                else (cells[2] - cells[0] + 1) * (cells[3] - cells[1] + 1)
+            )
+            if count is None or count > len(self.cells):
+                # It's quicker to look at every cell that lists an object.
+                for indices in self.cells.values():
+                    candidates.update(indices)
+            else:
+                left, top, right, bottom = cells
+                for column in range(left, right + 1):
+                    for row in range(top, bottom + 1):
+                        candidates.update(self.cells.get((column, row), ()))
+
+        extents = self.extents
+        return sorted(
+            (index for index in candidates if _touches(extents[index], region)),
+            reverse=True,
+        )
+
+
+class _Recorder:
+    """A stand-in for a backend that records the operations performed by drawing
+    objects, rather than performing them, to compile a program for the backend."""
+
+    def __init__(self, impl: Any):
+        self._impl = impl
+        self.program: list = []
+        self._ops: list | None = None
+        self._kwargs: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        # Only the operations supported by the backend can be recorded, so that
+        # drawing objects can fall back to other operations.
+        getattr(self._impl, name)
+        ops = self.program
+
+        def record(*args: Any, **kwargs: Any) -> None:
+            if self._ops is None:
+                self._ops = []
+                ops.append(self._ops)
+            # Consecutive operations usually have the same arguments; share them, so
+            # that the arguments only need to be combined with the backend's own
+            # arguments when they change.
+            if kwargs == self._kwargs:
+                kwargs = self._kwargs
+            else:
+                self._kwargs = kwargs
+            self._ops.append((name, args, kwargs))
+
+        setattr(self, name, record)
+        return record
+
+    def record_context(self, context: Context, kwargs: dict[str, Any]) -> None:
+        if context.cache:
+            # A cached context is drawn separately, so that it can use its cache.
+            self.program.append((context, kwargs))
+            self._ops = None
+        else:
+            context._draw_tree(self, **kwargs)
+
+
 #######################################################################################
 # Simple drawing objects
 #######################################################################################
@@ -56,8 +374,11 @@ class DrawingObject(ABC):
     * :meth:`toga.widgets.canvas.Fill <Context.fill>`
     * :meth:`toga.widgets.canvas.LineTo <Context.line_to>`
     * :meth:`toga.widgets.canvas.MoveTo <Context.move_to>`
+    * :meth:`toga.widgets.canvas.Points <Context.points>`
+    * :meth:`toga.widgets.canvas.Polyline <Context.polyline>`
     * :meth:`toga.widgets.canvas.QuadraticCurveTo <Context.quadratic_curve_to>`
     * :meth:`toga.widgets.canvas.Rect <Context.rect>`
+    * :meth:`toga.widgets.canvas.Rects <Context.rects>`
     * :meth:`toga.widgets.canvas.ResetTransform <Context.reset_transform>`
     * :meth:`toga.widgets.canvas.Rotate <Context.rotate>`
     * :meth:`toga.widgets.canvas.Scale <Context.scale>`
@@ -66,22 +387,87 @@ class DrawingObject(ABC):
     * :meth:`toga.widgets.canvas.WriteText <Context.write_text>`
     """
 
+    # The extent of the region of the canvas painted by the object, as of the last
+    # time the extent of the context containing it was computed.
+    _painted: Extent | None = None
+    # A counter that changes whenever a public attribute of the object is set.
+    _revision = 0
+    # The revision of the object, and the draw state it was applied to, when its
+    # extent was last computed; and the matrix and path it left behind.
+    _extent_revision = -1
+    _extent_inputs: tuple | None = None
+    _extent_outputs: tuple | None = None
+    # Can the extent of the object be reused if neither the object nor the draw
+    # state it is applied to has changed?
+    _reuse_extent = True
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            super().__setattr__("_revision", self._revision + 1)
+
     @abstractmethod
     def _draw(self, impl: Any, **kwargs: Any) -> None: ...
 
+    def _apply(self, state: _DrawState) -> bool:
+        """Apply the effect of the drawing object to a draw state, and store the extent
+        of the region it paints as ``_painted``.
+
+        The extent is only computed again if the object has been modified, or the draw
+        state is different from the last time the extent was computed.
+
+        :param state: The state of the canvas before the object is drawn. It is
+            modified to reflect the state after the object is drawn.
+        :returns: Has the object been modified since its extent was last computed?
+        """
+        modified = self._extent_revision != self._revision
+        inputs = (state.canvas, state.matrix, state.path, state.margin, state.text)
+        if not modified and self._reuse_extent and inputs == self._extent_inputs:
+            state.matrix, state.path = self._extent_outputs
+            return False
+
+        self._painted = self._extent(state)
+        self._extent_revision = self._revision
+        self._extent_inputs = inputs
+        self._extent_outputs = (state.matrix, state.path)
+        return modified
+
+    def _extent(self, state: _DrawState) -> Extent | None:
+        """Apply the effect of the drawing object to a draw state.
+
+        :param state: The state of the canvas before the object is drawn. It is
+            modified to reflect the state after the object is drawn.
+        :returns: The extent of the region of the canvas painted by the object, or
+            ``None`` if the object doesn't paint anything.
+        """
+        # The effect of an unknown drawing object can't be bounded.
+        state.path = UNBOUNDED
+        return UNBOUNDED
+
+    def _clipped(self, clip: Extent) -> bool:
+        """Can drawing this object be skipped when only ``clip`` is being drawn?"""
+        return False
+
 
 class BeginPath(DrawingObject):
     def _draw(self, impl: Any, **kwargs: Any) -> None:
         impl.begin_path(**kwargs)
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        state.path = None
+        return None
+
 
 class ClosePath(DrawingObject):
     def _draw(self, impl: Any, **kwargs: Any) -> None:
         impl.close_path(**kwargs)
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        return None
+
 
 class Fill(DrawingObject):
     def __init__(
@@ -102,6 +488,9 @@ class Fill(DrawingObject):
     def _draw(self, impl: Any, **kwargs: Any) -> None:
         impl.fill(self.color, self.fill_rule, **kwargs)
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        return state.paint()
+
     @property
     def fill_rule(self) -> FillRule:
         return self._fill_rule
@@ -157,6 +546,9 @@ class Stroke(DrawingObject):
     def _draw(self, impl: Any, **kwargs: Any) -> None:
         impl.stroke(self.color, self.line_width, self.line_dash, **kwargs)
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        return state.paint(self.line_width)
+
     @property
     def color(self) -> Color:
         return self._color
@@ -210,6 +602,10 @@ class MoveTo(DrawingObject):
     def _draw(self, impl: Any, **kwargs: Any) -> None:
         impl.move_to(self.x, self.y, **kwargs)
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        state.add_points((self.x, self.y))
+        return None
+
 
 class LineTo(DrawingObject):
     def __init__(self, x: float, y: float):
@@ -222,6 +618,10 @@ class LineTo(DrawingObject):
     def _draw(self, impl: Any, **kwargs: Any) -> None:
         impl.line_to(self.x, self.y, **kwargs)
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        state.add_points((self.x, self.y))
+        return None
+
 
 class BezierCurveTo(DrawingObject):
     def __init__(
@@ -246,6 +646,13 @@ class BezierCurveTo(DrawingObject):
             self.cp1x, self.cp1y, self.cp2x, self.cp2y, self.x, self.y, **kwargs
         )
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        # A Bézier curve lies within the convex hull of its control points.
+        state.add_points(
+            (self.cp1x, self.cp1y), (self.cp2x, self.cp2y), (self.x, self.y)
+        )
+        return None
+
 
 class QuadraticCurveTo(DrawingObject):
     def __init__(self, cpx: float, cpy: float, x: float, y: float):
@@ -260,6 +667,10 @@ class QuadraticCurveTo(DrawingObject):
     def _draw(self, impl: Any, **kwargs: Any) -> None:
         impl.quadratic_curve_to(self.cpx, self.cpy, self.x, self.y, **kwargs)
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        state.add_points((self.cpx, self.cpy), (self.x, self.y))
+        return None
+
 
 class Arc(DrawingObject):
     def __init__(
@@ -296,6 +707,16 @@ class Arc(DrawingObject):
             **kwargs,
         )
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        # Use the extent of the full circle.
+        state.add_rect(
+            self.x - self.radius,
+            self.y - self.radius,
+            self.x + self.radius,
+            self.y + self.radius,
+        )
+        return None
+
 
 class Ellipse(DrawingObject):
     def __init__(
@@ -339,6 +760,15 @@ class Ellipse(DrawingObject):
             **kwargs,
         )
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        # Use the extent of a circle with the larger of the two radii, which contains
+        # the ellipse at any rotation.
+        radius = max(abs(self.radiusx), abs(self.radiusy))
+        state.add_rect(
+            self.x - radius, self.y - radius, self.x + radius, self.y + radius
+        )
+        return None
+
 
 class Rect(DrawingObject):
     def __init__(self, x: float, y: float, width: float, height: float):
@@ -356,6 +786,10 @@ class Rect(DrawingObject):
     def _draw(self, impl: Any, **kwargs: Any) -> None:
         impl.rect(self.x, self.y, self.width, self.height, **kwargs)
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        state.add_rect(self.x, self.y, self.x + self.width, self.y + self.height)
+        return None
+
 
 class WriteText(DrawingObject):
     def __init__(
@@ -383,6 +817,27 @@ class WriteText(DrawingObject):
             str(self.text), self.x, self.y, self.font._impl, self.baseline, **kwargs
         )
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        text = str(self.text)
+        if text:
+            # The position of the text relative to y depends on the baseline; allow
+            # for the full height of the text on either side.
+            width, height = state.canvas.measure_text(text, self.font)
+            left, right = self.x, self.x + width
+            top, bottom = self.y - height, self.y + height
+            extent = state.bounds(
+                (left, top), (right, top), (left, bottom), (right, bottom)
+            )
+        else:
+            extent = None
+
+        if state.text:
+            # In a fill or stroke context, the text is added to the current path, which
+            # is then painted.
+            state.path = _union(state.path, extent)
+            return state.paint(state.margin)
+        return extent
+
     @property
     def font(self) -> Font:
         return self._font
@@ -395,6 +850,151 @@ class WriteText(DrawingObject):
             self._font = value
 
 
+class _BulkDrawingObject(DrawingObject):
+    """A drawing operation that is applied to a series of points."""
+
+    # The values of the points can be modified in place, so the extent is always
+    # computed again.
+    _reuse_extent = False
+
+    def __init__(self, xs: Any, ys: Any):
+        self.xs = xs
+        self.ys = ys
+        self._check_length("ys", self.ys)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(count={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def _check_length(self, name: str, values: array[float]) -> None:
+        if len(values) != len(self.xs):
+            raise ValueError(f"{name} has {len(values)} values; expected {len(self)}.")
+
+    @property
+    def xs(self) -> array[float]:
+        """The x coordinates of the points."""
+        return self._xs
+
+    @xs.setter
+    def xs(self, values: Any) -> None:
+        self._xs = _values(values)
+
+    @property
+    def ys(self) -> array[float]:
+        """The y coordinates of the points."""
+        return self._ys
+
+    @ys.setter
+    def ys(self, values: Any) -> None:
+        self._ys = _values(values)
+
+
+class Polyline(_BulkDrawingObject):
+    def _draw(self, impl: Any, **kwargs: Any) -> None:
+        polyline = getattr(impl, "polyline", None)
+        if polyline is not None:
+            polyline(self.xs, self.ys, **kwargs)
+        elif self.xs:
+            # The backend doesn't have a bulk operation
+            points = zip(self.xs, self.ys)
+            x, y = next(points)
+            impl.move_to(x, y, **kwargs)
+            for x, y in points:
+                impl.line_to(x, y, **kwargs)
+
+    def _extent(self, state: _DrawState) -> Extent | None:
+        if self.xs:
+            state.add_rect(min(self.xs), min(self.ys), max(self.xs), max(self.ys))
+        return None
+
+
+class Points(_BulkDrawingObject):
+    def __init__(self, xs: Any, ys: Any, size: float = 1.0):
+        super().__init__(xs, ys)
+        self.size = size
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(count={len(self)}, size={self.size})"
+
+    def _draw(self, impl: Any, **kwargs: Any) -> None:
+        points = getattr(impl, "points", None)
+        if points is not None:
+            points(self.xs, self.ys, self.size, **kwargs)
+        else:
+            # The backend doesn't have a bulk operation
+            half = self.size / 2
+            for x, y in zip(self.xs, self.ys):
+                impl.rect(x - half, y - half, self.size, self.size, **kwargs)
+
+    def _extent(self, state: _DrawState) -> Extent | None:
+        if self.xs:
+            half = self.size / 2
+            state.add_rect(
+                min(self.xs) - half,
+                min(self.ys) - half,
+                max(self.xs) + half,
+                max(self.ys) + half,
+            )
+        return None
+
+
+class Rects(_BulkDrawingObject):
+    def __init__(self, xs: Any, ys: Any, widths: Any, heights: Any):
+        super().__init__(xs, ys)
+        self.widths = widths
+        self.heights = heights
+        self._check_length("widths", self.widths)
+        self._check_length("heights", self.heights)
+
+    def _sizes(self, values: Any) -> array[float]:
+        if isinstance(values, (int, float)):
+            # A single size is used for every rectangle.
+            return array("d", [values]) * len(self)
+        return _values(values)
+
+    @property
+    def widths(self) -> array[float]:
+        """The widths of the rectangles."""
+        return self._widths
+
+    @widths.setter
+    def widths(self, values: Any) -> None:
+        self._widths = self._sizes(values)
+
+    @property
+    def heights(self) -> array[float]:
+        """The heights of the rectangles."""
+        return self._heights
+
+    @heights.setter
+    def heights(self, values: Any) -> None:
+        self._heights = self._sizes(values)
+
+    def _draw(self, impl: Any, **kwargs: Any) -> None:
+        rects = getattr(impl, "rects", None)
+        if rects is not None:
+            rects(self.xs, self.ys, self.widths, self.heights, **kwargs)
+        else:
+            # The backend doesn't have a bulk operation
+            for x, y, width, height in zip(self.xs, self.ys, self.widths, self.heights):
+                impl.rect(x, y, width, height, **kwargs)
+
+    def _extent(self, state: _DrawState) -> Extent | None:
+        if self.xs:
+            # Widths and heights can be negative.
+            rights = list(map(add, self.xs, self.widths))
+            bottoms = list(map(add, self.ys, self.heights))
+            state.add_rect(
+                min(min(self.xs), min(rights)),
+                min(min(self.ys), min(bottoms)),
+                max(max(self.xs), max(rights)),
+                max(max(self.ys), max(bottoms)),
+            )
+        return None
+
+
 class Rotate(DrawingObject):
     def __init__(self, radians: float):
         self.radians = radians
@@ -405,6 +1005,11 @@ class Rotate(DrawingObject):
     def _draw(self, impl: Any, **kwargs: Any) -> None:
         impl.rotate(self.radians, **kwargs)
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        c, s = cos(self.radians), sin(self.radians)
+        state.transform(c, s, -s, c, 0.0, 0.0)
+        return None
+
 
 class Scale(DrawingObject):
     def __init__(self, sx: float, sy: float):
@@ -417,6 +1022,10 @@ class Scale(DrawingObject):
     def _draw(self, impl: Any, **kwargs: Any) -> None:
         impl.scale(self.sx, self.sy, **kwargs)
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        state.transform(self.sx, 0.0, 0.0, self.sy, 0.0, 0.0)
+        return None
+
 
 class Translate(DrawingObject):
     def __init__(self, tx: float, ty: float):
@@ -429,11 +1038,19 @@ class Translate(DrawingObject):
     def _draw(self, impl: Any, **kwargs: Any) -> None:
         impl.translate(self.tx, self.ty, **kwargs)
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        state.transform(1.0, 0.0, 0.0, 1.0, self.tx, self.ty)
+        return None
+
 
 class ResetTransform(DrawingObject):
     def _draw(self, impl: Any, **kwargs: Any) -> None:
         impl.reset_transform(**kwargs)
 
+    def _extent(self, state: _DrawState) -> Extent | None:
+        state.matrix = _IDENTITY
+        return None
+
 
 #######################################################################################
 # Drawing Contexts
@@ -448,18 +1065,302 @@ class Context(DrawingObject):
     or use :any:`Canvas.context` to access the root context of the canvas.
     """
 
-    def __init__(self, canvas: toga.Canvas, **kwargs: Any):
+    def __init__(self, canvas: toga.Canvas, cache: bool = False, **kwargs: Any):
         # kwargs used to support multiple inheritance
         super().__init__(**kwargs)
         self._canvas = canvas
         self.drawing_objects: list[DrawingObject] = []
 
+        #: Should the content of the context be rendered into an offscreen image, and
+        #: the image used to draw the context? See :meth:`Context.Context`.
+        self.cache = cache
+        # A counter that changes whenever the content of the context changes, the
+        # backend's cached rendering of the context, and the key it was rendered for.
+        self._version = 0
+        self._cache: Any = None
+        self._cache_key: tuple | None = None
+        # The compiled program for the context, and the version it was compiled for.
+        self._program: list = []
+        self._program_version = -1
+        # A counter that changes whenever the extent of any of the drawing objects in
+        # the context changes.
+        self._layout = 0
+        # The spatial index of the drawing objects in the context, and the version and
+        # layout it was built for.
+        self._index: _HitIndex | None = None
+        self._index_key: tuple[int, int] | None = None
+
+        # The context that contains this context.
+        self._parent: Context | None = None
+        # The draw state at the start of the context, and after the last of its
+        # drawing objects, as of the last time the extent of the context was computed.
+        # These are None if the context isn't part of a canvas.
+        self._entry: _DrawState | None = None
+        self._end: _DrawState | None = None
+        # The extent of the region painted by the drawing objects of the context; by
+        # the operations that finish the context; and by the context as a whole.
+        self._body: Extent | None = None
+        self._finished: Extent | None = None
+        self._painted: Extent | None = None
+        # The extent of the current path at the end of the context.
+        self._exit_path: Extent | None = None
+
     def _draw(self, impl: Any, **kwargs: Any) -> None:
+        if isinstance(impl, _Recorder):
+            impl.record_context(self, kwargs)
+            return
+        if self.cache and self._draw_cached(impl, kwargs):
+            return
+        self._draw_content(impl, **kwargs)
+
+    def _draw_content(self, impl: Any, **kwargs: Any) -> None:
+        clip = self._canvas._clip
+        if clip is None or (self._end is not None and _contains(clip, self._painted)):
+            # Nothing in the context will be skipped, so the compiled program can be
+            # used.
+            self._run(impl, kwargs)
+        else:
+            self._draw_tree(impl, **kwargs)
+
+    def _draw_tree(self, impl: Any, **kwargs: Any) -> None:
+        """Draw the context by drawing each of its drawing objects in turn."""
         impl.push_context(**kwargs)
-        for obj in self.drawing_objects:
-            obj._draw(impl, **kwargs)
+        self._draw_children(impl, **kwargs)
         impl.pop_context(**kwargs)
 
+    def _compile(self, impl: Any) -> list:
+        """Compile the context into a program for a backend.
+
+        The program is a list of segments. Each segment is either a list of operations,
+        each of which is a (method name, args, kwargs) tuple describing a call on the
+        backend; or a (context, kwargs) tuple for a sub-context that must be drawn
+        separately, because it is drawn from a cache.
+
+        The program is only compiled again when the content of the context changes.
+        """
+        if self._program_version != self._version:
+            recorder = _Recorder(impl)
+            self._draw_tree(recorder)
+            self._program = recorder.program
+            self._program_version = self._version
+        return self._program
+
+    def _run(self, impl: Any, kwargs: dict[str, Any]) -> None:
+        """Draw the context by running its compiled program."""
+        draw_ops = getattr(impl, "draw_ops", None)
+        for segment in self._compile(impl):
+            if isinstance(segment, list):
+                if draw_ops is not None:
+                    draw_ops(segment, **kwargs)
+                else:
+                    # The backend can't run a list of operations itself
+                    _draw_ops(impl, segment, kwargs)
+            else:
+                context, context_kwargs = segment
+                context._draw(impl, **{**kwargs, **context_kwargs})
+
+    def _draw_cached(self, impl: Any, kwargs: dict[str, Any]) -> bool:
+        """Draw the context using the backend's cached rendering of the context.
+
+        :returns: ``False`` if the context can't be drawn from a cache.
+        """
+        draw_cached = getattr(impl, "draw_cached", None)
+        if (
+            draw_cached is None
+            or self._end is None
+            # The rendering can't reproduce the effect of a context on the path
+            or self._entry.path is not None
+            or self._exit_path is not None
+            or self._painted is None
+            or not all(isfinite(value) for value in self._painted)
+        ):
+            return False
+
+        region = _pixels(self._painted)
+        # The rendering depends on the content of the context, the transformation it
+        # starts with, and any arguments inherited from enclosing contexts.
+        root_kwargs = self._canvas._draw_kwargs
+        inherited = [
+            (name, value) for name, value in kwargs.items() if name not in root_kwargs
+        ]
+        key = (self._version, self._entry.matrix, region, inherited)
+        if key != self._cache_key:
+            self._cache = None
+            self._cache_key = key
+
+        self._cache = draw_cached(
+            self._cache, *region, partial(self._render, impl), **kwargs
+        )
+        return True
+
+    def _render(self, impl: Any, **kwargs: Any) -> None:
+        """Draw the entire content of the context, for a backend to cache."""
+        canvas = self._canvas
+        clip, canvas._clip = canvas._clip, None
+        try:
+            self._draw_content(impl, **kwargs)
+        finally:
+            canvas._clip = clip
+
+    def _objects_in(self, region: Extent, objects: list[DrawingObject]) -> None:
+        """Add the drawing objects that paint in a region of the canvas to a list, from
+        the topmost to the bottommost."""
+        # The operations that finish the context are drawn after its content.
+        if _touches(self._finished, region):
+            objects.append(self)
+
+        if self._index_key != (self._version, self._layout):
+            self._index = _HitIndex(self.drawing_objects)
+            self._index_key = (self._version, self._layout)
+        for index in self._index.search(region):
+            obj = self.drawing_objects[index]
+            if isinstance(obj, Context):
+                obj._objects_in(region, objects)
+            else:
+                objects.append(obj)
+
+    def _draw_children(self, impl: Any, **kwargs: Any) -> None:
+        clip = self._canvas._clip
+        if clip is None:
+            for obj in self.drawing_objects:
+                obj._draw(impl, **kwargs)
+        else:
+            for obj in self.drawing_objects:
+                if not obj._clipped(clip):
+                    obj._draw(impl, **kwargs)
+
+    ###########################################################################
+    # Extents
+    ###########################################################################
+
+    def _begin(self, state: _DrawState) -> Extent | None:
+        """Apply the operations that start the context to a draw state."""
+        return None
+
+    def _finish(self, state: _DrawState) -> Extent | None:
+        """Apply the operations that finish the context to a draw state."""
+        return None
+
+    def _apply(self, state: _DrawState) -> bool:
+        # The extent of a context depends on the drawing objects it contains, so it is
+        # always computed again; the extents of unmodified objects are reused.
+        version = self._version
+        self._extent(state)
+        return self._version != version
+
+    def _extent(self, state: _DrawState) -> Extent | None:
+        self._entry = state.copy()
+        matrix, margin, text = state.matrix, state.margin, state.text
+
+        modified = self._extent_revision != self._revision
+        self._extent_revision = self._revision
+        moved = False
+        body = self._begin(state)
+        for obj in self.drawing_objects:
+            painted = obj._painted
+            modified |= obj._apply(state)
+            moved |= obj._painted != painted
+            body = _union(body, obj._painted)
+        if modified:
+            # Any cached rendering of the context is no longer valid. The rendering
+            # doesn't depend on the state the context starts in; the transformation
+            # and inherited arguments are part of the key of the cached rendering.
+            self._version += 1
+        if moved:
+            self._layout += 1
+        self._body = body
+        self._end = state.copy()
+        self._finished = self._finish(state)
+        self._painted = _union(body, self._finished)
+        self._exit_path = state.path
+
+        # The transformation is saved and restored by the context; the path isn't.
+        state.matrix, state.margin, state.text = matrix, margin, text
+        return self._painted
+
+    def _refinish(self) -> Extent | None:
+        """Recompute the extent of the operations that finish the context, after a
+        change to the end state of the context.
+
+        :returns: The extent of the damaged region.
+        """
+        state = self._end.copy()
+        finished = self._finish(state)
+        damage = _union(self._finished, finished)
+        self._finished = finished
+        self._painted = _union(self._body, finished)
+        self._exit_path = state.path
+        return damage
+
+    def _clipped(self, clip: Extent) -> bool:
+        # A context can only be skipped if it paints nothing in the clipped region,
+        # and it neither uses nor leaves behind a path.
+        return (
+            self._end is not None
+            and self._entry.path is None
+            and self._exit_path is None
+            and not _intersects(self._painted, clip)
+        )
+
+    def _invalidate(self, damage: Extent | None, exit_path: Extent | None) -> None:
+        """Propagate a change in the extent of this context to the contexts that contain
+        it, and redraw the damaged region of the canvas.
+
+        :param damage: The extent of the region affected by the change.
+        :param exit_path: The extent of the path at the end of the context before the
+            change.
+        """
+        context = self
+        while (parent := context._parent) is not None:
+            parent._version += 1
+            if parent._end is None:
+                # The context isn't part of a canvas
+                return
+
+            parent_exit_path = parent._exit_path
+            if context._exit_path != exit_path:
+                # The change affects the path used by the rest of the parent.
+                if parent.drawing_objects[-1] is context:
+                    parent._end.path = context._exit_path
+                    damage = _union(damage, parent._refinish())
+                else:
+                    damage = _union(damage, parent._recompute())
+
+            # The cached extents of the parent must contain the damaged region.
+            parent._body = _union(parent._body, damage)
+            parent._painted = _union(parent._painted, damage)
+            exit_path = parent_exit_path
+            context = parent
+
+        if context is self._canvas._context:
+            self._canvas._redraw_region(damage)
+
+    def _recompute(self) -> Extent | None:
+        """Recompute the extent of the context from its entry state.
+
+        :returns: The extent of the damaged region.
+        """
+        painted = self._painted
+        return _union(painted, self._extent(self._entry.copy()))
+
+    def _refresh(self) -> None:
+        """Recompute the extent of the context, and redraw the damaged region."""
+        if self._entry is not None:
+            exit_path = self._exit_path
+            self._invalidate(self._recompute(), exit_path)
+
+    def _adopt(self, obj: DrawingObject) -> None:
+        self._version += 1
+        if isinstance(obj, Context):
+            obj._parent = self
+
+    def _disown(self, obj: DrawingObject) -> None:
+        self._version += 1
+        if isinstance(obj, Context) and obj._parent is self:
+            obj._parent = None
+            obj._entry = obj._end = None
+            obj._cache = obj._cache_key = None
+
     ###########################################################################
     # Methods to keep track of the canvas, automatically redraw it
     ###########################################################################
@@ -470,8 +1371,13 @@ class Context(DrawingObject):
         return self._canvas
 
     def redraw(self) -> None:
-        """Calls :any:`Canvas.redraw` on the parent Canvas."""
-        self.canvas.redraw()
+        """Redraw the region of the canvas covered by this context.
+
+        The region is computed from the content of the context before and after any
+        modifications, so this should be called after modifying the properties of any
+        drawing object in the context.
+        """
+        self._refresh()
 
     ###########################################################################
     # Operations on drawing objects
@@ -491,7 +1397,16 @@ class Context(DrawingObject):
         :param obj: The drawing object to add to the context.
         """
         self.drawing_objects.append(obj)
-        self.redraw()
+        self._adopt(obj)
+        if self._end is not None:
+            # Extend the extent of the context from its end state.
+            exit_path = self._exit_path
+            state = self._end.copy()
+            obj._apply(state)
+            painted = obj._painted
+            self._end = state
+            self._body = _union(self._body, painted)
+            self._invalidate(_union(painted, self._refinish()), exit_path)
 
     def insert(self, index: int, obj: DrawingObject) -> None:
         """Insert a drawing object into the context at a specific index.
@@ -499,8 +1414,30 @@ class Context(DrawingObject):
         :param index: The index at which the drawing object should be inserted.
         :param obj: The drawing object to add to the context.
         """
+        if index < 0:
+            index = max(len(self.drawing_objects) + index, 0)
+        if index >= len(self.drawing_objects):
+            self.append(obj)
+            return
+
+        following = self.drawing_objects[index]
         self.drawing_objects.insert(index, obj)
-        self.redraw()
+        self._adopt(obj)
+        if (
+            self._end is not None
+            and isinstance(obj, Context)
+            and isinstance(following, Context)
+        ):
+            # The context starts in the state the following context started in. If
+            # it doesn't change the path, it doesn't affect any other object.
+            obj._apply(following._entry.copy())
+            painted = obj._painted
+            if obj._exit_path == obj._entry.path:
+                self._body = _union(self._body, painted)
+                self._painted = _union(self._painted, painted)
+                self._invalidate(painted, self._exit_path)
+                return
+        self._refresh()
 
     def remove(self, obj: DrawingObject) -> None:
         """Remove a drawing object from the context.
@@ -508,12 +1445,27 @@ class Context(DrawingObject):
         :param obj: The drawing object to remove.
         """
         self.drawing_objects.remove(obj)
-        self.redraw()
+        if (
+            self._end is not None
+            and isinstance(obj, Context)
+            and obj._end is not None
+            and obj._exit_path == obj._entry.path
+        ):
+            # The context doesn't affect any other object; only the region it
+            # painted needs to be redrawn.
+            painted = obj._painted
+            self._disown(obj)
+            self._invalidate(painted, self._exit_path)
+        else:
+            self._disown(obj)
+            self._refresh()
 
     def clear(self) -> None:
         """Remove all drawing objects from the context."""
+        for obj in self.drawing_objects:
+            self._disown(obj)
         self.drawing_objects.clear()
-        self.redraw()
+        self._refresh()
 
     ###########################################################################
     # Path manipulation
@@ -702,6 +1654,62 @@ class Context(DrawingObject):
         self.append(rect)
         return rect
 
+    def polyline(self, xs: Any, ys: Any) -> Polyline:
+        """Draw a series of connected line segments in the canvas context.
+
+        This moves to the first point, then draws a line to each of the following
+        points. It is equivalent to calling :meth:`~Context.move_to` and
+        :meth:`~Context.line_to` for each point, but the points are stored in a single
+        drawing object, and drawn in a single operation.
+
+        :param xs: The x coordinates of the points. This can be any sequence of
+            numbers, or an object that supports the buffer protocol (such as a NumPy
+            array).
+        :param ys: The y coordinates of the points. There must be the same number of
+            y coordinates as x coordinates.
+        :returns: The ``Polyline`` :any:`DrawingObject` for the operation.
+        :raises ValueError: If ``xs`` and ``ys`` have different lengths.
+        """
+        polyline = Polyline(xs, ys)
+        self.append(polyline)
+        return polyline
+
+    def points(self, xs: Any, ys: Any, size: float = 1.0) -> Points:
+        """Draw a square centered on each of a series of points in the canvas context.
+
+        This can be used to draw point clouds, such as scatter plots.
+
+        :param xs: The x coordinates of the points. This can be any sequence of
+            numbers, or an object that supports the buffer protocol (such as a NumPy
+            array).
+        :param ys: The y coordinates of the points. There must be the same number of
+            y coordinates as x coordinates.
+        :param size: The width and height of each square.
+        :returns: The ``Points`` :any:`DrawingObject` for the operation.
+        :raises ValueError: If ``xs`` and ``ys`` have different lengths.
+        """
+        points = Points(xs, ys, size)
+        self.append(points)
+        return points
+
+    def rects(self, xs: Any, ys: Any, widths: Any, heights: Any) -> Rects:
+        """Draw a series of rectangles in the canvas context.
+
+        :param xs: The horizontal coordinates of the left of the rectangles. This can be
+            any sequence of numbers, or an object that supports the buffer protocol
+            (such as a NumPy array).
+        :param ys: The vertical coordinates of the top of the rectangles.
+        :param widths: The widths of the rectangles. This can be a sequence, or a
+            single number that is used for every rectangle.
+        :param heights: The heights of the rectangles. This can be a sequence, or a
+            single number that is used for every rectangle.
+        :returns: The ``Rects`` :any:`DrawingObject` for the operation.
+        :raises ValueError: If the sequences have different lengths.
+        """
+        rects = Rects(xs, ys, widths, heights)
+        self.append(rects)
+        return rects
+
     def fill(
         self,
         color: str = BLACK,
@@ -828,16 +1836,22 @@ class Context(DrawingObject):
     ###########################################################################
 
     @contextmanager
-    def Context(self) -> Iterator[Context]:
+    def Context(self, cache: bool = False) -> Iterator[Context]:
         """Construct and yield a new sub-:class:`~toga.widgets.canvas.Context` within
         this context.
 
+        :param cache: Should the content of the context be rendered once into an
+            offscreen image, and that image used whenever the canvas is redrawn? This
+            can make drawing much faster for static parts of a drawing that contain
+            many drawing objects. The image is re-rendered automatically when the
+            content of the context changes. The image is only used if the backend
+            supports it, and if the context doesn't share a path with the context
+            that contains it.
         :yields: The new :class:`~toga.widgets.canvas.Context` object.
         """
-        context = Context(canvas=self._canvas)
+        context = Context(canvas=self._canvas, cache=cache)
         self.append(context)
         yield context
-        self.redraw()
 
     @contextmanager
     def ClosedPath(
@@ -1001,20 +2015,25 @@ class ClosedPathContext(Context):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(x={self.x}, y={self.y})"
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
+    def _draw_tree(self, impl: Any, **kwargs: Any) -> None:
         """Used by parent to draw all objects that are part of the context."""
         impl.push_context(**kwargs)
         impl.begin_path(**kwargs)
         if self.x is not None and self.y is not None:
-            impl.move_to(x=self.x, y=self.y, **kwargs)
+            impl.move_to(self.x, self.y, **kwargs)
 
         sub_kwargs = kwargs.copy()
-        for obj in self.drawing_objects:
-            obj._draw(impl, **sub_kwargs)
+        self._draw_children(impl, **sub_kwargs)
 
         impl.close_path(**kwargs)
         impl.pop_context(**kwargs)
 
+    def _begin(self, state: _DrawState) -> Extent | None:
+        state.path = None
+        if self.x is not None and self.y is not None:
+            state.add_points((self.x, self.y))
+        return None
+
 
 class FillContext(ClosedPathContext):
     """A drawing context that will apply a fill to any paths all objects in the
@@ -1057,16 +2076,15 @@ class FillContext(ClosedPathContext):
             f"color={self.color!r}, fill_rule={self.fill_rule})"
         )
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
+    def _draw_tree(self, impl: Any, **kwargs: Any) -> None:
         impl.push_context(**kwargs)
         impl.begin_path(**kwargs)
         if self.x is not None and self.y is not None:
-            impl.move_to(x=self.x, y=self.y, **kwargs)
+            impl.move_to(self.x, self.y, **kwargs)
 
         sub_kwargs = kwargs.copy()
         sub_kwargs.update(fill_color=self.color, fill_rule=self.fill_rule)
-        for obj in self.drawing_objects:
-            obj._draw(impl, **sub_kwargs)
+        self._draw_children(impl, **sub_kwargs)
 
         # Fill passes fill_rule to its children; but that is also a valid argument for
         # fill(), so if a fill context is a child of a fill context, there's an argument
@@ -1078,6 +2096,13 @@ class FillContext(ClosedPathContext):
 
         impl.pop_context(**kwargs)
 
+    def _begin(self, state: _DrawState) -> Extent | None:
+        state.text = True
+        return super()._begin(state)
+
+    def _finish(self, state: _DrawState) -> Extent | None:
+        return state.paint()
+
     @property
     def color(self) -> Color:
         """The fill color."""
@@ -1130,19 +2155,18 @@ class StrokeContext(ClosedPathContext):
             f"line_width={self.line_width}, line_dash={self.line_dash!r})"
         )
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
+    def _draw_tree(self, impl: Any, **kwargs: Any) -> None:
         impl.push_context(**kwargs)
         impl.begin_path(**kwargs)
 
         if self.x is not None and self.y is not None:
-            impl.move_to(x=self.x, y=self.y, **kwargs)
+            impl.move_to(self.x, self.y, **kwargs)
 
         sub_kwargs = kwargs.copy()
         sub_kwargs["stroke_color"] = self.color
         sub_kwargs["line_width"] = self.line_width
         sub_kwargs["line_dash"] = self.line_dash
-        for obj in self.drawing_objects:
-            obj._draw(impl, **sub_kwargs)
+        self._draw_children(impl, **sub_kwargs)
 
         # Stroke passes line_width and line_dash to its children; but those two are also
         # valid arguments for stroke, so if a stroke context is a child of stroke
@@ -1155,6 +2179,14 @@ class StrokeContext(ClosedPathContext):
 
         impl.pop_context(**kwargs)
 
+    def _begin(self, state: _DrawState) -> Extent | None:
+        state.text = True
+        state.margin = self.line_width
+        return super()._begin(state)
+
+    def _finish(self, state: _DrawState) -> Extent | None:
+        return state.paint(self.line_width)
+
     @property
     def color(self) -> Color:
         """The color of the stroke."""
@@ -1239,7 +2271,19 @@ class Canvas(Widget):
 
         super().__init__(id=id, style=style)
 
+        # The region of the canvas that is being drawn, if the canvas is only being
+        # partially drawn.
+        self._clip: Extent | None = None
+        # The names of the arguments passed to every drawing operation by the backend.
+        self._draw_kwargs: Collection[str] = ()
+        # The number of active hold_redraw() blocks.
+        self._redraw_held = 0
+        # The region that needs to be redrawn once redraws are no longer being held,
+        # or when a scheduled redraw is performed.
+        self._damage: Extent | None = None
+        self._redraw_scheduled = False
         self._context = Context(canvas=self)
+        self._context._extent(_DrawState(self))
 
         # Create a platform specific implementation of Canvas
         self._impl = self.factory.Canvas(interface=self)
@@ -1280,17 +2324,121 @@ class Canvas(Widget):
 
         The Canvas will be automatically redrawn after adding or removing a drawing
         object, or when the Canvas resizes. However, when you modify the properties of a
-        drawing object, you must call ``redraw`` manually.
+        drawing object, you must call ``redraw`` manually (or call
+        :meth:`~toga.widgets.canvas.Context.redraw` on the context that contains the
+        object, to only redraw the region covered by that context).
+
+        If the event loop is running, the redraw is performed on the next iteration of
+        the event loop, so that any number of redraws requested during an iteration of
+        the event loop only redraw the canvas once.
+        """
+        self._context._extent(_DrawState(self))
+        self._redraw_region(UNBOUNDED)
+
+    @contextmanager
+    def hold_redraw(self) -> Iterator[None]:
+        """Hold redraws while making a series of changes to the canvas.
+
+        Inside a ``with canvas.hold_redraw():`` block, adding, removing or redrawing
+        drawing objects doesn't redraw the canvas; the affected regions are collected.
+        When the outermost block exits, the canvas is redrawn once, covering every
+        region that was changed.
+        """
+        self._redraw_held += 1
+        try:
+            yield
+        finally:
+            self._redraw_held -= 1
+            if not self._redraw_held:
+                damage, self._damage = self._damage, None
+                self._redraw_region(damage)
+
+    @contextmanager
+    def frame(self) -> Iterator[Context]:
+        """Replace the entire content of the canvas, redrawing it once.
+
+        This clears the root context of the canvas, and yields it so that the new
+        content can be drawn; for example, to draw each frame of an animation::
+
+            with canvas.frame() as context:
+                context.rect(x, y, 10, 10)
+                context.fill()
+
+        Redraws are held (see :meth:`hold_redraw`) while the block is active, so the
+        canvas is only redrawn once, covering both the old and the new content.
+
+        :yields: The root context of the canvas.
         """
-        self._impl.redraw()
+        with self.hold_redraw():
+            self._context.clear()
+            yield self._context
+
+    def _redraw_region(self, extent: Extent | None) -> None:
+        """Request a redraw of the region of the canvas covered by an extent.
+
+        The request is combined with any other request that is being held, or that is
+        waiting for the next iteration of the event loop.
+        """
+        if extent is None:
+            # Nothing visible has changed.
+            return
+
+        if self._redraw_held or self._redraw_scheduled:
+            self._damage = _union(self._damage, extent)
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without an event loop, there's no "next iteration" to defer to.
+            self._redraw_native(extent)
+        else:
+            self._damage = extent
+            self._redraw_scheduled = True
+            loop.call_soon(self._flush_redraw)
+
+    def _flush_redraw(self) -> None:
+        """Perform a scheduled redraw."""
+        self._redraw_scheduled = False
+        if not self._redraw_held:
+            damage, self._damage = self._damage, None
+            if damage is not None:
+                self._redraw_native(damage)
+
+    def _redraw_native(self, extent: Extent) -> None:
+        """Ask the backend to redraw the region of the canvas covered by an extent."""
+        redraw_rect = getattr(self._impl, "redraw_rect", None)
+        if redraw_rect is None or not all(isfinite(value) for value in extent):
+            self._impl.redraw()
+        else:
+            redraw_rect(*_pixels(extent))
 
-    def Context(self) -> ContextManager[Context]:
+    def _draw(self, impl: Any, clip: Extent | None = None, **kwargs: Any) -> None:
+        """Draw the content of the canvas.
+
+        :param impl: The backend implementation to draw with.
+        :param clip: The region of the canvas that is being drawn, as a (left, top,
+            right, bottom) tuple. Contexts that don't paint anything in this region are
+            skipped. Defaults to drawing the entire canvas.
+        :param kwargs: The arguments to pass to every drawing operation.
+        """
+        self._clip = clip
+        self._draw_kwargs = kwargs.keys()
+        try:
+            self._context._draw(impl, **kwargs)
+        finally:
+            self._clip = None
+
+    def Context(self, cache: bool = False) -> ContextManager[Context]:
         """Construct and yield a new sub-:class:`~toga.widgets.canvas.Context` within
         the root context of this Canvas.
 
+        :param cache: Should the content of the context be rendered once into an
+            offscreen image? See :meth:`Context.Context()
+            <toga.widgets.canvas.Context.Context>`.
         :yields: The new :class:`~toga.widgets.canvas.Context` object.
         """
-        return self.context.Context()
+        return self.context.Context(cache=cache)
 
     def ClosedPath(
         self,
@@ -1443,6 +2591,54 @@ class Canvas(Widget):
     def on_alt_drag(self, handler: OnTouchHandler) -> None:
         self._on_alt_drag = wrapped_handler(self, handler)
 
+    ###########################################################################
+    # Hit testing
+    ###########################################################################
+
+    def objects_at(self, x: float, y: float) -> list[DrawingObject]:
+        """Find the drawing objects that paint at a point on the canvas.
+
+        This can be used in a touch handler to find the object that was touched. The
+        objects that paint are those that fill or stroke a path, or write text:
+        :class:`~toga.widgets.canvas.Fill`, :class:`~toga.widgets.canvas.Stroke` and
+        :class:`~toga.widgets.canvas.WriteText` objects, and fill and stroke contexts.
+
+        Objects are found using the bounding box of the region they paint, so an
+        object may be found at a point that is inside its bounding box, but outside
+        its shape (for example, near the corners of a circle).
+
+        :param x: X coordinate, relative to the left edge of the canvas.
+        :param y: Y coordinate, relative to the top edge of the canvas.
+        :returns: The drawing objects, from the topmost (the last to be drawn) to the
+            bottommost.
+        """
+        return self.objects_in(x, y, 0, 0)
+
+    def objects_in(
+        self, x: float, y: float, width: float, height: float
+    ) -> list[DrawingObject]:
+        """Find the drawing objects that paint in a rectangular region of the canvas.
+
+        An object is found if the bounding box of the region it paints intersects the
+        rectangle. See :meth:`objects_at` for the objects that can be found.
+
+        :param x: The horizontal coordinate of the left of the rectangle.
+        :param y: The vertical coordinate of the top of the rectangle.
+        :param width: The width of the rectangle.
+        :param height: The height of the rectangle.
+        :returns: The drawing objects, from the topmost (the last to be drawn) to the
+            bottommost.
+        """
+        region = (
+            min(x, x + width),
+            min(y, y + height),
+            max(x, x + width),
+            max(y, y + height),
+        )
+        objects: list[DrawingObject] = []
+        self._context._objects_in(region, objects)
+        return objects
+
     ###########################################################################
     # Text measurement
     ###########################################################################
@@ -1665,6 +2861,94 @@ class Canvas(Widget):
         return self.Stroke(color=color, line_width=line_width, line_dash=line_dash)
 
 
+class OffscreenCanvas:
+    def __init__(self, width: int, height: int):
+        """Create a new offscreen canvas.
+
+        An offscreen canvas has the same drawing API as :class:`~toga.Canvas`, but
+        rather than being displayed in a window, it is rendered into an image or a
+        file. It doesn't require an app or a window to exist, so it can be used to
+        render images in scripts and batch jobs.
+
+        An offscreen canvas can be created, drawn and rendered on any thread, so
+        rendering can be spread across a pool of worker threads; however, each
+        offscreen canvas should only be used by one thread at a time.
+
+        :param width: The width of the rendered image, in CSS pixels.
+        :param height: The height of the rendered image, in CSS pixels.
+        """
+        #: The width of the rendered image, in CSS pixels.
+        self.width = width
+        #: The height of the rendered image, in CSS pixels.
+        self.height = height
+
+        self.factory = get_platform_factory()
+        self._clip: Extent | None = None
+        self._draw_kwargs: Collection[str] = ()
+        self._context = Context(canvas=self)
+        self._context._extent(_DrawState(self))
+
+        # Create a platform specific implementation of the offscreen canvas
+        self._impl = self.factory.OffscreenCanvas(interface=self)
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """The size of the rendered image, as a ``(width, height)`` tuple."""
+        return self.width, self.height
+
+    # The drawing API is the same as that of a Canvas widget.
+    context = Canvas.context
+    Context = Canvas.Context
+    ClosedPath = Canvas.ClosedPath
+    Fill = Canvas.Fill
+    Stroke = Canvas.Stroke
+    objects_at = Canvas.objects_at
+    objects_in = Canvas.objects_in
+    measure_text = Canvas.measure_text
+    _draw = Canvas._draw
+
+    def redraw(self) -> None:
+        """Update the canvas after the properties of drawing objects have been modified.
+
+        The content of an offscreen canvas is only drawn when it is rendered, but
+        changes to the properties of drawing objects will only be used once ``redraw``
+        has been called.
+        """
+        self._context._extent(_DrawState(self))
+
+    def _redraw_region(self, extent: Extent | None) -> None:
+        # There's no display to update.
+        pass
+
+    def as_image(self, format: type[ImageT] = toga.Image) -> ImageT:
+        """Render the canvas as an image.
+
+        :param format: Format to provide. Defaults to :class:`~toga.images.Image`; also
+            supports :any:`PIL.Image.Image` if Pillow is installed, as well as any image
+            types defined by installed :doc:`image format plugins
+            </reference/plugins/image_formats>`
+        :returns: The canvas as an image of the specified type.
+        """
+        return toga.Image(self._impl.get_image_data()).as_format(format)
+
+    def save(self, path: str | Path) -> None:
+        """Render the canvas, and save it to a file.
+
+        The file format is determined by the extension of the filename. Any image
+        format supported by :meth:`toga.Image.save` can be used. On backends that can
+        render vector graphics, the canvas can also be saved as a PDF (``.pdf``) or SVG
+        (``.svg``) file, preserving the drawing operations rather than their rendered
+        pixels.
+
+        :param path: The path to save the file to.
+        """
+        path = Path(path)
+        if path.suffix.lower() in getattr(self._impl, "VECTOR_FORMATS", ()):
+            self._impl.save_vector(path)
+        else:
+            self.as_image().save(path)
+
+
 def sweepangle(startangle: float, endangle: float, anticlockwise: bool) -> float:
     """Returns an arc length in the range [-2 * pi, 2 * pi], where positive numbers are
     clockwise. Based on the "ellipse method steps" in the HTML spec."""
@@ -3,6 +3,7 @@ from __future__ import annotations
 import warnings
 from builtins import id as identifier
 from collections.abc import Coroutine, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -365,6 +366,19 @@ class Window:
         # Update the geometry of the widget
         widget.refresh()
 
+    @contextmanager
+    def batch_update(self) -> Iterator[Window]:
+        """Group a series of changes to the widgets in the window into a single
+        layout.
+
+        Inside a ``with window.batch_update():`` block, changes to widgets (such as
+        adding children, or changing style properties) don't cause the layout of the
+        window to be recomputed. When the block exits, the content of the window is
+        laid out once. See :meth:`toga.Widget.deferred_layout`.
+        """
+        with toga.Widget.deferred_layout():
+            yield self
+
     @property
     def widgets(self) -> FilteredWidgetRegistry:
         """The widgets contained in the window.
@@ -834,7 +848,7 @@ class MainWindow(Window):
         # change listener immediately, and trigger the creation of menus and
         # toolbars.
         if self.app.commands.on_change:
-            self._toolbar.on_change = self._impl.create_toolbar
+            self._toolbar.on_change = self._update_toolbar
 
             self._impl.create_menus()
             self._impl.create_toolbar()
@@ -844,6 +858,10 @@ class MainWindow(Window):
         """Toolbar for the window."""
         return self._toolbar
 
+    def _update_toolbar(self, **kwargs: Any) -> None:
+        # Toolbars are small; they're rebuilt whenever they change.
+        self._impl.create_toolbar()
+
 
 class DocumentMainWindow(Window):
     _WINDOW_CLASS = "DocumentMainWindow"
@@ -585,6 +585,34 @@ def test_startup_subclass(event_loop):
     assert app._impl.n_menu_items == 4
 
 
+def test_menu_updates(app):
+    """Changes to the app's commands after startup update the menus."""
+    EventLog.reset()
+    cmd = toga.Command(None, "New command", group=toga.Group.EDIT)
+    with app.commands.batch():
+        app.commands.add(cmd)
+        app.commands.add(toga.Command(None, "Another command", group=toga.Group.EDIT))
+
+    # The menus are updated once, rather than being rebuilt.
+    assert_action_not_performed(app, "create App menus")
+    [update] = EventLog.performed_actions(app, "update App menus")
+    change = update["change"]
+    assert change.added[0] is cmd
+    assert change.added_groups == [toga.Group.EDIT]
+    assert change.groups == {toga.Group.EDIT, None}
+    assert app._impl.n_menu_items == len(app.commands)
+
+
+def test_menu_rebuild(app, monkeypatch):
+    """Backends that can't update menus in place rebuild them."""
+    monkeypatch.delattr(type(app._impl), "update_menus")
+    EventLog.reset()
+    app.commands.add(toga.Command(None, "New command"))
+
+    assert_action_performed(app, "create App menus")
+    assert_action_not_performed(app, "update App menus")
+
+
 def test_startup_subclass_no_main_window(event_loop):
     """If a subclassed app doesn't define a main window, an error is raised."""
 
@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+import pytest
+
+import toga
+from toga.tracing import StartupTrace
+
+
+def create_app(**kwargs):
+    return toga.App(
+        formal_name="Test App",
+        app_id="org.example.test",
+        startup=lambda app: toga.Box(children=[toga.Label("Hello")]),
+        **kwargs,
+    )
+
+
+def test_not_traced(event_loop, monkeypatch):
+    """Startup isn't traced unless requested."""
+    monkeypatch.delenv("TOGA_STARTUP_TRACE", raising=False)
+    app = create_app()
+    assert app.startup_trace is None
+
+
+async def test_trace(monkeypatch):
+    """The phases of startup are traced, until the app is running."""
+    monkeypatch.setenv("TOGA_STARTUP_TRACE", "1")
+    on_running = []
+    app = create_app(
+        on_running=lambda app, **kwargs: on_running.append(app.startup_trace.end)
+    )
+
+    trace = toga.App.app.startup_trace
+    assert isinstance(trace, StartupTrace)
+    assert trace.path is None
+    assert trace.end is None
+
+    # The dummy backend starts the app when the implementation is created.
+    assert [phase.name for phase in trace.phases] == [
+        "metadata",
+        "get_platform_factory",
+        "Paths",
+        "icon",
+        "create_app_commands",
+        "first layout",
+        "startup",
+        "create_initial_windows",
+        "create_menus",
+        "create_toolbars",
+        "_startup",
+        "_create_impl",
+        "App.__init__",
+    ]
+    # Phases are nested inside the phases that contain them.
+    assert trace["App.__init__"].start == trace.start
+    for outer, inner in [
+        ("App.__init__", "metadata"),
+        ("_create_impl", "_startup"),
+        ("_startup", "startup"),
+        ("startup", "first layout"),
+    ]:
+        assert trace[outer].start <= trace[inner].start
+        assert trace[inner].end <= trace[outer].end
+    assert all(phase.duration >= 0 for phase in trace.phases)
+    with pytest.raises(KeyError):
+        trace["unknown"]
+
+    # Layout passes are recorded until the app is running.
+    app.main_window.content.add(toga.Label("World"))
+    assert trace.phases[-1].name == "layout"
+
+    await asyncio.sleep(0)
+    assert on_running == [None]
+    assert trace.end >= trace.phases[-1].end
+    count = len(trace.phases)
+
+    app.main_window.content.add(toga.Label("Again"))
+    assert len(trace.phases) == count
+
+
+async def test_chrome_trace(monkeypatch, tmp_path):
+    """A trace can be written in Chrome trace event format."""
+    path = tmp_path / "trace.json"
+    monkeypatch.setenv("TOGA_STARTUP_TRACE", str(path))
+    app = create_app()
+    trace = app.startup_trace
+    assert trace.path == path
+    assert not path.exists()
+
+    # The trace is written when the app is running.
+    await asyncio.sleep(0)
+    content = json.loads(path.read_text(encoding="utf-8"))
+    assert content == trace.as_chrome_trace()
+
+    events = content["traceEvents"]
+    assert len(events) == len(trace.phases) + 1
+    # Events are sorted by start time, with enclosing phases first.
+    assert events[0]["name"] == "App.__init__"
+    assert events[0]["ts"] == 0
+    assert [event["ts"] for event in events] == sorted(event["ts"] for event in events)
+
+    startup = next(event for event in events if event["name"] == "startup")
+    assert startup["ph"] == "X"
+    assert startup["cat"] == "toga.startup"
+    assert startup["dur"] == round(trace["startup"].duration * 1e6, 3)
+
+    assert events[-1]["name"] == "running"
+    assert events[-1]["ph"] == "i"
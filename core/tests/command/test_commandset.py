@@ -144,7 +144,8 @@ def test_add_by_existing_id(change_handler):
     assert cmd_a in cs
     assert cs["custom-command-a"] == cmd_a
     # Change handler was invoked
-    change_handler.assert_called_once_with()
+    change_handler.assert_called_once()
+    assert change_handler.call_args.kwargs["change"].added == [cmd_a]
 
 
 @pytest.mark.parametrize("change_handler", [(None), (Mock())])
@@ -217,7 +218,10 @@ def test_delitem(change_handler):
     assert cmd_a not in cs
     # Change handler was invoked
     if change_handler:
-        change_handler.assert_called_once_with()
+        change_handler.assert_called_once()
+        change = change_handler.call_args.kwargs["change"]
+        assert change.removed == [cmd_a]
+        assert change.added == []
 
 
 @pytest.mark.parametrize("change_handler", [(None), (Mock())])
@@ -264,7 +268,10 @@ def test_discard(change_handler):
     assert cmd_a not in cs
     # Change handler was invoked
     if change_handler:
-        change_handler.assert_called_once_with()
+        change_handler.assert_called_once()
+        change = change_handler.call_args.kwargs["change"]
+        assert change.removed == [cmd_a]
+        assert change.added == []
 
 
 @pytest.mark.parametrize("change_handler", [(None), (Mock())])
@@ -310,7 +317,10 @@ def test_remove(change_handler):
     assert cmd_a not in cs
     # Change handler was invoked
     if change_handler:
-        change_handler.assert_called_once_with()
+        change_handler.assert_called_once()
+        change = change_handler.call_args.kwargs["change"]
+        assert change.removed == [cmd_a]
+        assert change.added == []
 
 
 @pytest.mark.parametrize("change_handler", [(None), (Mock())])
@@ -451,3 +461,163 @@ def test_ordering(
             Separator(group=parent_group_2),
             command_f,
         ]
+
+        # The content of each menu can be retrieved without sorting the whole set.
+        assert cs.group_items(None) == [parent_group_1, parent_group_2]
+        assert cs.group_items(parent_group_1) == [
+            command_z,
+            child_group_1,
+            command_v,
+            child_group_2,
+            command_s,
+        ]
+        assert cs.group_items(child_group_1) == [
+            command_y,
+            command_x,
+            command_w,
+            Separator(group=child_group_1),
+            command_b,
+        ]
+        assert cs.group_items(parent_group_2) == [
+            child_group_5,
+            command_a,
+            Separator(group=parent_group_2),
+            child_group_4,
+            child_group_3,
+            Separator(group=parent_group_2),
+            command_f,
+        ]
+        assert cs.group_items(child_group_5) == [command_g]
+
+
+def test_group_items_removed(parent_group_1, child_group_1):
+    """Groups without commands aren't part of the menu of their parent."""
+    cs = CommandSet()
+    cmd_a = toga.Command(None, "A", group=parent_group_1)
+    cmd_b = toga.Command(None, "B", group=child_group_1)
+    cs.add(cmd_a, cmd_b)
+    assert cs.group_items(parent_group_1) == [cmd_a, child_group_1]
+
+    cs.discard(cmd_b)
+    assert cs.group_items(parent_group_1) == [cmd_a]
+    assert cs.group_items(child_group_1) == []
+
+    cs.clear()
+    assert cs.group_items(None) == []
+    assert cs.group_items(parent_group_1) == []
+
+
+def test_change_groups():
+    """Changes describe the commands and groups that were added and removed."""
+    change_handler = Mock()
+    cs = CommandSet(on_change=change_handler)
+    parent = toga.Group("Parent")
+    child = toga.Group("Child", parent=parent)
+    cmd_a = toga.Command(None, text="Command a", group=child)
+    cmd_b = toga.Command(None, text="Command b", group=parent)
+
+    cs.add(cmd_a)
+    change = change_handler.call_args.kwargs["change"]
+    assert change
+    assert change.added == [cmd_a]
+    assert change.removed == []
+    assert change.added_groups == [child, parent]
+    assert change.removed_groups == []
+    # The child group was added to the parent; the parent was added to the menu bar.
+    assert change.groups == {child, parent, None}
+
+    cs.add(cmd_b)
+    change = change_handler.call_args.kwargs["change"]
+    assert change.added == [cmd_b]
+    assert change.added_groups == []
+    assert change.groups == {parent}
+
+    cs.discard(cmd_a)
+    change = change_handler.call_args.kwargs["change"]
+    assert change.removed == [cmd_a]
+    assert change.removed_groups == [child]
+    assert change.groups == {child, parent}
+
+    cs.clear()
+    change = change_handler.call_args.kwargs["change"]
+    assert change.removed == [cmd_b]
+    assert change.removed_groups == [parent]
+    assert change.groups == {parent, None}
+    assert repr(change) == (
+        f"<CommandSetChange added=[] removed=[{cmd_b!r}] added_groups=[] "
+        f"removed_groups=[{parent!r}]>"
+    )
+
+
+def test_change_replace():
+    """Adding a command with the ID of an existing command replaces it; adding the
+    same command again isn't a change."""
+    change_handler = Mock()
+    cs = CommandSet(on_change=change_handler)
+    cmd_a = toga.Command(None, text="Command a", id="custom-command")
+    cmd_b = toga.Command(None, text="Command b", id="custom-command")
+    cs.add(cmd_a)
+
+    cs.add(cmd_a)
+    change = change_handler.call_args.kwargs["change"]
+    assert not change
+
+    cs.add(cmd_b)
+    change = change_handler.call_args.kwargs["change"]
+    assert change.added == [cmd_b]
+    assert change.removed == [cmd_a]
+    assert change.added_groups == []
+    assert list(cs) == [cmd_b]
+
+
+def test_batch():
+    """Changes made in a batch are notified once, when the batch ends."""
+    change_handler = Mock()
+    cs = CommandSet(on_change=change_handler)
+    cmd_a = toga.Command(None, text="Command a")
+    cmd_b = toga.Command(None, text="Command b")
+    cmd_c = toga.Command(None, text="Command c", group=toga.Group.HELP)
+    cs.add(cmd_a)
+    change_handler.reset_mock()
+
+    with cs.batch() as batch:
+        assert batch is cs
+        cs.add(cmd_b)
+        with cs.batch():
+            cs.add(cmd_c)
+            cs.discard(cmd_a)
+        # Nested batches don't notify changes.
+        change_handler.assert_not_called()
+
+        # Changes that are reverted in the same batch aren't reported.
+        cs.discard(cmd_c)
+        cs.add(cmd_a)
+        assert list(cs) == [cmd_a, cmd_b]
+
+    change_handler.assert_called_once()
+    change = change_handler.call_args.kwargs["change"]
+    assert change.added == [cmd_b]
+    assert change.removed == []
+    assert change.added_groups == []
+    assert change.removed_groups == []
+
+    # A batch without changes doesn't notify.
+    change_handler.reset_mock()
+    with cs.batch():
+        cs.discard(cmd_c)
+    change_handler.assert_not_called()
+
+
+def test_batch_exception():
+    """A batch that raises an exception notifies the changes it has made."""
+    change_handler = Mock()
+    cs = CommandSet(on_change=change_handler)
+    cmd_a = toga.Command(None, text="Command a")
+
+    with pytest.raises(ValueError):
+        with cs.batch():
+            cs.add(cmd_a)
+            raise ValueError()
+
+    change_handler.assert_called_once()
+    assert change_handler.call_args.kwargs["change"].added == [cmd_a]
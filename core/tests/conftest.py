@@ -1,18 +1,29 @@
+import os
 import sys
 
 import pytest
 
 import toga
+import toga.platform
 from toga import window as toga_window
 from toga_dummy.utils import EventLog
 
+# Read entry points without using the cache on disk, so that running the tests doesn't
+# write to the user's cache. This must be set before test modules are collected,
+# because some modules create widgets (and so load the platform factory) on import.
+os.environ["TOGA_ENTRY_POINT_CACHE"] = ""
+
 
 @pytest.fixture(autouse=True)
-def reset_global_state():
+def reset_global_state(monkeypatch):
     # Clear the testing event log
     EventLog.reset()
     # Reset the global window count
     toga_window._window_count = -1
+    # Clear the cache of decoded images
+    toga.Image.cache_clear()
+    # Read entry points afresh in each test
+    toga.platform._toga_entry_points.cache_clear()
 
 
 @pytest.fixture(autouse=True)
@@ -0,0 +1,262 @@
+import gc
+import tracemalloc
+from unittest.mock import Mock
+
+import pytest
+
+from toga.sources import ColumnarListSource, ColumnarRow, ListSource
+
+
+@pytest.fixture
+def source():
+    return ColumnarListSource(
+        data=[
+            {"val1": "first", "val2": 111},
+            {"val1": "second", "val2": 222},
+            ("third", 333),
+        ],
+        accessors=["val1", "val2"],
+    )
+
+
+def test_create(source):
+    """A columnar source stores data, but doesn't create rows until accessed."""
+    assert len(source) == 3
+    assert len(source._data._rows) == 0
+
+    row = source[0]
+    assert isinstance(row, ColumnarRow)
+    assert row.val1 == "first"
+    assert row.val2 == 111
+    assert source[-1].val1 == "third"
+
+    # Rows have a stable identity while they are alive.
+    assert source[0] is row
+
+
+def test_flat_data():
+    """Flat data is mapped onto the first accessor."""
+    source = ColumnarListSource(accessors=["val1", "val2"], data=["a", "b"])
+
+    assert source[1].val1 == "b"
+    with pytest.raises(AttributeError, match=r"no attribute 'val2'"):
+        source[1].val2
+
+
+def test_extra_attributes():
+    """Attributes that aren't accessors are stored as additional columns."""
+    source = ColumnarListSource(
+        accessors=["val1"],
+        data=[{"val1": "a"}, {"val1": "b", "extra": 42}],
+    )
+
+    assert source[1].extra == 42
+    with pytest.raises(AttributeError, match=r"no attribute 'extra'"):
+        source[0].extra
+
+    # An attribute can be added to an existing row
+    source[0].other = "new"
+    assert source[0].other == "new"
+    with pytest.raises(AttributeError, match=r"no attribute 'other'"):
+        source[1].other
+
+
+def test_repr(source):
+    """A columnar row has a helpful repr."""
+    row = source[0]
+    assert repr(row) == f"<Row {id(row):x} val1='first' val2=111>"
+
+    row = ColumnarRow()
+    assert repr(row) == f"<Row {id(row):x} (no attributes)>"
+
+
+def test_no_instance_dict(source):
+    """Columnar rows don't have an instance dictionary."""
+    row = source[0]
+    assert not hasattr(row, "__dict__")
+
+    # Backends can annotate a row with an implementation object
+    with pytest.raises(AttributeError):
+        row._impl
+    row._impl = "impl"
+    assert row._impl == "impl"
+
+    with pytest.raises(AttributeError):
+        row._unknown = 42
+
+
+def test_modify_row(source):
+    """Modifying a row notifies listeners."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    row = source[1]
+    row.val1 = "new value"
+    assert source[1].val1 == "new value"
+    listener.change.assert_called_once_with(item=row)
+
+    listener.reset_mock()
+    del row.val1
+    with pytest.raises(AttributeError):
+        row.val1
+    listener.change.assert_called_once_with(item=row)
+
+    with pytest.raises(AttributeError):
+        del row.val1
+
+
+def test_insert(source):
+    """Inserting a row moves the rows after it."""
+    listener = Mock()
+    source.add_listener(listener)
+    second = source[1]
+
+    row = source.insert(1, ("new", 999))
+
+    assert len(source) == 4
+    assert source[1] is row
+    assert source[2] is second
+    assert source.index(second) == 2
+    assert [r.val1 for r in source] == ["first", "new", "second", "third"]
+
+    listener.insert.assert_called_once_with(index=1, item=row)
+
+
+def test_insert_new_attribute(source):
+    """Inserting a row with a new attribute adds a column."""
+    source.insert(1, {"val1": "new", "extra": 42})
+
+    assert source[1].extra == 42
+    with pytest.raises(AttributeError):
+        source[2].extra
+
+
+def test_append_extend(source):
+    """Rows can be appended to the source."""
+    row = source.append(("fourth", 444))
+    rows = source.extend([("fifth", 555), {"val1": "sixth", "extra": 1}])
+
+    assert source[3] is row
+    assert source[4:] == rows
+    assert source[5].extra == 1
+
+
+def test_delete(source):
+    """Removing a row detaches it from the source."""
+    listener = Mock()
+    source.add_listener(listener)
+    row = source[1]
+    third = source[2]
+
+    source.remove(row)
+
+    assert len(source) == 2
+    assert source.index(third) == 1
+    listener.remove.assert_called_once_with(index=1, item=row)
+
+    # The removed row keeps its values, but no longer notifies the source
+    assert row.val1 == "second"
+    row.val1 = "changed"
+    assert row.val1 == "changed"
+    listener.change.assert_not_called()
+
+    with pytest.raises(ValueError, match=r"<Row .*> is not in list"):
+        source.index(row)
+
+    # Attributes of a detached row can be deleted
+    del row.val1
+    with pytest.raises(AttributeError):
+        del row.val1
+
+
+def test_delete_slice(source):
+    """Slices of rows can be deleted."""
+    source.extend([("fourth", 444), ("fifth", 555)])
+    last = source[4]
+
+    del source[1:3]
+    assert [r.val1 for r in source] == ["first", "fourth", "fifth"]
+    assert source.index(last) == 2
+
+    del source[::2]
+    assert [r.val1 for r in source] == ["fourth"]
+    assert last._index is None
+
+
+def test_set_item(source):
+    """Rows and slices of rows can be replaced."""
+    old = source[1]
+    source[1] = ("new", 1)
+    assert source[1].val1 == "new"
+    assert old.val1 == "second"
+
+    source[0:2] = [("a", 1), ("b", 2), ("c", 3)]
+    assert [r.val1 for r in source] == ["a", "b", "c", "third"]
+
+    source[::2] = [("x", 1), ("y", 2)]
+    assert [r.val1 for r in source] == ["x", "b", "y", "third"]
+
+    with pytest.raises(ValueError, match=r"attempt to assign sequence of size 1"):
+        source[::2] = [("z", 1)]
+
+
+def test_clear(source):
+    """Clearing the source detaches all rows."""
+    row = source[0]
+    source.clear()
+
+    assert len(source) == 0
+    assert row.val1 == "first"
+    with pytest.raises(IndexError):
+        source[0]
+
+    source.append(("new", 1))
+    assert source[0].val1 == "new"
+
+
+def test_find(source):
+    """Rows can be found by value."""
+    row = source.find({"val2": 222})
+    assert row.val1 == "second"
+    assert source.find("third", start=row) is source[2]
+
+
+def test_memory():
+    """A columnar source uses much less memory than a ListSource."""
+
+    def measure(source_class):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            source = source_class(accessors=["name", "count", "ratio"], data=data)
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(source) == len(data)
+        return size
+
+    data = [(f"item {i}", i * 1000, i / 2) for i in range(10000)]
+
+    row_size = measure(ListSource)
+    columnar_size = measure(ColumnarListSource)
+
+    # The values themselves are shared; the cost of a ListSource is dominated by
+    # the Row objects and their instance dictionaries.
+    assert columnar_size < row_size / 3
+
+
+def test_update(source):
+    """Multiple attributes of a row can be updated with a single notification."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    row = source[0]
+    row.update(val1="new", val2=1, extra=2, _impl="impl")
+    assert (row.val1, row.val2, row.extra, row._impl) == ("new", 1, 2, "impl")
+    listener.change.assert_called_once_with(item=row)
+
+    # A detached row can be updated
+    source.remove(row)
+    row.update(val1="newer")
+    assert row.val1 == "newer"
+    listener.change.assert_called_once_with(item=row)
@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import Mock, call
 
 import pytest
 
@@ -317,6 +318,33 @@ def test_append_positional(source):
     listener.insert.assert_called_once_with(index=3, item=row)
 
 
+def test_extend(source):
+    """You can append multiple items onto a list source with a single notification."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    rows = source.extend([("fourth", 444), dict(val1="fifth", val2=555)])
+
+    assert len(source) == 5
+    assert source[3:] == rows
+    assert rows[0].val1 == "fourth"
+    assert rows[1].val2 == 555
+
+    listener.insert_range.assert_called_once_with(index=3, items=rows)
+    listener.insert.assert_not_called()
+
+
+def test_extend_empty(source):
+    """Extending a list source with no items doesn't generate a notification."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    assert source.extend([]) == []
+
+    assert len(source) == 3
+    listener.insert_range.assert_not_called()
+
+
 def test_del(source):
     """You can delete an item from a list source by index."""
     listener = Mock()
@@ -336,6 +364,219 @@ def test_del(source):
     listener.remove.assert_called_once_with(item=row, index=1)
 
 
+def test_del_slice(source):
+    """You can delete a contiguous slice of a list source with a single
+    notification."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    rows = source[1:]
+    del source[1:]
+
+    assert len(source) == 1
+    assert source[0].val1 == "first"
+
+    listener.remove_range.assert_called_once_with(index=1, items=rows)
+    listener.remove.assert_not_called()
+
+
+def test_del_empty_slice(source):
+    """Deleting an empty slice doesn't generate a notification."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    del source[2:1]
+
+    assert len(source) == 3
+    listener.remove_range.assert_not_called()
+
+
+def test_del_extended_slice(source):
+    """Deleting an extended slice notifies each removal, highest index first."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    first, _, third = source[:]
+    del source[::2]
+
+    assert len(source) == 1
+    assert source[0].val1 == "second"
+
+    assert listener.remove.call_args_list == [
+        call(index=2, item=third),
+        call(index=0, item=first),
+    ]
+
+
+def test_set_slice(source):
+    """You can replace a contiguous slice of a list source."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    old_rows = source[0:2]
+    source[0:2] = [("new1", 1), ("new2", 2), ("new3", 3)]
+
+    assert len(source) == 4
+    assert [row.val1 for row in source] == ["new1", "new2", "new3", "third"]
+
+    listener.remove_range.assert_called_once_with(index=0, items=old_rows)
+    listener.insert_range.assert_called_once_with(index=0, items=source[0:3])
+
+
+def test_set_extended_slice(source):
+    """You can replace an extended slice of a list source."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    first, _, third = source[:]
+    source[::2] = [("new1", 1), ("new3", 3)]
+
+    assert [row.val1 for row in source] == ["new1", "second", "new3"]
+    assert listener.mock_calls == [
+        call.remove(index=0, item=first),
+        call.insert(index=0, item=source[0]),
+        call.remove(index=2, item=third),
+        call.insert(index=2, item=source[2]),
+    ]
+
+
+def test_set_extended_slice_bad_size(source):
+    """An extended slice must be replaced by the same number of items."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    with pytest.raises(ValueError):
+        source[::2] = [("new1", 1)]
+
+    assert len(source) == 3
+    assert listener.mock_calls == []
+
+
+def test_batch_insert(source):
+    """Inserts of adjacent rows in a batch are delivered as a single range."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    with source.batch():
+        new1 = source.append(("new1", 1))
+        new2 = source.append(("new2", 2))
+        # An insert at the start of the range also extends the range
+        new0 = source.insert(3, ("new0", 0))
+
+        # Nothing has been sent yet
+        assert listener.mock_calls == []
+
+    assert listener.mock_calls == [
+        call.insert_range(index=3, items=[new0, new1, new2]),
+    ]
+
+
+def test_batch_remove(source):
+    """Removals of adjacent rows in a batch are delivered as a single range."""
+    source.extend([("fourth", 444), ("fifth", 555)])
+    listener = Mock()
+    source.add_listener(listener)
+    rows = source[:]
+
+    with source.batch():
+        # Forward deletion
+        del source[1]
+        del source[1]
+        # Backward deletion
+        del source[0]
+
+    assert listener.mock_calls == [
+        call.remove_range(index=0, items=rows[0:3]),
+    ]
+
+    with source.batch():
+        # Removing by instance
+        source.remove(rows[3])
+        source.remove(rows[4])
+
+    assert listener.mock_calls[1:] == [
+        call.remove_range(index=0, items=rows[3:5]),
+    ]
+
+
+def test_batch_mixed(source):
+    """Notifications that can't be merged are delivered in order."""
+    listener = Mock()
+    source.add_listener(listener)
+    first, second, third = source[:]
+
+    with source.batch():
+        new = source.append(("new", 1))
+        second.val2 = 999
+        del source[0]
+        source.insert(3, ("other", 2))
+
+    # Changes are delivered after the structural changes.
+    assert listener.mock_calls == [
+        call.insert_range(index=3, items=[new]),
+        call.remove_range(index=0, items=[first]),
+        call.insert_range(index=3, items=[source[3]]),
+        call.change(item=second),
+    ]
+
+
+def test_batch_changes(source):
+    """Changes in a batch are delivered once per row, for rows still in the source."""
+    listener = Mock()
+    source.add_listener(listener)
+    first, second, third = source[:]
+
+    with source.batch():
+        first.val1 = "changed"
+        second.val1 = "changed"
+        first.val2 = 999
+        source.remove(second)
+
+    assert listener.mock_calls == [
+        call.remove_range(index=1, items=[second]),
+        call.change(item=first),
+    ]
+
+    listener.reset_mock()
+    with source.batch():
+        third.val1 = "changed"
+        source.clear()
+
+    assert listener.mock_calls == [call.clear()]
+
+
+def test_batch_clear(source):
+    """A clear in a batch discards notifications that came before it."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    with source.batch():
+        source.append(("new", 1))
+        source.clear()
+        new = source.append(("newer", 2))
+
+    assert listener.mock_calls == [
+        call.clear(),
+        call.insert_range(index=0, items=[new]),
+    ]
+
+
+def test_batch_nested(source):
+    """Notifications are delivered when the outermost batch exits."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    with source.batch():
+        with source.batch():
+            new1 = source.append(("new1", 1))
+        assert listener.mock_calls == []
+        new2 = source.append(("new2", 2))
+
+    assert listener.mock_calls == [
+        call.insert_range(index=3, items=[new1, new2]),
+    ]
+
+
 def test_remove(source):
     """You can remove an item from a list source."""
     listener = Mock()
@@ -418,3 +659,136 @@ def test_find(source):
         match=r"No row matching {'val1': 'first', 'val2': 111, 'value': 'overspecified'} in data",
     ):
         source.find(dict(val1="first", val2=111, value="overspecified"))
+
+
+def test_invalid_index():
+    """Indexed attributes must be a list of attribute names."""
+    with pytest.raises(
+        ValueError,
+        match=r"index should be a list of attribute names",
+    ):
+        ListSource(accessors=["val1"], index="val1")
+
+
+def test_index_after_modification(source):
+    """Row positions remain correct as the source is modified."""
+    first, second, third = source[:]
+    assert source.index(third) == 2
+
+    new = source.insert(0, ("new", 0))
+    assert source.index(third) == 3
+    assert source.index(new) == 0
+
+    del source[1]
+    assert source.index(second) == 1
+    with pytest.raises(ValueError, match=r"<Row .* val1='first' val2=111> is not in"):
+        source.index(first)
+
+    del source[-1]
+    with pytest.raises(ValueError, match=r"<Row .* val1='third' val2=333> is not in"):
+        source.index(third)
+
+    source[0] = ("replacement", 1)
+    with pytest.raises(ValueError, match=r"<Row .* val1='new' val2=0> is not in"):
+        source.index(new)
+
+    source.clear()
+    with pytest.raises(ValueError, match=r"<Row .* val1='second' val2=222> is not in"):
+        source.index(second)
+
+
+@pytest.fixture
+def indexed_source():
+    return ListSource(
+        data=[
+            {"val1": "first", "val2": 111},
+            {"val1": "second", "val2": 222},
+            {"val1": "third", "val2": 333},
+            {"val1": "second", "val2": 444},
+            {"val1": ["unhashable"], "val2": 555},
+            {"val2": 666},
+        ],
+        accessors=["val1", "val2"],
+        index=["val1"],
+    )
+
+
+def test_indexed_find(indexed_source):
+    """An indexed source finds rows using the index."""
+    source = indexed_source
+
+    # A search on an indexed attribute is answered by the index.
+    assert source.find("third") is source[2]
+    assert source.find(("second", 444)) is source[3]
+    assert source.find({"val1": "second"}) is source[1]
+    assert source.find({"val1": "second"}, start=source[1]) is source[3]
+    with pytest.raises(ValueError, match=r"No row matching 'second' in data"):
+        source.find("second", start=source[3])
+
+    # The index doesn't prevent a search on other attributes, or on unhashable values.
+    assert source.find({"val2": 333}) is source[2]
+    assert source.find({"val1": ["unhashable"]}) is source[4]
+    with pytest.raises(ValueError, match=r"No row matching 'unknown' in data"):
+        source.find("unknown")
+
+
+def test_indexed_find_after_modification(indexed_source):
+    """The index is maintained as the source is modified."""
+    source = indexed_source
+
+    # Inserted rows are indexed
+    new = source.insert(0, ("second", 0))
+    assert source.find("second") is new
+    rows = source.extend([("fourth", 1), ("fourth", 2)])
+    assert source.find("fourth") is rows[0]
+
+    # Removed rows are no longer found
+    source.remove(new)
+    assert source.find("second") is source[1]
+    del source[-2:]
+    with pytest.raises(ValueError):
+        source.find("fourth")
+
+    # Replaced rows are re-indexed
+    source[0] = ("fourth", 3)
+    with pytest.raises(ValueError):
+        source.find("first")
+    assert source.find("fourth") is source[0]
+
+    # Changed values are re-indexed
+    row = source[2]
+    row.val1 = "changed"
+    assert source.find("changed") is row
+    with pytest.raises(ValueError):
+        source.find("third")
+
+    # Changes to a removed row don't affect the index
+    source.remove(row)
+    row.val1 = "first"
+    with pytest.raises(ValueError):
+        source.find("first")
+
+    # Cleared rows are no longer found
+    source.clear()
+    with pytest.raises(ValueError):
+        source.find("second")
+
+
+async def test_defer_changes(source):
+    """Deferred changes to rows are delivered once per row, if the row is still in
+    the source."""
+    listener = Mock()
+    source.add_listener(listener)
+    source.defer_changes = True
+    first, second, third = source[:]
+
+    first.update(val1="new", val2=1)
+    first.val2 = 2
+    second.val1 = "changed"
+    third.val1 = "changed"
+    source.remove(third)
+
+    listener.change.assert_not_called()
+    await asyncio.sleep(0)
+
+    assert listener.change.call_args_list == [call(item=first), call(item=second)]
@@ -23,6 +23,7 @@ def _create_node(source, parent, data, children=None):
 def source():
     source = Mock()
     source._accessors = ["val1", "val2"]
+    source._index = None
     source._create_node.side_effect = lambda *args, **kwargs: _create_node(
         source, *args, **kwargs
     )
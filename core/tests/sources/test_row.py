@@ -75,3 +75,27 @@ def test_row_without_source():
     # still causes a change notification
     del row.val3
     assert not hasattr(row, "val")
+
+
+def test_update():
+    """Multiple attributes can be updated with a single notification."""
+    source = Mock()
+    row = Row(val1="value 1", val2=42)
+    row._source = source
+
+    row.update(val1="new value", val2=37, val3="other value")
+    assert row.val1 == "new value"
+    assert row.val2 == 37
+    assert row.val3 == "other value"
+    source.notify.assert_called_once_with("change", item=row)
+    source.notify.reset_mock()
+
+    # Updating private attributes isn't a notifiable event
+    row.update(_secret="secret value")
+    assert row._secret == "secret value"
+    source.notify.assert_not_called()
+
+    # A row without a source can be updated
+    row._source = None
+    row.update(val1="another value")
+    assert row.val1 == "another value"
@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import Mock, call
 
 from toga.sources import Source
 
@@ -67,3 +68,80 @@ def test_missing_listener_method():
     source.notify("message1")
 
     full_listener.message1.assert_called_once_with()
+
+
+def test_range_notification_fallback():
+    """If a listener doesn't implement a range notification, it receives the
+    equivalent individual notifications."""
+    range_listener = Mock()
+    item_listener = Mock(spec=["insert", "remove"])
+    ignoring_listener = object()
+    source = Source()
+
+    source.add_listener(range_listener)
+    source.add_listener(item_listener)
+    source.add_listener(ignoring_listener)
+
+    source.notify("insert_range", index=2, items=["a", "b"])
+    range_listener.insert_range.assert_called_once_with(index=2, items=["a", "b"])
+    assert item_listener.insert.call_args_list == [
+        call(index=2, item="a"),
+        call(index=3, item="b"),
+    ]
+
+    source.notify("remove_range", index=2, items=["a", "b"])
+    range_listener.remove_range.assert_called_once_with(index=2, items=["a", "b"])
+    assert item_listener.remove.call_args_list == [
+        call(index=2, item="a"),
+        call(index=2, item="b"),
+    ]
+
+
+def test_defer_changes_without_event_loop():
+    """If no event loop is running, deferred changes are delivered immediately."""
+    listener = Mock()
+    source = Source()
+    source.add_listener(listener)
+    source.defer_changes = True
+    assert source.defer_changes
+
+    source.notify("change", item="item")
+    listener.change.assert_called_once_with(item="item")
+
+
+async def test_defer_changes():
+    """Change notifications can be deferred to the next event loop iteration."""
+    listener = Mock()
+    source = Source()
+    source.add_listener(listener)
+    assert not source.defer_changes
+
+    source.defer_changes = True
+    item1, item2 = object(), object()
+    source.notify("change", item=item1)
+    source.notify("change", item=item2)
+    source.notify("change", item=item1)
+
+    # Other notifications are delivered immediately.
+    source.notify("insert", index=0, item=item2)
+    assert listener.mock_calls == [call.insert(index=0, item=item2)]
+
+    # On the next iteration of the event loop, each change is delivered once.
+    await asyncio.sleep(0)
+    assert listener.mock_calls[1:] == [
+        call.change(item=item1),
+        call.change(item=item2),
+    ]
+
+    # Pending changes are delivered when deferral is disabled.
+    listener.reset_mock()
+    source.notify("change", item=item1)
+    listener.change.assert_not_called()
+    source.defer_changes = False
+    listener.change.assert_called_once_with(item=item1)
+
+    # ... and changes are then delivered immediately
+    source.notify("change", item=item2)
+    listener.change.assert_called_with(item=item2)
+    await asyncio.sleep(0)
+    assert listener.change.call_count == 2
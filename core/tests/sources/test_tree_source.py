@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import Mock, call
 
 import pytest
 
@@ -596,6 +597,41 @@ def test_index(source):
     assert source.index(root) == 1
 
 
+def test_index_after_changes(source):
+    """Cached positions of nodes are updated when the source is modified."""
+    root0, root1 = source[:]
+    children = root1[:]
+    assert [root1.index(child) for child in children] == [0, 1, 2]
+
+    # Insert a root and a child before the existing nodes
+    new_root = source.insert(0, {"val1": "new"})
+    new_child = root1.insert(1, {"val1": "new child"})
+    assert source.index(root1) == 2
+    assert source.index(new_root) == 0
+    assert [root1.index(child) for child in root1] == [0, 1, 2, 3]
+    assert root1.index(children[2]) == 3
+
+    # Remove nodes
+    del source[0]
+    root1.remove(new_child)
+    assert source.index(root1) == 1
+    assert root1.index(children[2]) == 2
+    with pytest.raises(ValueError, match=r"is not in list"):
+        source.index(new_root)
+    with pytest.raises(ValueError, match=r"is not in list"):
+        root1.index(new_child)
+
+    # Replace nodes
+    source[0] = {"val1": "replaced"}
+    root1[1] = {"val1": "replaced child"}
+    assert source.index(source[0]) == 0
+    assert root1.index(root1[1]) == 1
+    with pytest.raises(ValueError, match=r"is not in list"):
+        source.index(root0)
+    with pytest.raises(ValueError, match=r"is not in list"):
+        root1.index(children[1])
+
+
 def test_find(source):
     """A node can be found by value."""
     root1 = source[1]
@@ -612,3 +648,112 @@ def test_find(source):
 
     # Find the child by a full match of values, starting at the first match
     assert source.find({"val1": "group1", "val2": 333}) == root2
+
+
+def test_invalid_index():
+    """Indexed attributes must be a list of attribute names."""
+    with pytest.raises(
+        ValueError,
+        match=r"index should be a list of attribute names",
+    ):
+        TreeSource(accessors=["val1"], index="val1")
+
+
+def test_indexed_find():
+    """An indexed tree source finds nodes using the index."""
+    source = TreeSource(
+        data={
+            ("group1", 1): [({"val1": "child", "val2": 1}, None)],
+            ("group2", 2): [
+                ({"val1": "child", "val2": 2}, None),
+                ({"val1": "child", "val2": 3}, None),
+            ],
+            ("child", 3): None,
+        },
+        accessors=["val1", "val2"],
+        index=["val1"],
+    )
+    group1, group2, root_child = source[:]
+
+    # Only nodes with the right parent are found
+    assert source.find("child") is root_child
+    assert group1.find("child") is group1[0]
+    assert group2.find("child") is group2[0]
+    assert group2.find("child", start=group2[0]) is group2[1]
+    with pytest.raises(ValueError, match=r"No child matching 'child' in"):
+        group2.find("child", start=group2[1])
+
+    # New nodes are indexed
+    new = group1.insert(0, ("child", 4), children=[(("child", 5), None)])
+    assert group1.find("child") is new
+    assert new.find("child") is new[0]
+
+    # Removed and replaced nodes, and their descendants, are no longer found
+    group1.remove(new)
+    assert group1.find("child") is group1[0]
+    assert new[0] not in source._index._indexed
+    group2[0] = ("replaced", 6)
+    assert group2.find("child") is group2[1]
+    source[0] = ("replaced", 7)
+    del source[2]
+    with pytest.raises(ValueError, match=r"No root node matching 'child' in"):
+        source.find("child")
+
+    # Changed values are re-indexed
+    group2[1].val1 = "changed"
+    assert group2.find("changed") is group2[1]
+
+    # Cleared nodes are no longer found
+    source.clear()
+    with pytest.raises(ValueError):
+        source.find("group2")
+
+
+async def test_defer_changes(source, listener):
+    """Deferred changes to nodes are delivered if the node is still in the source."""
+    source.defer_changes = True
+    root0, root1 = source[:]
+
+    root0.val2 = 1
+    root0[0].val2 = 2
+    root1.val2 = 3
+    source.remove(root1)
+
+    listener.change.assert_not_called()
+    await asyncio.sleep(0)
+
+    assert listener.change.call_args_list == [
+        call(item=root0),
+        call(item=root0[0]),
+    ]
+
+
+async def test_defer_changes_removed_subtree(listener):
+    """Deferred changes to descendants of a removed node aren't delivered."""
+    source = TreeSource(
+        data={("root", 0): {("child", 1): [(("grandchild", 2), None)]}},
+        accessors=["val1", "val2"],
+    )
+    source.add_listener(listener)
+    source.defer_changes = True
+    root = source[0]
+    child = root[0]
+    grandchild = child[0]
+
+    root.remove(child)
+    grandchild.val2 = 42
+    child.val2 = 43
+
+    # Nodes that are removed with their ancestors don't generate notifications.
+    assert grandchild._source is None
+    await asyncio.sleep(0)
+    listener.change.assert_not_called()
+
+
+def test_clear_detaches_nodes(source):
+    """Nodes are disassociated from a source when it is cleared."""
+    root = source[1]
+    child = root[0]
+    source.clear()
+    assert root._source is None
+    assert child._source is None
@@ -0,0 +1,440 @@
+import asyncio
+import random
+from unittest.mock import Mock, call
+
+import pytest
+
+from toga.sources import ColumnarListSource, FilteredView, ListSource, SortedView
+
+
+class Mirror:
+    """A listener that replays notifications onto a list, so that the result can be
+    compared with the content of a view."""
+
+    def __init__(self, view):
+        self.rows = list(view)
+        view.add_listener(self)
+
+    def insert(self, index, item):
+        self.rows.insert(index, item)
+
+    def insert_range(self, index, items):
+        self.rows[index:index] = items
+
+    def remove(self, index, item):
+        assert self.rows[index] is item
+        del self.rows[index]
+
+    def remove_range(self, index, items):
+        assert self.rows[index : index + len(items)] == items
+        del self.rows[index : index + len(items)]
+
+    def change(self, item):
+        assert item in self.rows
+
+    def clear(self):
+        self.rows = []
+
+
+@pytest.fixture
+def source():
+    return ListSource(
+        accessors=["name", "value"],
+        data=[
+            ("first", 30),
+            ("second", 10),
+            ("third", 20),
+            ("fourth", 40),
+            ("fifth", 10),
+        ],
+    )
+
+
+def names(view):
+    return [row.name for row in view]
+
+
+def test_sorted_view(source):
+    """A sorted view presents the rows of a source in sorted order."""
+    view = SortedView(source, key=lambda row: row.value)
+
+    assert len(view) == 5
+    assert view.source is source
+    # Rows with equal keys retain source order
+    assert names(view) == ["second", "fifth", "third", "first", "fourth"]
+    # Rows aren't copied
+    assert view[0] is source[1]
+    assert view[1:3] == [source[4], source[2]]
+    assert view.index(source[3]) == 4
+    assert view.index(source[4]) == 1
+
+    # Rows not in the view can't be found
+    with pytest.raises(ValueError, match=r"is not in view"):
+        view.index(Mock())
+
+    # Find by value uses view order
+    assert view.find({"value": 10}) is source[1]
+    assert view.find({"value": 10}, start=source[1]) is source[4]
+    with pytest.raises(ValueError, match=r"No row matching \{'value': 10\} in view"):
+        view.find({"value": 10}, start=source[4])
+
+
+def test_sorted_view_reverse(source):
+    """A sorted view can be sorted in descending order."""
+    view = SortedView(source, key=lambda row: row.value, reverse=True)
+    assert names(view) == ["fourth", "first", "third", "second", "fifth"]
+    assert view.index(source[4]) == 4
+
+    listener = Mock()
+    view.add_listener(listener)
+
+    # Changing the sort order re-sorts, without re-creating rows
+    view.reverse = False
+    assert not view.reverse
+    assert names(view) == ["second", "fifth", "third", "first", "fourth"]
+    listener.clear.assert_called_once_with()
+    listener.insert_range.assert_called_once_with(index=0, items=list(view))
+
+    listener.reset_mock()
+    view.key = lambda row: row.name
+    assert names(view) == ["fifth", "first", "fourth", "second", "third"]
+    listener.clear.assert_called_once_with()
+    listener.insert_range.assert_called_once_with(index=0, items=list(view))
+
+
+def test_sorted_view_insert(source):
+    """Rows added to the source are inserted in sorted position."""
+    view = SortedView(source, key=lambda row: row.value)
+    listener = Mock()
+    view.add_listener(listener)
+
+    row = source.append(("sixth", 15))
+    assert names(view) == ["second", "fifth", "sixth", "third", "first", "fourth"]
+    listener.insert.assert_called_once_with(index=2, item=row)
+
+    # A key that ties with existing rows goes after them
+    listener.reset_mock()
+    row = source.insert(0, ("seventh", 10))
+    assert view.index(row) == 2
+    listener.insert.assert_called_once_with(index=2, item=row)
+
+
+def test_sorted_view_remove(source):
+    """Rows removed from the source are removed from the view."""
+    view = SortedView(source, key=lambda row: row.value)
+    listener = Mock()
+    view.add_listener(listener)
+
+    row = source[4]
+    source.remove(row)
+    assert names(view) == ["second", "third", "first", "fourth"]
+    listener.remove.assert_called_once_with(index=1, item=row)
+
+
+def test_sorted_view_change(source):
+    """Changed rows are repositioned in the view if their key changes."""
+    view = SortedView(source, key=lambda row: row.value)
+    listener = Mock()
+    view.add_listener(listener)
+
+    # A change that doesn't affect the key is passed through.
+    row = source[2]
+    row.name = "THIRD"
+    listener.change.assert_called_once_with(item=row)
+    listener.remove.assert_not_called()
+
+    # A change to the key that doesn't change position is a change.
+    listener.reset_mock()
+    row.value = 25
+    assert view.index(row) == 2
+    listener.change.assert_called_once_with(item=row)
+    listener.remove.assert_not_called()
+
+    # A change to the key that moves the row is a remove and an insert.
+    listener.reset_mock()
+    row.value = 50
+    assert names(view) == ["second", "fifth", "first", "fourth", "THIRD"]
+    assert listener.mock_calls == [
+        call.remove(index=2, item=row),
+        call.insert(index=4, item=row),
+    ]
+
+
+def test_sorted_view_bulk(source):
+    """Bulk changes in the source are delivered as ranges where possible."""
+    view = SortedView(source, key=lambda row: row.value)
+    listener = Mock()
+    view.add_listener(listener)
+
+    rows = source.extend([("sixth", 50), ("seventh", 60), ("eighth", 0)])
+    assert names(view)[-2:] == ["sixth", "seventh"]
+    assert listener.mock_calls == [
+        call.insert_range(index=5, items=rows[:2]),
+        call.insert_range(index=0, items=rows[2:]),
+    ]
+
+    listener.reset_mock()
+    del source[-3:]
+    assert names(view) == ["second", "fifth", "third", "first", "fourth"]
+    assert listener.mock_calls == [
+        call.remove_range(index=6, items=rows[:2]),
+        call.remove_range(index=0, items=rows[2:]),
+    ]
+
+    listener.reset_mock()
+    source.clear()
+    assert len(view) == 0
+    listener.clear.assert_called_once_with()
+
+
+def test_filtered_view(source):
+    """A filtered view presents the rows of a source that match a predicate."""
+    view = FilteredView(source, predicate=lambda row: row.value >= 20)
+
+    assert len(view) == 3
+    assert view.source is source
+    assert names(view) == ["first", "third", "fourth"]
+    assert view[1] is source[2]
+    assert view.index(source[3]) == 2
+
+    # Rows that don't match can't be found
+    with pytest.raises(ValueError, match=r"is not in view"):
+        view.index(source[1])
+
+    assert view.find({"value": 40}) is source[3]
+    with pytest.raises(ValueError, match=r"No row matching \{'value': 10\} in view"):
+        view.find({"value": 10})
+
+
+def test_filtered_view_updates(source):
+    """A filtered view tracks changes to the source."""
+    view = FilteredView(source, predicate=lambda row: row.value >= 20)
+    listener = Mock()
+    view.add_listener(listener)
+
+    # Rows that don't match the predicate aren't announced.
+    source.insert(1, ("sixth", 5))
+    listener.insert.assert_not_called()
+
+    # Matching rows are inserted at the position matching source order.
+    row = source.insert(3, ("seventh", 50))
+    assert names(view) == ["first", "seventh", "third", "fourth"]
+    listener.insert.assert_called_once_with(index=1, item=row)
+
+    listener.reset_mock()
+    source.remove(row)
+    assert names(view) == ["first", "third", "fourth"]
+    listener.remove.assert_called_once_with(index=1, item=row)
+
+    # Removing a row that isn't in the view isn't announced.
+    listener.reset_mock()
+    source.remove(source[1])
+    listener.remove.assert_not_called()
+
+    # A change that keeps the row in the view is a change.
+    listener.reset_mock()
+    source[2].value = 25
+    listener.change.assert_called_once_with(item=source[2])
+
+    # A change that excludes the row is a remove.
+    listener.reset_mock()
+    source[2].value = 15
+    assert names(view) == ["first", "fourth"]
+    listener.remove.assert_called_once_with(index=1, item=source[2])
+
+    # A change that includes a row is an insert.
+    listener.reset_mock()
+    source[1].value = 35
+    assert names(view) == ["first", "second", "fourth"]
+    listener.insert.assert_called_once_with(index=1, item=source[1])
+
+    # A change to a row that isn't in the view, and remains excluded, isn't announced
+    listener.reset_mock()
+    source[2].value = 12
+    assert listener.mock_calls == []
+
+    source.clear()
+    assert len(view) == 0
+    listener.clear.assert_called_once_with()
+
+
+def test_refilter(source):
+    """Changing the predicate produces the minimal set of notifications."""
+    view = FilteredView(source, predicate=lambda row: row.value >= 20)
+    listener = Mock()
+    view.add_listener(listener)
+
+    view.predicate = lambda row: row.value <= 20
+    assert names(view) == ["second", "third", "fifth"]
+    assert listener.mock_calls == [
+        call.remove_range(index=0, items=[source[0]]),
+        call.insert_range(index=0, items=[source[1]]),
+        call.remove_range(index=2, items=[source[3]]),
+        call.insert_range(index=2, items=[source[4]]),
+    ]
+
+
+def test_detach(source):
+    """A view can stop tracking its source."""
+    view = FilteredView(source, predicate=lambda row: True)
+    view.detach()
+    source.append(("sixth", 60))
+    assert len(view) == 5
+
+
+async def test_defer_changes(source):
+    """Change notifications from a view can be deferred."""
+    view = SortedView(source, key=lambda row: row.value)
+    view.defer_changes = True
+    listener = Mock()
+    view.add_listener(listener)
+
+    source[0].name = "FIRST"
+    source[1].name = "SECOND"
+    source[0].name = "1st"
+    source.remove(source[1])
+    listener.change.assert_not_called()
+
+    await asyncio.sleep(0)
+    # The change to the removed row isn't delivered
+    listener.change.assert_called_once_with(item=source[0])
+
+
+def test_composed_views(source):
+    """Views can be stacked on top of other views."""
+    filtered = FilteredView(source, predicate=lambda row: row.value > 10)
+    view = SortedView(filtered, key=lambda row: row.name)
+    assert names(view) == ["first", "fourth", "third"]
+
+    source.append(("alpha", 11))
+    source[1].value = 100
+    assert names(view) == ["alpha", "first", "fourth", "second", "third"]
+    source.remove(source[0])
+    assert names(view) == ["alpha", "fourth", "second", "third"]
+
+
+def test_sorted_view_replace(source):
+    """Rows replaced in the source are replaced in the view."""
+    view = SortedView(source, key=lambda row: row.value)
+    listener = Mock()
+    view.add_listener(listener)
+
+    old_row = source[0]
+    source[0] = ("new first", 15)
+    assert names(view) == ["second", "fifth", "new first", "third", "fourth"]
+    assert listener.mock_calls == [
+        call.remove(index=3, item=old_row),
+        call.insert(index=2, item=source[0]),
+    ]
+
+    # Replacements in a batch are also applied.
+    listener.reset_mock()
+    with source.batch():
+        source[1] = ("new second", 50)
+        source[4] = ("new fifth", 5)
+    assert names(view) == ["new fifth", "new first", "third", "fourth", "new second"]
+
+
+def test_filtered_view_replace(source):
+    """Rows replaced in the source are replaced in the view."""
+    view = FilteredView(source, predicate=lambda row: row.value > 10)
+    listener = Mock()
+    view.add_listener(listener)
+
+    # A visible row replaced by a visible row
+    old_row = source[0]
+    source[0] = ("new first", 35)
+    assert names(view) == ["new first", "third", "fourth"]
+    assert listener.mock_calls == [
+        call.remove(index=0, item=old_row),
+        call.insert(index=0, item=source[0]),
+    ]
+
+    # A visible row replaced by a hidden row
+    listener.reset_mock()
+    old_row = source[2]
+    source[2] = ("new third", 5)
+    assert names(view) == ["new first", "fourth"]
+    assert listener.mock_calls == [call.remove(index=1, item=old_row)]
+
+    # A hidden row replaced by a visible row
+    listener.reset_mock()
+    source[1] = ("new second", 15)
+    assert names(view) == ["new first", "new second", "fourth"]
+    assert listener.mock_calls == [call.insert(index=1, item=source[1])]
+
+    # A hidden row replaced by a hidden row
+    listener.reset_mock()
+    source[4] = ("new fifth", 0)
+    assert names(view) == ["new first", "new second", "fourth"]
+    assert listener.mock_calls == []
+
+
+@pytest.mark.parametrize(
+    "create_view",
+    [
+        lambda source: SortedView(source, key=lambda row: row.value),
+        lambda source: FilteredView(source, predicate=lambda row: row.value > 0),
+    ],
+)
+def test_change_removed_row(source, create_view):
+    """Changes to rows that have been removed from the source are ignored."""
+    view = create_view(source)
+    listener = Mock()
+    view.add_listener(listener)
+
+    row = source[3]
+    source.remove(row)
+    listener.reset_mock()
+
+    row.value = 10
+    assert row not in list(view)
+    assert listener.mock_calls == []
+
+
+@pytest.mark.parametrize("source_class", [ListSource, ColumnarListSource])
+def test_random_operations(source_class):
+    """A random series of operations on the source keep views consistent."""
+    rng = random.Random(42)
+    source = source_class(
+        accessors=["value"], data=[{"value": rng.randrange(50)} for _ in range(50)]
+    )
+    filtered = FilteredView(source, predicate=lambda row: row.value % 3)
+    ordered = SortedView(source, key=lambda row: row.value, reverse=True)
+    combined = SortedView(filtered, key=lambda row: row.value)
+    mirrors = [Mirror(view) for view in (filtered, ordered, combined)]
+
+    removed = []
+    for _ in range(500):
+        op = rng.randrange(7)
+        if op == 0:
+            source.insert(rng.randrange(len(source) + 1), {"value": rng.randrange(50)})
+        elif op == 1 and len(source):
+            index = rng.randrange(len(source))
+            removed.append(source[index])
+            del source[index]
+        elif op == 2 and len(source):
+            source[rng.randrange(len(source))].value = rng.randrange(50)
+        elif op == 3:
+            start = rng.randrange(len(source) + 1)
+            with source.batch():
+                source[start:start] = [
+                    {"value": rng.randrange(50)} for _ in range(rng.randrange(5))
+                ]
+        elif op == 4 and len(source):
+            start = rng.randrange(len(source))
+            del source[start : start + rng.randrange(5)]
+        elif op == 5 and len(source):
+            source[rng.randrange(len(source))] = {"value": rng.randrange(50)}
+        elif op == 6 and removed:
+            rng.choice(removed).value = rng.randrange(50)
+
+        assert list(filtered) == [row for row in source if row.value % 3]
+        assert [row.value for row in ordered] == sorted(
+            (row.value for row in source), reverse=True
+        )
+        assert [row.value for row in combined] == sorted(
+            row.value for row in source if row.value % 3
+        )
+        for mirror, view in zip(mirrors, (filtered, ordered, combined)):
+            assert mirror.rows == list(view)
@@ -0,0 +1,208 @@
+from unittest.mock import Mock
+
+import pytest
+
+from toga.sources import Row, VirtualListSource
+
+
+@pytest.fixture
+def fetch():
+    # Each item is a (name, number) tuple, generated from its index
+    return Mock(
+        side_effect=lambda start, count: [
+            (f"item {i}", i) for i in range(start, start + count)
+        ]
+    )
+
+
+@pytest.fixture
+def source(fetch):
+    return VirtualListSource(
+        accessors=["name", "number"],
+        length=1000,
+        fetch=fetch,
+        page_size=10,
+        cache_pages=3,
+    )
+
+
+@pytest.mark.parametrize("value", [None, 42, "not a list"])
+def test_invalid_accessors(value, fetch):
+    """Accessors for a virtual list source must be a list of attribute names."""
+    with pytest.raises(
+        ValueError,
+        match=r"accessors should be a list of attribute names",
+    ):
+        VirtualListSource(accessors=value, length=10, fetch=fetch)
+
+
+def test_accessors_required(fetch):
+    """A virtual list source must specify *some* accessors."""
+    with pytest.raises(
+        ValueError,
+        match=r"VirtualListSource must be provided a list of accessors",
+    ):
+        VirtualListSource(accessors=[], length=10, fetch=fetch)
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"page_size": 0}, r"page_size must be a positive integer"),
+        ({"cache_pages": 0}, r"cache_pages must be a positive integer"),
+    ],
+)
+def test_invalid_cache_config(fetch, kwargs, message):
+    """The page size and cache size must be positive."""
+    with pytest.raises(ValueError, match=message):
+        VirtualListSource(accessors=["name"], length=10, fetch=fetch, **kwargs)
+
+
+def test_lazy(source, fetch):
+    """Rows aren't materialized until they're accessed."""
+    assert len(source) == 1000
+    fetch.assert_not_called()
+    assert source.cached_rows == 0
+
+    row = source[42]
+    assert isinstance(row, Row)
+    assert row.name == "item 42"
+    assert row.number == 42
+
+    # Only the page containing the row was fetched
+    fetch.assert_called_once_with(40, 10)
+    assert source.cached_rows == 10
+
+    # Accessing another row on the same page uses the cache
+    assert source[45].number == 45
+    assert source[42] is row
+    fetch.assert_called_once_with(40, 10)
+
+
+def test_negative_index(source, fetch):
+    """Rows can be accessed with a negative index."""
+    assert source[-1].number == 999
+    fetch.assert_called_once_with(990, 10)
+
+
+@pytest.mark.parametrize("index", [1000, -1001])
+def test_index_out_of_range(source, index):
+    """Accessing a row outside the source raises an IndexError."""
+    with pytest.raises(IndexError, match=r"VirtualListSource index out of range"):
+        source[index]
+
+
+def test_slice(source):
+    """A slice of a virtual source returns a list of rows."""
+    rows = source[8:13]
+    assert [row.number for row in rows] == [8, 9, 10, 11, 12]
+
+
+def test_partial_last_page(fetch):
+    """The last page is only as long as the remaining data."""
+    source = VirtualListSource(
+        accessors=["name", "number"], length=25, fetch=fetch, page_size=10
+    )
+    assert source[24].number == 24
+    fetch.assert_called_once_with(20, 5)
+
+
+def test_bad_fetch():
+    """If fetch doesn't return the requested number of items, an error is raised."""
+    source = VirtualListSource(
+        accessors=["name"],
+        length=25,
+        fetch=lambda start, count: ["only one"],
+    )
+    with pytest.raises(ValueError, match=r"fetch\(0, 25\) returned 1 items"):
+        source[0]
+
+
+def test_eviction(source, fetch):
+    """The least recently used page is discarded when the cache is full."""
+    first = source[0]
+    source[10]
+    source[20]
+    assert source.cached_rows == 30
+
+    # Touch the first page, so the second page is the least recently used
+    assert source[1].number == 1
+    source[30]
+    assert source.cached_rows == 30
+    assert fetch.call_count == 4
+
+    # The first page is still cached
+    assert source[0] is first
+    assert fetch.call_count == 4
+
+    # The second page was evicted, and must be fetched again
+    source[10]
+    assert fetch.call_count == 5
+
+
+def test_iter(source, fetch):
+    """A virtual source can be iterated over, a page at a time."""
+    source = VirtualListSource(
+        accessors=["name", "number"], length=25, fetch=fetch, page_size=10
+    )
+    assert [row.number for row in source] == list(range(25))
+    assert fetch.call_count == 3
+
+
+def test_change_notification(source):
+    """Modifying a row notifies the listeners of the source."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    row = source[5]
+    row.name = "changed"
+
+    listener.change.assert_called_once_with(item=row)
+
+
+def test_index(source):
+    """The index of a cached row can be found."""
+    row = source[42]
+    assert source.index(row) == 42
+
+    # A row that isn't in the cache can't be found.
+    with pytest.raises(ValueError, match=r"<Row .*> is not in the data source"):
+        source.index(Row(name="item 42", number=42))
+
+
+def test_find(fetch):
+    """Rows can be found by value."""
+    source = VirtualListSource(
+        accessors=["name", "number"], length=1000, fetch=fetch, page_size=10
+    )
+    row = source.find({"number": 23})
+    assert row.name == "item 23"
+
+    row = source.find(("item 24", 24))
+    assert row.number == 24
+
+    # Find the next match after a known row
+    source[50].name = "item 24"
+    assert source.find({"name": "item 24"}, start=row) is source[50]
+
+    with pytest.raises(ValueError, match=r"No row matching 'unknown' in data"):
+        source.find("unknown", start=source[990])
+
+
+def test_invalidate(source, fetch):
+    """Invalidating the source discards the cache, and notifies listeners."""
+    listener = Mock()
+    source.add_listener(listener)
+    first = source[0]
+
+    source.invalidate()
+    assert source.cached_rows == 0
+    listener.clear.assert_called_once_with()
+
+    # The row is re-fetched
+    assert source[0] is not first
+    assert fetch.call_count == 2
+
+    # The length can be changed
+    source.invalidate(length=5)
+    assert len(source) == 5
@@ -0,0 +1,165 @@
+from unittest.mock import patch
+
+import pytest
+from travertino.size import at_least
+
+from toga.style import TogaApplicator
+from toga.style.pack import COLUMN, ROW, Pack
+
+from ..utils import ExampleNode, ExampleViewport
+
+
+def _tree():
+    return ExampleNode(
+        "app",
+        style=Pack(direction=COLUMN),
+        children=[
+            ExampleNode(
+                "header",
+                style=Pack(direction=ROW),
+                children=[
+                    ExampleNode("title", style=Pack(), size=(at_least(100), 20)),
+                    ExampleNode("button", style=Pack(), size=(at_least(50), 20)),
+                ],
+            ),
+            ExampleNode(
+                "body",
+                style=Pack(direction=ROW, flex=1),
+                children=[
+                    ExampleNode("left", style=Pack(flex=1), size=(at_least(60), 40)),
+                    ExampleNode("right", style=Pack(flex=1), size=(at_least(60), 40)),
+                ],
+            ),
+        ],
+    )
+
+
+def _geometry(node):
+    return [
+        (
+            node.name,
+            node.layout.absolute_content_left,
+            node.layout.absolute_content_top,
+            node.layout.content_width,
+            node.layout.content_height,
+            node.layout.min_content_width,
+            node.layout.min_content_height,
+        )
+    ] + [geometry for child in node.children for geometry in _geometry(child)]
+
+
+@pytest.fixture
+def laid_out():
+    """Record the nodes whose children are laid out during a layout pass."""
+    nodes = []
+    row, column = Pack._layout_row_children, Pack._layout_column_children
+
+    def layout_row_children(self, node, **kwargs):
+        nodes.append(node.name)
+        return row(self, node, **kwargs)
+
+    def layout_column_children(self, node, **kwargs):
+        nodes.append(node.name)
+        return column(self, node, **kwargs)
+
+    with patch.object(Pack, "_layout_row_children", layout_row_children):
+        with patch.object(Pack, "_layout_column_children", layout_column_children):
+            yield nodes
+
+
+def test_unchanged(laid_out):
+    """If nothing has changed, a second layout doesn't recompute anything."""
+    root = _tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+    assert laid_out == ["app", "header", "body"]
+    geometry = _geometry(root)
+
+    laid_out.clear()
+    root.style.layout(root, ExampleViewport(640, 480))
+    assert laid_out == []
+    assert _geometry(root) == geometry
+
+
+def test_resize():
+    """A change in viewport size produces the same layout as a fresh layout."""
+    root = _tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+    root.style.layout(root, ExampleViewport(800, 600))
+
+    reference = _tree()
+    reference.style.layout(reference, ExampleViewport(800, 600))
+    assert _geometry(root) == _geometry(reference)
+
+
+def test_intrinsic_change(laid_out):
+    """A change in intrinsic size recomputes the ancestors of the changed node."""
+    root = _tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+
+    laid_out.clear()
+    root.children[0].children[0].intrinsic.height = 30
+    root.style.layout(root, ExampleViewport(640, 480))
+    assert laid_out == ["app", "header", "body"]
+
+    # Setting the intrinsic size to the same value doesn't invalidate the layout.
+    laid_out.clear()
+    root.children[0].children[0].intrinsic.height = 30
+    root.style.layout(root, ExampleViewport(640, 480))
+    assert laid_out == []
+
+    reference = _tree()
+    reference.children[0].children[0].intrinsic.height = 30
+    reference.style.layout(reference, ExampleViewport(640, 480))
+    assert _geometry(root) == _geometry(reference)
+
+
+def test_style_change(laid_out):
+    """A change in style recomputes the ancestors of the changed node."""
+    root = _tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+
+    # The header isn't affected by a change in the body.
+    laid_out.clear()
+    root.children[1].children[1].style.padding_top = 5
+    root.style.layout(root, ExampleViewport(640, 480))
+    assert laid_out == ["app", "body"]
+
+    reference = _tree()
+    reference.children[1].children[1].style.padding_top = 5
+    reference.style.layout(reference, ExampleViewport(640, 480))
+    assert _geometry(root) == _geometry(reference)
+
+
+def test_set_bounds():
+    """Only widgets whose geometry has changed have their bounds applied."""
+    root = _tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+    root.applicator.set_bounds()
+
+    header, body = root.children
+    title, button = header.children
+    left, right = body.children
+    for node in [root, header, body, title, button, left, right]:
+        node._impl.set_bounds.assert_called_once()
+        node._impl.set_bounds.reset_mock()
+
+    # Nothing has changed, so no bounds are applied.
+    root.style.layout(root, ExampleViewport(640, 480))
+    root.applicator.set_bounds()
+    for node in [root, header, body, title, button, left, right]:
+        node._impl.set_bounds.assert_not_called()
+
+    # Making the title taller pushes the body down; every node under the body moves,
+    # but the button doesn't change.
+    count = TogaApplicator.native_set_bounds_count
+    title.intrinsic.height = 30
+    root.style.layout(root, ExampleViewport(640, 480))
+    root.applicator.set_bounds()
+    assert TogaApplicator.native_set_bounds_count == count + 5
+    root._impl.set_bounds.assert_not_called()
+    button._impl.set_bounds.assert_not_called()
+    header._impl.set_bounds.assert_called_once_with(0, 0, 150, 30)
+    title._impl.set_bounds.assert_called_once_with(0, 0, 100, 30)
+    body._impl.set_bounds.assert_called_once_with(0, 30, 640, 450)
+    left._impl.set_bounds.assert_called_once_with(0, 30, 320, 40)
+    right._impl.set_bounds.assert_called_once_with(320, 30, 320, 40)
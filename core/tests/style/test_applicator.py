@@ -1,10 +1,16 @@
 import pytest
+from travertino.layout import Viewport
 
 import toga
 from toga.colors import REBECCAPURPLE
 from toga.fonts import FANTASY
+from toga.style import TogaApplicator
 from toga.style.pack import HIDDEN, RIGHT, VISIBLE
-from toga_dummy.utils import assert_action_performed_with
+from toga_dummy.utils import (
+    EventLog,
+    assert_action_not_performed,
+    assert_action_performed_with,
+)
 
 
 # Create the simplest possible widget with a concrete implementation that will
@@ -82,6 +88,46 @@ def test_set_bounds(widget, child, grandchild):
     assert_action_performed_with(grandchild, "set bounds", x=1, y=2, width=3, height=4)
 
 
+def test_set_bounds_unchanged(widget, child, grandchild):
+    """Bounds aren't re-applied to widgets whose geometry hasn't changed."""
+    widget.style.layout(widget, Viewport(640, 480))
+    widget.applicator.set_bounds()
+    EventLog.reset()
+
+    # Nothing has changed
+    widget.style.layout(widget, Viewport(640, 480))
+    widget.applicator.set_bounds()
+    assert_action_not_performed(widget, "set bounds")
+    assert_action_not_performed(child, "set bounds")
+    assert_action_not_performed(grandchild, "set bounds")
+
+    # Moving the child moves the grandchild as well; the parent is laid out again,
+    # but its bounds haven't changed.
+    count = TogaApplicator.native_set_bounds_count
+    child.style.padding_left = 10
+    widget.style.layout(widget, Viewport(640, 480))
+    widget.applicator.set_bounds()
+    assert TogaApplicator.native_set_bounds_count == count + 2
+    assert_action_not_performed(widget, "set bounds")
+    assert_action_performed_with(child, "set bounds", x=10, y=0, width=630, height=480)
+    assert_action_performed_with(
+        grandchild, "set bounds", x=10, y=0, width=630, height=480
+    )
+    EventLog.reset()
+
+    # Re-parenting a widget means the bounds must be re-applied, even if the
+    # geometry is the same.
+    child.remove(grandchild)
+    child.add(grandchild)
+    widget.style.layout(widget, Viewport(640, 480))
+    widget.applicator.set_bounds()
+    assert_action_not_performed(widget, "set bounds")
+    assert_action_not_performed(child, "set bounds")
+    assert_action_performed_with(
+        grandchild, "set bounds", x=10, y=0, width=630, height=480
+    )
+
+
 def test_text_alignment(widget):
     """Text alignment can be set on a widget."""
     widget.applicator.set_text_alignment(RIGHT)
@@ -0,0 +1,91 @@
+from io import StringIO
+
+import pytest
+
+import toga
+from toga.style import Pack
+from toga.style.pack import COLUMN
+from toga.style.profiling import LayoutProfiler, report
+
+
+@pytest.fixture
+def window(app):
+    window = toga.Window()
+    window.content = toga.Box(
+        style=Pack(direction=COLUMN),
+        children=[
+            toga.Box(children=[toga.Box(), toga.Box()]),
+            toga.Box(children=[toga.Box(), toga.Box()]),
+        ],
+    )
+    return window
+
+
+def test_profile(window):
+    """The work performed by a layout pass is recorded."""
+    target = window.content.children[1].children[0]
+
+    with LayoutProfiler() as profiler:
+        target.style.padding_left = 10
+
+    assert len(profiler.passes) == 1
+    layout_pass = profiler.passes[0]
+    assert layout_pass.root is window.content
+    assert layout_pass.trigger is target
+    # The target widget, and the root, were refreshed.
+    assert layout_pass.rehints == 2
+    # The target and all its ancestors were laid out. The siblings along that path
+    # were visited, but their existing layout could be reused; their children
+    # weren't visited at all.
+    assert layout_pass.nodes_visited == 5
+    assert layout_pass.nodes_laid_out == 3
+    # Only the target moved.
+    assert layout_pass.set_bounds == 1
+    assert layout_pass.row_time > 0
+    assert layout_pass.column_time > 0
+    assert layout_pass.duration >= layout_pass.row_time + layout_pass.column_time
+
+    assert repr(layout_pass).startswith(
+        f"<LayoutPass root={window.content!r} trigger={target!r} rehints=2 "
+        "nodes_visited=5 nodes_laid_out=3 set_bounds=1 "
+    )
+
+    # Once stopped, a profiler doesn't record anything.
+    target.style.padding_left = 20
+    assert len(profiler.passes) == 1
+
+    profiler.clear()
+    assert profiler.passes == []
+
+
+def test_resize(window):
+    """A layout pass that isn't caused by a refresh has no trigger."""
+    profiler = LayoutProfiler()
+    profiler.start()
+    # Starting a profiler twice has no effect
+    profiler.start()
+    try:
+        window.content.style.layout(window.content, toga.Size(800, 600))
+    finally:
+        profiler.stop()
+        # Stopping a profiler twice has no effect
+        profiler.stop()
+
+    assert len(profiler.passes) == 1
+    assert profiler.passes[0].trigger is None
+    assert profiler.passes[0].rehints == 0
+    assert profiler.passes[0].nodes_visited == 7
+
+
+def test_report(window):
+    """A summary of the layout passes can be written."""
+    with LayoutProfiler() as profiler:
+        window.content.refresh()
+        window.content.refresh()
+
+    output = StringIO()
+    report(profiler, file=output)
+    lines = output.getvalue().splitlines()
+    assert lines[0] == "2 layout passes"
+    assert len(lines) == 3
+    assert lines[1].startswith("  <LayoutPass ")
@@ -1,15 +1,27 @@
+import gc
+import os
+from array import array
+from io import BytesIO
 from pathlib import Path
+from weakref import ref
 
 import PIL.Image
 import pytest
 
 import toga
+from toga.images import ImagePixels
+from toga.plugins.image_formats import PILConverter
 from toga_dummy.plugins.image_formats import (
     CustomImage,
     CustomImageSubclass,
     DisabledImageConverter,
 )
-from toga_dummy.utils import assert_action_performed_with
+from toga_dummy.utils import (
+    EventLog,
+    assert_action_not_performed,
+    assert_action_performed,
+    assert_action_performed_with,
+)
 
 RELATIVE_FILE_PATH = Path("resources/sample.png")
 ABSOLUTE_FILE_PATH = Path(__file__).parent / "resources/sample.png"
@@ -171,6 +183,8 @@ def test_create_from_pil(app):
 
     assert isinstance(toga_image, toga.Image)
     assert toga_image.size == (144, 72)
+    # The image is converted using its pixels.
+    assert_action_performed(toga_image, "load image pixels")
 
 
 def test_create_from_toga_image(app):
@@ -181,6 +195,10 @@ def test_create_from_toga_image(app):
     assert isinstance(toga_image_2, toga.Image)
     assert toga_image_2.size == (144, 72)
 
+    # The native image is shared, rather than copied.
+    assert toga_image_2._impl.native is toga_image._impl.native
+    assert_action_performed(toga_image_2, "load image from raw")
+
 
 @pytest.mark.parametrize("kwargs", [{"data": BYTES}, {"path": ABSOLUTE_FILE_PATH}])
 def test_deprecated_arguments(kwargs):
@@ -242,6 +260,205 @@ def test_image_save(tmp_path):
     assert_action_performed_with(image, "save", path=save_path)
 
 
+def png_data(width):
+    """Image data in PNG format, for an image of a given width."""
+    buffer = BytesIO()
+    PIL.Image.new("RGB", (width, 10)).save(buffer, format="png")
+    return buffer.getvalue()
+
+
+def test_cache_file(app, tmp_path):
+    """Images loaded from the same unmodified file share a cached native image."""
+    path = tmp_path / "image.png"
+    path.write_bytes(BYTES)
+    image_1 = toga.Image(path)
+    assert_action_performed_with(image_1, "load image file", path=path)
+
+    EventLog.reset()
+    image_2 = toga.Image(path)
+    assert_action_not_performed(image_2, "load image file")
+    assert_action_performed(image_2, "load image from raw")
+    assert image_2._impl.native is image_1._impl.native
+    assert toga.Image.cache_info() == (1, 1, 128, 1)
+
+    # A modified file is loaded again.
+    path.write_bytes(png_data(20))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    image_3 = toga.Image(path)
+    assert_action_performed_with(image_3, "load image file", path=path)
+    assert image_3.size == (20, 10)
+    assert toga.Image.cache_info() == (1, 2, 128, 2)
+
+
+def test_cache_data():
+    """Images loaded from identical data share a cached native image."""
+    image_1 = toga.Image(BYTES)
+    image_2 = toga.Image(bytearray(BYTES))
+    image_3 = toga.Image(png_data(20))
+
+    assert_action_performed(image_2, "load image from raw")
+    assert image_2._impl.native is image_1._impl.native
+    assert image_3._impl.native is not image_1._impl.native
+    assert toga.Image.cache_info() == (1, 2, 128, 2)
+
+    toga.Image.cache_clear()
+    assert toga.Image.cache_info() == (0, 0, 128, 0)
+
+
+def test_cache_ownership():
+    """The cache keeps the backend image that owns a native image, so the native image
+    remains valid after the image that loaded it has been deleted."""
+    image_1 = toga.Image(BYTES)
+    impl = ref(image_1._impl)
+    native = image_1._impl.native
+    # The event log holds a reference to the backend image as well.
+    EventLog.reset()
+    del image_1
+    gc.collect()
+    assert impl() is not None
+
+    image_2 = toga.Image(BYTES)
+    assert image_2._impl.native is native
+
+    # The backend image is released when it's removed from the cache.
+    EventLog.reset()
+    toga.Image.cache_clear()
+    gc.collect()
+    assert impl() is None
+
+
+def test_cache_eviction(monkeypatch):
+    """The least recently used image is evicted from a full cache."""
+    monkeypatch.setattr(toga.Image, "CACHE_SIZE", 2)
+    data = [png_data(width) for width in (10, 20, 30)]
+    toga.Image(data[0])
+    toga.Image(data[1])
+    # Use the first image again, so that the second is the least recently used.
+    toga.Image(data[0])
+    toga.Image(data[2])
+    assert toga.Image.cache_info() == (1, 3, 2, 2)
+
+    EventLog.reset()
+    assert_action_performed(toga.Image(data[0]), "load image from raw")
+    assert_action_performed(toga.Image(data[1]), "load image data")
+
+
+def test_cache_disabled(monkeypatch):
+    """The cache can be disabled."""
+    monkeypatch.setattr(toga.Image, "CACHE_SIZE", 0)
+    image_1 = toga.Image(BYTES)
+    image_2 = toga.Image(BYTES)
+
+    assert_action_performed(image_2, "load image data")
+    assert image_2._impl.native is not image_1._impl.native
+    assert toga.Image.cache_info() == (0, 0, 0, 0)
+
+
+# A 2x2 image: red, green / blue, transparent
+RGBA_PIXELS = bytes([255, 0, 0, 255, 0, 255, 0, 255, 0, 0, 255, 255, 0, 0, 0, 0])
+
+
+def test_pixels():
+    """The pixels of an image can be retrieved."""
+    image = toga.Image(BYTES)
+    pixels = image.pixels()
+    assert_action_performed(image, "get pixels")
+
+    assert isinstance(pixels, ImagePixels)
+    assert (pixels.width, pixels.height) == (144, 72)
+    assert pixels.format == "RGBA"
+    assert pixels.stride == 144 * 4
+    assert len(pixels.data) == 144 * 72 * 4
+    # The pixels can't be modified.
+    assert pixels.data.readonly
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        RGBA_PIXELS,
+        bytearray(RGBA_PIXELS),
+        memoryview(RGBA_PIXELS),
+        array("B", RGBA_PIXELS),
+        # Multi-byte items are treated as bytes.
+        array("I", RGBA_PIXELS),
+        # A buffer that isn't contiguous (e.g., a slice of a NumPy array)
+        memoryview(bytes(value for pixel in RGBA_PIXELS for value in (pixel, 0)))[::2],
+    ],
+)
+def test_from_buffer(data):
+    """An image can be created from pixels in any buffer."""
+    image = toga.Image.from_buffer(data, 2, 2)
+    assert_action_performed(image, "load image pixels")
+    assert image.size == (2, 2)
+
+    pixels = image.pixels()
+    assert pixels == (RGBA_PIXELS, 2, 2, 8, "RGBA")
+
+
+def test_from_buffer_stride():
+    """Rows of pixels can be padded."""
+    data = bytes([1, 2, 3, 4, 5, 6, 0, 0, 7, 8, 9, 10, 11, 12])
+    image = toga.Image.from_buffer(data, 2, 2, format="RGB", stride=8)
+    assert image.pixels() == (
+        bytes([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]),
+        2,
+        2,
+        6,
+        "RGB",
+    )
+
+
+def test_from_pixels():
+    """An image can be created from the pixels of another image."""
+    image = toga.Image(toga.Image(BYTES).pixels())
+    assert_action_performed(image, "load image pixels")
+    assert image.size == (144, 72)
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        ((RGBA_PIXELS, 2, 2, "BGR"), r"Unsupported pixel format 'BGR'"),
+        ((RGBA_PIXELS, 0, 2), r"Invalid image size 0x2"),
+        ((RGBA_PIXELS, 2, 2, "RGBA", 7), r"A stride of 7 is too small for 2 pixels"),
+        ((RGBA_PIXELS, 2, 3), r"Pixel data has 16 bytes; expected 24"),
+    ],
+)
+def test_from_buffer_invalid(args, message):
+    """Pixels that don't match their description are rejected."""
+    with pytest.raises(ValueError, match=message):
+        toga.Image.from_buffer(*args)
+
+
+def test_pixels_unsupported(monkeypatch):
+    """Pixels can be accessed on backends that don't support them, by converting to
+    and from image data."""
+    monkeypatch.setattr("toga_dummy.images.Image.SUPPORTS_PIXELS", False)
+
+    image = toga.Image.from_buffer(RGBA_PIXELS, 2, 2)
+    assert_action_performed(image, "load image data")
+    assert image.size == (2, 2)
+
+    assert image.pixels() == (RGBA_PIXELS, 2, 2, 8, "RGBA")
+    assert_action_not_performed(image, "get pixels")
+
+
+def test_pil_pixels():
+    """The Pillow plugin can convert images to and from pixels."""
+    pil_image = PIL.Image.new("L", (3, 2), 128)
+    pixels = PILConverter.convert_to_pixels(pil_image)
+    # Modes other than RGB and RGBA are converted to RGBA.
+    assert pixels == (bytes([128, 128, 128, 255] * 6), 3, 2, 12, "RGBA")
+
+    pil_image = PILConverter.convert_from_pixels(
+        ImagePixels(RGBA_PIXELS, 2, 2, 8, "RGBA"), PIL.Image.Image
+    )
+    assert pil_image.mode == "RGBA"
+    assert pil_image.getpixel((0, 1)) == (0, 0, 255, 255)
+
+
 class ImageSubclass(toga.Image):
     pass
 
@@ -271,6 +488,8 @@ def test_as_format_pil(app):
     pil_image = toga_image.as_format(PIL.Image.Image)
     assert isinstance(pil_image, PIL.Image.Image)
     assert pil_image.size == (144, 72)
+    # The image is converted using its pixels.
+    assert_action_performed(toga_image, "get pixels")
 
 
 @pytest.mark.parametrize("ImageClass", [CustomImage, CustomImageSubclass])
@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# The widget modules that should only be imported when an app uses them.
+LAZY_WIDGETS = [
+    "activityindicator",
+    "box",
+    "button",
+    "canvas",
+    "dateinput",
+    "detailedlist",
+    "divider",
+    "imageview",
+    "label",
+    "mapview",
+    "multilinetextinput",
+    "numberinput",
+    "optioncontainer",
+    "passwordinput",
+    "progressbar",
+    "scrollcontainer",
+    "selection",
+    "slider",
+    "splitcontainer",
+    "switch",
+    "table",
+    "textinput",
+    "timeinput",
+    "tree",
+    "webview",
+]
+
+
+def imported_modules(code):
+    """Run code in a new interpreter.
+
+    :returns: The names of all the modules that have been imported once the code has
+        run.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "package",
+    ["toga.widgets", "toga_dummy.widgets"],
+)
+def test_import_toga(package):
+    """Importing toga and the backend doesn't import any widgets."""
+    modules = imported_modules("import toga, toga_dummy.factory")
+
+    assert "toga" in modules
+    assert "toga_dummy.factory" in modules
+    imported = [name for name in LAZY_WIDGETS if f"{package}.{name}" in modules]
+    assert imported == []
+    assert "toga.documents" not in modules
+    assert "toga.hardware.camera" not in modules
+    assert "toga.hardware.location" not in modules
+
+
+def test_lazy_access():
+    """A widget is imported when it's first accessed."""
+    modules = imported_modules(
+        "import toga, toga_dummy.factory\ntoga.Button, toga_dummy.factory.Button"
+    )
+
+    assert "toga.widgets.button" in modules
+    assert "toga_dummy.widgets.button" in modules
+    imported = [name for name in LAZY_WIDGETS if f"toga.widgets.{name}" in modules]
+    assert imported == ["button"]
+
+
+def test_lazy_hardware():
+    """The hardware APIs are imported when they're first used."""
+    modules = imported_modules(
+        "import toga, toga_dummy.factory\n"
+        "app = toga.App('Test App', 'org.beeware.toga.test-app')\n"
+        "app.camera"
+    )
+
+    assert "toga.hardware.camera" in modules
+    assert "toga.hardware.location" not in modules
+
+
+def test_lazy_attributes():
+    """Lazily imported names behave like any other attribute of the module."""
+    import toga
+    from toga.widgets.canvas import Canvas
+    from toga_dummy import factory
+
+    assert toga.Canvas is Canvas
+    # Once accessed, the name is stored in the module.
+    assert vars(toga)["Canvas"] is Canvas
+    assert "Canvas" in dir(toga)
+    assert factory.Canvas.__module__ == "toga_dummy.widgets.canvas"
+
+    with pytest.raises(
+        AttributeError, match=r"module 'toga' has no attribute 'Unknown'"
+    ):
+        toga.Unknown
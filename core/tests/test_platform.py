@@ -1,4 +1,6 @@
+import os
 import sys
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
@@ -6,11 +8,11 @@ import pytest
 import toga_dummy
 
 if sys.version_info >= (3, 10):
-    from importlib.metadata import EntryPoint
+    from importlib.metadata import EntryPoint, EntryPoints
 else:
     # Before Python 3.10, entry_points did not support the group argument;
     # so, the backport package must be used on older versions.
-    from importlib_metadata import EntryPoint
+    from importlib_metadata import EntryPoint, EntryPoints
 
 import toga.platform
 from toga.platform import current_platform, get_current_platform, get_platform_factory
@@ -42,14 +44,14 @@ def patch_platforms(monkeypatch, platforms):
         toga.platform,
         "entry_points",
         Mock(
-            return_value=[
+            return_value=EntryPoints(
                 EntryPoint(
                     name=current_platform if is_current else name,
                     value=f"{name}_module",
-                    group="self.backends",
+                    group="toga.backends",
                 )
                 for name, _, is_current in platforms
-            ]
+            )
         ),
     )
 
@@ -202,3 +204,136 @@ def test_environment_variable_fail(monkeypatch):
         match=r"The backend specified by TOGA_BACKEND \('fake_platform_module'\) could not be loaded.",
     ):
         _get_platform_factory()
+
+
+def entry_point_source(monkeypatch, entry_points):
+    """Patch the source of entry points, returning a mock of the scan."""
+    scan = Mock(
+        return_value=EntryPoints(
+            EntryPoint(name=name, value=value, group=group)
+            for group, name, value in entry_points
+        )
+    )
+    monkeypatch.setattr(toga.platform, "entry_points", scan)
+    return scan
+
+
+def test_get_entry_points(monkeypatch):
+    """The entry points in every Toga group are read at the same time."""
+    scan = entry_point_source(
+        monkeypatch,
+        [
+            ("toga.backends", "first", "first_module"),
+            ("toga.image_formats", "image", "image_module.Converter"),
+            ("other.group", "other", "other_module"),
+            # Editable installs can return duplicated entry points.
+            ("toga.backends", "second", "second_module"),
+            ("toga.backends", "first", "first_module"),
+        ],
+    )
+
+    assert toga.platform.get_entry_points("toga.backends") == [
+        EntryPoint(name="first", value="first_module", group="toga.backends"),
+        EntryPoint(name="second", value="second_module", group="toga.backends"),
+    ]
+    assert toga.platform.get_entry_points("toga.image_formats") == [
+        EntryPoint(
+            name="image", value="image_module.Converter", group="toga.image_formats"
+        ),
+    ]
+    assert toga.platform.get_entry_points("toga.unknown") == []
+    assert toga.platform.get_entry_points("other.group") == []
+    scan.assert_called_once_with()
+
+
+@pytest.fixture
+def site_packages(monkeypatch, tmp_path):
+    """An entry point cache directory, and a site-packages directory on sys.path."""
+    monkeypatch.setenv("TOGA_ENTRY_POINT_CACHE", str(tmp_path / "cache"))
+    site_packages = tmp_path / "site-packages"
+    (site_packages / "toga_first-1.0.dist-info").mkdir(parents=True)
+    monkeypatch.setattr(sys, "path", [str(site_packages), str(tmp_path / "missing")])
+    return site_packages
+
+
+def _get_entry_points(group):
+    # Simulate a new process.
+    toga.platform._toga_entry_points.cache_clear()
+    return [entry_point.value for entry_point in toga.platform.get_entry_points(group)]
+
+
+def test_entry_point_cache(monkeypatch, site_packages):
+    """Entry points are cached between processes until the installed distributions
+    change."""
+    entry_point_source(monkeypatch, [("toga.backends", "first", "first_module")])
+    assert _get_entry_points("toga.backends") == ["first_module"]
+    [cache_file] = (site_packages.parent / "cache").iterdir()
+
+    # The cache is used, even though the entry points have changed.
+    scan = entry_point_source(monkeypatch, [])
+    assert _get_entry_points("toga.backends") == ["first_module"]
+    scan.assert_not_called()
+
+    # Installing a distribution invalidates the cache.
+    (site_packages / "toga_second-1.0.dist-info").mkdir()
+    entry_point_source(monkeypatch, [("toga.backends", "second", "second_module")])
+    assert _get_entry_points("toga.backends") == ["second_module"]
+
+    # So does modifying a distribution.
+    os.utime(site_packages / "toga_first-1.0.dist-info", ns=(0, 0))
+    entry_point_source(monkeypatch, [("toga.backends", "third", "third_module")])
+    assert _get_entry_points("toga.backends") == ["third_module"]
+
+    # A corrupted cache file is ignored, and replaced.
+    cache_file.write_text("{", encoding="utf-8")
+    assert _get_entry_points("toga.backends") == ["third_module"]
+    scan = entry_point_source(monkeypatch, [])
+    assert _get_entry_points("toga.backends") == ["third_module"]
+    scan.assert_not_called()
+
+
+def test_entry_point_cache_sys_path(monkeypatch, site_packages):
+    """Each sys.path has its own cache."""
+    entry_point_source(monkeypatch, [("toga.backends", "first", "first_module")])
+    assert _get_entry_points("toga.backends") == ["first_module"]
+
+    monkeypatch.setattr(sys, "path", [str(site_packages)])
+    entry_point_source(monkeypatch, [("toga.backends", "second", "second_module")])
+    assert _get_entry_points("toga.backends") == ["second_module"]
+    assert len(list((site_packages.parent / "cache").iterdir())) == 2
+
+
+def test_entry_point_cache_unwritable(monkeypatch, site_packages):
+    """If the cache can't be written, the entry points are still returned."""
+    # The cache directory can't be created, because a file has the same name.
+    (site_packages.parent / "cache").write_text("", encoding="utf-8")
+    entry_point_source(monkeypatch, [("toga.backends", "first", "first_module")])
+    assert _get_entry_points("toga.backends") == ["first_module"]
+
+
+@pytest.mark.parametrize(
+    "platform, env, cache_dir",
+    [
+        ("macOS", {}, "{home}/Library/Caches/org.beeware.toga"),
+        ("windows", {}, "{home}/AppData/Local/toga"),
+        ("windows", {"LOCALAPPDATA": "/local"}, "/local/toga"),
+        ("linux", {}, "{home}/.cache/toga"),
+        ("freeBSD", {"XDG_CACHE_HOME": "/xdg"}, "/xdg/toga"),
+        ("android", {}, None),
+        ("linux", {"TOGA_ENTRY_POINT_CACHE": "/custom"}, "/custom"),
+        ("linux", {"TOGA_ENTRY_POINT_CACHE": ""}, None),
+    ],
+)
+def test_entry_point_cache_dir(monkeypatch, platform, env, cache_dir):
+    """The entry point cache is stored in the user's cache directory."""
+    monkeypatch.setattr(toga.platform, "current_platform", platform)
+    for name in ["TOGA_ENTRY_POINT_CACHE", "LOCALAPPDATA", "XDG_CACHE_HOME"]:
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    if cache_dir is None:
+        assert toga.platform._entry_point_cache_dir() is None
+    else:
+        expected = Path(cache_dir.format(home=Path.home()))
+        assert toga.platform._entry_point_cache_dir() == expected
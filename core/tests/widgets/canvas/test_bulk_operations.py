@@ -0,0 +1,139 @@
+from array import array
+from unittest.mock import Mock, call
+
+import pytest
+
+from toga.widgets.canvas import Points, Polyline, Rects
+from toga_dummy.utils import EventLog, assert_action_not_performed
+
+from .test_redraw import redraws
+
+
+@pytest.mark.parametrize(
+    "xs, ys",
+    [
+        ([10, 20, 30], [15, 25, 5]),
+        ((10.0, 20.0, 30.0), (15.0, 25.0, 5.0)),
+        (array("d", [10, 20, 30]), array("d", [15, 25, 5])),
+        (array("i", [10, 20, 30]), array("i", [15, 25, 5])),
+        (memoryview(array("d", [10, 20, 30])), memoryview(array("f", [15, 25, 5]))),
+    ],
+)
+def test_polyline(widget, xs, ys):
+    """A polyline can be added from any sequence or buffer of numbers."""
+    draw_op = widget.context.polyline(xs, ys)
+
+    assert_action_not_performed(widget, "redraw")
+    assert repr(draw_op) == "Polyline(count=3)"
+    assert len(draw_op) == 3
+    assert draw_op.xs == array("d", [10, 20, 30])
+    assert draw_op.ys == array("d", [15, 25, 5])
+
+    # The first and last instructions can be ignored as they are the
+    assert widget._impl.draw_instructions[1:-1] == [
+        ("polyline", {"xs": [10, 20, 30], "ys": [15, 25, 5]}),
+    ]
+
+
+def test_points(widget):
+    """A point cloud can be added."""
+    draw_op = widget.context.points([10, 20], [30, 40], size=3)
+
+    assert_action_not_performed(widget, "redraw")
+    assert repr(draw_op) == "Points(count=2, size=3)"
+
+    # The first and last instructions can be ignored as they are the
+    assert widget._impl.draw_instructions[1:-1] == [
+        ("points", {"xs": [10, 20], "ys": [30, 40], "size": 3}),
+    ]
+
+
+def test_rects(widget):
+    """A series of rectangles can be added."""
+    draw_op = widget.context.rects([10, 20], [30, 40], [5, 6], 7)
+
+    assert_action_not_performed(widget, "redraw")
+    assert repr(draw_op) == "Rects(count=2)"
+    # A single size is used for every rectangle.
+    assert draw_op.heights == array("d", [7, 7])
+
+    # The first and last instructions can be ignored as they are the
+    assert widget._impl.draw_instructions[1:-1] == [
+        (
+            "rects",
+            {"xs": [10, 20], "ys": [30, 40], "widths": [5, 6], "heights": [7, 7]},
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "cls, args, message",
+    [
+        (Polyline, ([1, 2], [1]), r"ys has 1 values; expected 2."),
+        (Points, ([1, 2], [1, 2, 3]), r"ys has 3 values; expected 2."),
+        (Rects, ([1, 2], [1, 2], [1], 1), r"widths has 1 values; expected 2."),
+        (Rects, ([1, 2], [1, 2], 1, [1, 2, 3]), r"heights has 3 values; expected 2."),
+    ],
+)
+def test_length_mismatch(cls, args, message):
+    """The sequences of a bulk operation must have the same length."""
+    with pytest.raises(ValueError, match=message):
+        cls(*args)
+
+
+def test_fallback():
+    """Bulk operations are drawn as individual operations if the backend doesn't
+    support them."""
+    impl = Mock(spec=["move_to", "line_to", "rect"])
+
+    Polyline([10, 20, 30], [15, 25, 5])._draw(impl, extra=1)
+    assert impl.mock_calls == [
+        call.move_to(10, 15, extra=1),
+        call.line_to(20, 25, extra=1),
+        call.line_to(30, 5, extra=1),
+    ]
+
+    # An empty polyline doesn't draw anything.
+    impl.reset_mock()
+    Polyline([], [])._draw(impl)
+    assert impl.mock_calls == []
+
+    Points([10, 20], [30, 40], size=2)._draw(impl)
+    assert impl.mock_calls == [
+        call.rect(9, 29, 2, 2),
+        call.rect(19, 39, 2, 2),
+    ]
+
+    impl.reset_mock()
+    Rects([10, 20], [30, 40], [5, 6], [7, 8])._draw(impl)
+    assert impl.mock_calls == [
+        call.rect(10, 30, 5, 7),
+        call.rect(20, 40, 6, 8),
+    ]
+
+
+def test_redraw(widget):
+    """Bulk operations redraw the region they cover when they are painted."""
+    EventLog.reset()
+    with widget.Fill() as fill:
+        fill.polyline([10, 50, 30], [40, 20, 60])
+    assert redraws(widget) == [(10, 20, 40, 40)]
+
+    EventLog.reset()
+    with widget.Fill() as fill:
+        fill.points([100, 110], [100, 120], size=4)
+    assert redraws(widget) == [(98, 98, 14, 24)]
+
+    # Rectangles can have negative sizes.
+    EventLog.reset()
+    with widget.Fill() as fill:
+        fill.rects([200, 220], [200, 220], [10, -30], [10, -30])
+    assert redraws(widget) == [(190, 190, 30, 30)]
+
+    # Empty bulk operations don't paint anything.
+    EventLog.reset()
+    with widget.Fill() as fill:
+        fill.polyline([], [])
+        fill.points([], [])
+        fill.rects([], [], 1, 1)
+    assert redraws(widget) == []
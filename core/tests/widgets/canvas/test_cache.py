@@ -0,0 +1,139 @@
+import pytest
+
+from toga.colors import rgb
+from toga.constants import FillRule
+from toga.widgets.canvas import Translate
+from toga_dummy.utils import (
+    EventLog,
+    assert_action_not_performed,
+    assert_action_performed_with,
+)
+
+
+@pytest.fixture
+def widget(widget):
+    EventLog.reset()
+    return widget
+
+
+@pytest.fixture
+def grid(widget):
+    with widget.Context(cache=True) as grid:
+        grid.begin_path()
+        grid.rect(10, 10, 20, 20)
+        grid.fill()
+    return grid
+
+
+def test_cache(widget, grid):
+    """A cached context is only rendered once."""
+    assert grid.cache
+    assert widget._impl.draw_instructions == [
+        ("push context", {}),
+        ("push context", {}),
+        ("begin path", {}),
+        ("rect", {"x": 10, "y": 10, "width": 20, "height": 20}),
+        ("fill", {"color": rgb(0, 0, 0), "fill_rule": FillRule.NONZERO}),
+        ("pop context", {}),
+        ("pop context", {}),
+    ]
+    assert_action_performed_with(widget, "render cache", rect=(10, 10, 20, 20))
+
+    # Drawing the canvas again uses the cached rendering.
+    EventLog.reset()
+    instructions = widget._impl.draw_instructions
+    assert instructions[2:5] == [
+        ("begin path", {}),
+        ("rect", {"x": 10, "y": 10, "width": 20, "height": 20}),
+        ("fill", {"color": rgb(0, 0, 0), "fill_rule": FillRule.NONZERO}),
+    ]
+    assert_action_not_performed(widget, "render cache")
+
+    # Changes outside the context don't affect the cached rendering.
+    with widget.Fill() as fill:
+        fill.rect(100, 100, 10, 10)
+    widget._impl.draw_instructions
+    assert_action_not_performed(widget, "render cache")
+
+
+def test_content_change(widget, grid):
+    """A change to the content of a cached context renders it again."""
+    widget._impl.draw_instructions
+    EventLog.reset()
+
+    grid.begin_path()
+    grid.rect(40, 40, 10, 10)
+    grid.fill()
+    widget._impl.draw_instructions
+    assert_action_performed_with(widget, "render cache", rect=(10, 10, 40, 40))
+
+    # A change to a context nested in the cached context
+    with grid.Fill() as fill:
+        widget._impl.draw_instructions
+        EventLog.reset()
+        fill.rect(0, 0, 5, 5)
+    widget._impl.draw_instructions
+    assert_action_performed_with(widget, "render cache", rect=(0, 0, 50, 50))
+
+    # A change to the properties of an object in the context
+    widget._impl.draw_instructions
+    EventLog.reset()
+    grid[1].width = 25
+    grid.redraw()
+    widget._impl.draw_instructions
+    assert_action_performed_with(widget, "render cache", rect=(0, 0, 50, 50))
+
+    # A full redraw of the canvas after a change to a property
+    EventLog.reset()
+    grid[1].height = 25
+    widget.redraw()
+    widget._impl.draw_instructions
+    assert_action_performed_with(widget, "render cache", rect=(0, 0, 50, 50))
+
+
+def test_redraw(widget, grid):
+    """A cached context survives a full redraw of the canvas if it hasn't changed."""
+    widget._impl.draw_instructions
+    EventLog.reset()
+
+    widget.redraw()
+    widget._impl.draw_instructions
+    assert_action_not_performed(widget, "render cache")
+
+    # A change to an object outside the cached context doesn't affect it.
+    with widget.Fill() as fill:
+        rect = fill.rect(100, 100, 10, 10)
+    widget._impl.draw_instructions
+    EventLog.reset()
+    rect.width = 20
+    widget.redraw()
+    widget._impl.draw_instructions
+    assert_action_not_performed(widget, "render cache")
+
+
+def test_transform_change(widget, grid):
+    """A change to the transformation in effect at the start of a cached context renders
+    it again."""
+    widget._impl.draw_instructions
+    EventLog.reset()
+
+    widget.context.insert(0, Translate(5, 5))
+    widget._impl.draw_instructions
+    assert_action_performed_with(widget, "render cache", rect=(15, 15, 20, 20))
+
+
+def test_not_cacheable(widget):
+    """A context that shares a path with its parent isn't cached."""
+    with widget.Context(cache=True) as context:
+        context.rect(10, 10, 20, 20)
+    widget.context.fill()
+
+    assert widget._impl.draw_instructions == [
+        ("push context", {}),
+        ("push context", {}),
+        ("rect", {"x": 10, "y": 10, "width": 20, "height": 20}),
+        ("pop context", {}),
+        ("fill", {"color": rgb(0, 0, 0), "fill_rule": FillRule.NONZERO}),
+        ("pop context", {}),
+    ]
+    assert_action_not_performed(widget, "render cache")
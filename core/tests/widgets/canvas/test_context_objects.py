@@ -9,7 +9,7 @@ from toga.widgets.canvas import (
     LineTo,
     StrokeContext,
 )
-from toga_dummy.utils import assert_action_performed
+from toga_dummy.utils import assert_action_not_performed
 
 REBECCA_PURPLE_COLOR = rgb(102, 51, 153)
 
@@ -22,7 +22,7 @@ def test_subcontext(widget):
     assert isinstance(subcontext, Context)
     assert subcontext != widget.context
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(subcontext) == "Context()"
 
     # The first and last instructions can be ignored; they're the root canvas context
@@ -75,7 +75,7 @@ def test_closed_path(widget, kwargs, args_repr, has_move, properties):
     assert isinstance(closed_path, ClosedPathContext)
     assert repr(closed_path) == f"ClosedPathContext({args_repr})"
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
 
     # All the attributes can be retrieved.
     for attr, value in properties.items():
@@ -3,7 +3,7 @@ import pytest
 from toga.colors import REBECCAPURPLE, rgb
 from toga.constants import Baseline, FillRule
 from toga.fonts import SYSTEM, SYSTEM_DEFAULT_FONT_SIZE, Font
-from toga_dummy.utils import assert_action_performed
+from toga_dummy.utils import assert_action_not_performed, assert_action_performed
 
 REBECCA_PURPLE_COLOR = rgb(102, 51, 153)
 
@@ -12,7 +12,7 @@ def test_begin_path(widget):
     """A begin path operation can be added."""
     draw_op = widget.context.begin_path()
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == "BeginPath()"
 
     # The first and last instructions can be ignored as they are the
@@ -25,7 +25,7 @@ def test_close_path(widget):
     """A close path operation can be added."""
     draw_op = widget.context.close_path()
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == "ClosePath()"
 
     # The first and last instructions can be ignored as they are the
@@ -91,7 +91,7 @@ def test_fill(widget, kwargs, args_repr, draw_kwargs):
     """A primitive fill operation can be added."""
     draw_op = widget.context.fill(**kwargs)
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == f"Fill({args_repr})"
 
     # The first and last instructions can be ignored as they are the
@@ -161,7 +161,7 @@ def test_stroke(widget, kwargs, args_repr, draw_kwargs):
     """A primitive stroke operation can be added."""
     draw_op = widget.context.stroke(**kwargs)
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == f"Stroke({args_repr})"
 
     # The first and last instructions can be ignored as they are the
@@ -178,7 +178,7 @@ def test_move_to(widget):
     """A move to operation can be added."""
     draw_op = widget.context.move_to(10, 20)
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == "MoveTo(x=10, y=20)"
 
     # The first and last instructions can be ignored as they are the
@@ -195,7 +195,7 @@ def test_line_to(widget):
     """A line to operation can be added."""
     draw_op = widget.context.line_to(10, 20)
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == "LineTo(x=10, y=20)"
 
     # The first and last instructions can be ignored as they are the
@@ -212,7 +212,7 @@ def test_bezier_curve_to(widget):
     """A Bézier curve to operation can be added."""
     draw_op = widget.context.bezier_curve_to(10, 20, 30, 40, 50, 60)
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert (
         repr(draw_op) == "BezierCurveTo(cp1x=10, cp1y=20, cp2x=30, cp2y=40, x=50, y=60)"
     )
@@ -238,7 +238,7 @@ def test_quadratic_curve_to(widget):
     """A Quadratic curve to operation can be added."""
     draw_op = widget.context.quadratic_curve_to(10, 20, 30, 40)
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == "QuadraticCurveTo(cpx=10, cpy=20, x=30, y=40)"
 
     # The first and last instructions can be ignored as they are the
@@ -365,7 +365,7 @@ def test_arc(widget, kwargs, args_repr, draw_kwargs):
     """An arc operation can be added."""
     draw_op = widget.context.arc(**kwargs)
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == f"Arc({args_repr})"
 
     # The first and last instructions can be ignored as they are the
@@ -522,7 +522,7 @@ def test_ellipse(widget, kwargs, args_repr, draw_kwargs):
     """An ellipse operation can be added."""
     draw_op = widget.context.ellipse(**kwargs)
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == f"Ellipse({args_repr})"
 
     # The first and last instructions can be ignored as they are the
@@ -539,7 +539,7 @@ def test_rect(widget):
     """A rect operation can be added."""
     draw_op = widget.context.rect(10, 20, 30, 40)
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == "Rect(x=10, y=20, width=30, height=40)"
 
     # The first and last instructions can be ignored as they are the
@@ -622,7 +622,7 @@ def test_rotate(widget):
     """A rotate operation can be added."""
     draw_op = widget.context.rotate(1.234)
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == "Rotate(radians=1.234)"
 
     # The first and last instructions can be ignored as they are the
@@ -638,7 +638,7 @@ def test_scale(widget):
     """A scale operation can be added."""
     draw_op = widget.context.scale(1.234, 2.345)
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == "Scale(sx=1.234, sy=2.345)"
 
     # The first and last instructions can be ignored as they are the
@@ -655,7 +655,7 @@ def test_translate(widget):
     """A translate operation can be added."""
     draw_op = widget.context.translate(10, 20)
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == "Translate(tx=10, ty=20)"
 
     # The first and last instructions can be ignored as they are the
@@ -672,7 +672,7 @@ def test_reset_transform(widget):
     """A reset transform operation can be added."""
     draw_op = widget.context.reset_transform()
 
-    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw")
     assert repr(draw_op) == "ResetTransform()"
 
     # The first and last instructions can be ignored as they are the
@@ -0,0 +1,140 @@
+import toga
+from toga.widgets.canvas import Fill, Stroke, Translate
+
+
+def test_objects_at(widget):
+    """The drawing objects that paint at a point can be found, topmost first."""
+    with widget.Fill(color="red") as back:
+        back.rect(0, 0, 100, 100)
+    with widget.Stroke(line_width=2) as outline:
+        outline.rect(50, 50, 20, 20)
+    with widget.Context() as context:
+        context.rect(60, 60, 10, 10)
+        fill = context.fill()
+        # Objects that don't paint anything aren't found.
+        context.move_to(65, 65)
+
+    assert widget.objects_at(65, 65) == [fill, outline, back]
+    assert widget.objects_at(10, 10) == [back]
+    # The region painted by a stroke includes the width of the line.
+    assert widget.objects_at(45, 45) == [outline, back]
+    # The edges of an object are included.
+    assert widget.objects_at(100, 100) == [back]
+    assert widget.objects_at(150, 150) == []
+
+
+def test_nested(widget):
+    """Objects in nested contexts are found, after the context that contains them."""
+    with widget.Stroke() as stroke:
+        with stroke.Fill() as fill:
+            fill.rect(10, 10, 10, 10)
+        stroke.rect(0, 0, 50, 50)
+    text = widget.context.write_text("Hello", 5, 30)
+
+    assert widget.objects_at(15, 15) == [stroke, fill]
+    assert widget.objects_at(15, 25) == [text, stroke]
+
+
+def test_objects_in(widget):
+    """The drawing objects that paint in a region can be found."""
+    with widget.Fill() as first:
+        first.rect(0, 0, 10, 10)
+    with widget.Fill() as second:
+        second.rect(100, 0, 10, 10)
+
+    assert widget.objects_in(5, 5, 100, 10) == [second, first]
+    assert widget.objects_in(20, 0, 50, 50) == []
+    # The rectangle can have a negative size.
+    assert widget.objects_in(50, 50, -40, -40) == [first]
+
+
+def test_index(widget):
+    """Contexts with many objects use a spatial index."""
+    fills = {}
+    for x in range(10):
+        for y in range(10):
+            widget.context.rect(x * 20, y * 20, 10, 10)
+            fills[x, y] = widget.context.fill()
+    # An object that covers most of the canvas
+    widget.context.rect(0, 0, 1000, 1000)
+    background = widget.context.stroke()
+    # An object whose extent can't be bounded
+    unbounded = Fill()
+    unbounded._extent = lambda state: (-float("inf"), -float("inf"), 0, 0)
+    widget.context.append(unbounded)
+
+    assert widget.objects_at(25, 45) == [background, fills[1, 2]]
+    assert widget.objects_at(-5, -5) == [unbounded, background]
+    assert widget.objects_in(15, 15, 30, 10) == [
+        background,
+        fills[2, 1],
+        fills[1, 1],
+    ]
+    # A region that covers the whole index.
+    assert len(widget.objects_in(-10, -10, 2000, 2000)) == 102
+
+    index = widget.context._index
+    # Each of the small objects overlaps 4 cells.
+    assert len(index.cells) == 400
+    assert index.others == [201, 202]
+
+    # The index is only rebuilt when the content of the context changes.
+    widget.objects_at(0, 0)
+    assert widget.context._index is index
+
+    widget.context.rect(25, 45, 1, 1)
+    extra = widget.context.fill()
+    assert widget.objects_at(25, 45) == [extra, background, fills[1, 2]]
+    assert widget.context._index is not index
+
+    # Property changes are used once the canvas has been redrawn.
+    widget.context[0].x = 25
+    widget.context[0].y = 45
+    widget.redraw()
+    assert widget.objects_at(25, 45) == [extra, background, fills[1, 2], fills[0, 0]]
+
+
+def test_index_moved(widget):
+    """The index is rebuilt when the objects of a context move, even if the content of
+    the context hasn't changed."""
+    fills = {}
+    with widget.Context() as context:
+        for x in range(10):
+            for y in range(10):
+                context.rect(x * 20, y * 20, 10, 10)
+                fills[x, y] = context.fill()
+    assert widget.objects_at(25, 45) == [fills[1, 2]]
+    version = context._version
+
+    widget.context.insert(0, Translate(100, 0))
+    assert context._version == version
+    assert widget.objects_at(25, 45) == []
+    assert widget.objects_at(125, 45) == [fills[1, 2]]
+
+
+def test_removed(widget):
+    """Objects that have been removed from a context aren't found."""
+    with widget.Fill() as fill:
+        fill.rect(0, 0, 10, 10)
+    with widget.Stroke() as stroke:
+        stroke.rect(0, 0, 10, 10)
+        stroke.stroke()
+        inner = stroke[-1]
+
+    # The path is painted by the inner stroke, so the context doesn't paint anything.
+    assert isinstance(inner, Stroke)
+    assert widget.objects_at(5, 5) == [inner, fill]
+
+    stroke.remove(inner)
+    widget.context.remove(fill)
+    assert widget.objects_at(5, 5) == [stroke]
+
+
+def test_offscreen():
+    """Objects can be found on an offscreen canvas."""
+    canvas = toga.OffscreenCanvas(100, 100)
+    with canvas.Fill() as fill:
+        fill.rect(10, 10, 10, 10)
+
+    assert canvas.objects_at(15, 15) == [fill]
+    assert canvas.objects_in(0, 0, 5, 5) == []
@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import toga
+from toga.colors import rgb
+from toga.constants import FillRule
+from toga_dummy.utils import (
+    EventLog,
+    assert_action_not_performed,
+    assert_action_performed,
+    assert_action_performed_with,
+)
+
+
+@pytest.fixture
+def canvas():
+    canvas = toga.OffscreenCanvas(200, 100)
+    with canvas.Fill(color="red") as fill:
+        fill.rect(10, 20, 30, 40)
+    return canvas
+
+
+def test_create():
+    """An offscreen canvas can be created without an app."""
+    canvas = toga.OffscreenCanvas(200, 100)
+    assert canvas._impl.interface is canvas
+    assert_action_performed(canvas, "create OffscreenCanvas")
+
+    assert canvas.width == 200
+    assert canvas.height == 100
+    assert canvas.size == (200, 100)
+    assert len(canvas.context) == 0
+
+
+def test_draw(canvas):
+    """Drawing on an offscreen canvas doesn't request a redraw, but the content is
+    used when the canvas is rendered."""
+    assert_action_not_performed(canvas, "redraw")
+    assert canvas._impl.draw_instructions == [
+        ("push context", {}),
+        ("push context", {}),
+        ("begin path", {}),
+        (
+            "rect",
+            {
+                "x": 10,
+                "y": 20,
+                "width": 30,
+                "height": 40,
+                "fill_color": rgb(255, 0, 0),
+                "fill_rule": FillRule.NONZERO,
+            },
+        ),
+        ("fill", {"color": rgb(255, 0, 0), "fill_rule": FillRule.NONZERO}),
+        ("pop context", {}),
+        ("pop context", {}),
+    ]
+
+    # Property changes are used once the canvas is redrawn.
+    canvas.context[0][0].x = 50
+    canvas.redraw()
+    assert_action_not_performed(canvas, "redraw")
+    assert canvas._impl.draw_instructions[3][1]["x"] == 50
+
+
+def test_measure_text(canvas):
+    """Text can be measured on an offscreen canvas."""
+    assert canvas.measure_text("Hello world") == (132, 12)
+
+
+def test_as_image(canvas):
+    """An offscreen canvas can be rendered as an image."""
+    image = canvas.as_image()
+    assert isinstance(image, toga.Image)
+    assert_action_performed_with(
+        canvas,
+        "render",
+        size=(200, 100),
+        draw_instructions=canvas._impl.draw_instructions,
+    )
+
+
+def test_save(canvas, tmp_path):
+    """An offscreen canvas can be saved as an image."""
+    path = tmp_path / "canvas.png"
+    canvas.save(path)
+    assert_action_performed(canvas, "render")
+    assert_action_not_performed(canvas, "save vector")
+
+
+@pytest.mark.parametrize("filename", ["canvas.pdf", "canvas.SVG"])
+def test_save_vector(canvas, tmp_path, filename):
+    """An offscreen canvas can be saved in a vector format, if the backend supports
+    it."""
+    path = tmp_path / filename
+    canvas.save(str(path))
+    assert_action_performed_with(canvas, "save vector", path=path)
+    assert_action_not_performed(canvas, "render")
+    assert path.read_text(encoding="utf-8").startswith("[('push context', {})")
+
+
+def test_threads():
+    """Offscreen canvases can be drawn and rendered on worker threads."""
+
+    def render(i):
+        canvas = toga.OffscreenCanvas(100, 100)
+        with canvas.Stroke(color="blue") as stroke:
+            stroke.polyline(range(i + 1), range(i + 1))
+        canvas.as_image()
+        return canvas
+
+    EventLog.reset()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        canvases = list(executor.map(render, range(8)))
+
+    for i, canvas in enumerate(canvases):
+        assert len(canvas.context[0][0]) == i + 1
+        assert_action_performed(canvas, "render")
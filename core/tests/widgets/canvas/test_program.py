@@ -0,0 +1,113 @@
+from unittest.mock import Mock, call
+
+import pytest
+
+from toga.colors import rgb
+from toga.constants import FillRule
+
+
+@pytest.fixture
+def scene(widget):
+    with widget.Stroke(line_width=3) as stroke:
+        with stroke.Fill(color="red") as fill:
+            fill.rect(30, 30, 10, 10)
+        stroke.move_to(10, 10)
+        stroke.line_to(60, 20)
+    with widget.Context(cache=True) as cached:
+        cached.rect(50, 50, 10, 10)
+        cached.fill()
+    return widget
+
+
+def test_program(scene):
+    """A context is compiled into a program that draws the same content as drawing
+    each object in turn."""
+    context = scene.context
+    impl = scene._impl
+    tree = []
+    context._draw_tree(impl, draw_instructions=tree)
+    assert impl.draw_instructions == tree
+
+    # The program is a single list of operations, except for the cached context,
+    # which is drawn separately.
+    program = context._program
+    assert len(program) == 3
+    assert program[1] == (context[1], {})
+    assert program[0][:3] == [
+        ("push_context", (), {}),
+        ("push_context", (), {}),
+        ("begin_path", (), {}),
+    ]
+    # Operations inside fill and stroke contexts carry the arguments they inherit.
+    assert program[0][5] == (
+        "rect",
+        (30, 30, 10, 10),
+        {
+            "stroke_color": rgb(0, 0, 0),
+            "line_width": 3.0,
+            "line_dash": None,
+            "fill_color": rgb(255, 0, 0),
+            "fill_rule": FillRule.NONZERO,
+        },
+    )
+
+
+def test_recompile(scene):
+    """A program is only compiled again when the content of the context changes."""
+    context = scene.context
+    scene._impl.draw_instructions
+    program = context._program
+
+    scene._impl.draw_instructions
+    assert context._program is program
+
+    # Adding to a nested context recompiles the program.
+    context[0][0].rect(0, 0, 5, 5)
+    instructions = scene._impl.draw_instructions
+    assert context._program is not program
+    assert instructions[6][0] == "rect"
+    assert instructions[6][1]["x"] == 0
+
+    # Drawing the canvas without changing it doesn't recompile the program.
+    program = context._program
+    scene._impl.draw_instructions
+    assert context._program is program
+
+    # Changing the properties of a drawing object recompiles the program once the
+    # canvas is redrawn.
+    context[0][2].x = 25
+    scene.redraw()
+    instructions = scene._impl.draw_instructions
+    assert instructions[10][0] == "line to"
+    assert instructions[10][1]["x"] == 25
+    assert context._program is not program
+
+
+def test_partial_draw(scene):
+    """Contexts that are partially outside the region being drawn are drawn one object
+    at a time; contexts that are inside the region use their compiled program."""
+    full = scene._impl.draw_instructions
+    region = scene._impl.draw_region(0, 0, 45, 45)
+    # The cached context is skipped.
+    assert region == full[:12] + full[16:]
+    # The stroke context extends outside the region, but the fill context doesn't.
+    assert scene.context[0]._program == []
+    assert scene.context[0][0]._program != []
+
+
+def test_fallback(scene):
+    """A program can be run by a backend that can't run lists of operations."""
+    impl = Mock(spec=["push_context", "pop_context", "begin_path", "rect", "fill"])
+    with scene.Fill() as fill:
+        fill.rect(0, 0, 5, 5)
+    fill._run(impl, {"extra": 1})
+
+    assert impl.mock_calls == [
+        call.push_context(extra=1),
+        call.begin_path(extra=1),
+        call.rect(
+            0, 0, 5, 5, fill_color=rgb(0, 0, 0), fill_rule=FillRule.NONZERO, extra=1
+        ),
+        call.fill(rgb(0, 0, 0), fill_rule=FillRule.NONZERO, extra=1),
+        call.pop_context(extra=1),
+    ]
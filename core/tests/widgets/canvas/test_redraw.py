@@ -0,0 +1,335 @@
+import asyncio
+
+import pytest
+
+from toga.colors import rgb
+from toga.widgets.canvas import DrawingObject, Translate
+from toga_dummy.utils import EventLog
+
+
+def redraws(widget):
+    """The regions that have been redrawn since the event log was last reset. A full
+    redraw of the canvas is reported as ``None``."""
+    try:
+        actions = EventLog.performed_actions(widget, "redraw")
+    except AttributeError:
+        return []
+    return [action.get("rect") for action in actions]
+
+
+@pytest.fixture
+def widget(widget):
+    EventLog.reset()
+    return widget
+
+
+def test_fill(widget):
+    """Filling a path redraws the region covered by the path."""
+    with widget.Fill(color="red") as fill:
+        # An empty fill doesn't paint anything.
+        assert redraws(widget) == []
+
+        fill.rect(10, 20, 30, 40)
+        assert redraws(widget) == [(10, 20, 30, 40)]
+
+        EventLog.reset()
+        fill.move_to(5, 70)
+        fill.line_to(10, 75.5)
+        # The region is expanded to whole pixels.
+        assert redraws(widget) == [(5, 20, 35, 50), (5, 20, 35, 56)]
+
+
+def test_stroke(widget):
+    """Stroking a path redraws the region covered by the path, allowing for the line
+    width."""
+    with widget.Stroke(line_width=2) as stroke:
+        stroke.rect(10, 20, 30, 40)
+    assert redraws(widget) == [(0, 10, 50, 60)]
+
+    # Stroke primitives are also expanded by the line width.
+    EventLog.reset()
+    widget.context.begin_path()
+    widget.context.move_to(100, 100)
+    widget.context.line_to(200, 100)
+    assert redraws(widget) == []
+    widget.context.stroke(line_width=1)
+    assert redraws(widget) == [(95, 95, 110, 10)]
+
+
+def test_transform(widget):
+    """Transformations are applied to the redrawn region."""
+    widget.context.translate(100, 50)
+    widget.context.scale(2, 2)
+    assert redraws(widget) == []
+
+    with widget.Fill() as fill:
+        fill.rect(10, 20, 30, 40)
+    assert redraws(widget) == [(120, 90, 60, 80)]
+
+    # Transformations within a context don't affect the following objects.
+    EventLog.reset()
+    with widget.Fill() as fill:
+        fill.rotate(1)
+        fill.reset_transform()
+        fill.rect(0, 0, 10, 10)
+    widget.context.fill()
+    with widget.Fill() as fill:
+        fill.rect(10, 20, 30, 40)
+    assert redraws(widget) == [(0, 0, 10, 10), (120, 90, 60, 80)]
+
+
+def test_write_text(widget):
+    """Text redraws the region covered by the text."""
+    # The dummy backend measures each character as 12x12 pixels. Text outside a fill
+    # or stroke context isn't painted, but the region is still redrawn.
+    widget.context.write_text("Hello", 10, 50)
+    assert redraws(widget) == [(10, 38, 60, 24)]
+
+    EventLog.reset()
+    with widget.Stroke(line_width=1) as stroke:
+        stroke.write_text("Hello", 10, 50)
+    assert redraws(widget) == [(5, 33, 70, 34)]
+
+
+def test_remove(widget):
+    """Removing a context redraws the region it covered."""
+    with widget.Fill() as first:
+        first.rect(10, 10, 10, 10)
+    with widget.Fill() as second:
+        second.rect(100, 100, 10, 10)
+
+    EventLog.reset()
+    widget.context.remove(first)
+    assert redraws(widget) == [(10, 10, 10, 10)]
+
+    # Re-inserting the context before another context only redraws the context.
+    EventLog.reset()
+    widget.context.insert(0, first)
+    assert redraws(widget) == [(10, 10, 10, 10)]
+
+    # Removing a drawing object from a context redraws the context.
+    EventLog.reset()
+    second.remove(second[0])
+    assert redraws(widget) == [(100, 100, 10, 10)]
+
+    # Changes to a context that has been removed don't redraw anything.
+    widget.context.remove(second)
+    EventLog.reset()
+    second.rect(50, 50, 10, 10)
+    assert redraws(widget) == []
+
+    # Clearing the canvas redraws everything that was painted.
+    EventLog.reset()
+    widget.context.rect(200, 200, 10, 10)
+    widget.context.fill()
+    widget.context.clear()
+    assert redraws(widget) == [(200, 200, 10, 10), (10, 10, 200, 200)]
+
+
+def test_context_redraw(widget):
+    """A context can be redrawn after its objects have been modified."""
+    with widget.Fill() as fill:
+        rect = fill.rect(10, 10, 10, 10)
+    with widget.Fill() as other:
+        other.rect(100, 100, 10, 10)
+
+    EventLog.reset()
+    rect.x = 30
+    fill.redraw()
+    # Both the old and new position of the rectangle are redrawn.
+    assert redraws(widget) == [(10, 10, 30, 10)]
+
+    # A full redraw of the canvas redraws everything.
+    EventLog.reset()
+    widget.redraw()
+    assert redraws(widget) == [None]
+
+
+def test_reused_extents(widget, monkeypatch):
+    """Redrawing the canvas only computes the extents of modified objects again."""
+    measured = []
+    measure_text = widget.measure_text
+
+    def counting_measure_text(text, font=None):
+        measured.append(text)
+        return measure_text(text, font)
+
+    monkeypatch.setattr(widget, "measure_text", counting_measure_text)
+    with widget.Fill() as fill:
+        first = fill.write_text("Hello", 10, 50)
+        fill.write_text("World", 10, 100)
+    assert measured == ["Hello", "World"]
+
+    # Unmodified objects aren't measured again.
+    measured.clear()
+    widget.redraw()
+    assert measured == []
+    assert fill._painted == (10, 38, 70, 112)
+
+    # A modified object is measured again.
+    first.text = "Goodbye"
+    widget.redraw()
+    assert measured == ["Goodbye"]
+    assert fill._painted == (10, 38, 94, 112)
+
+    # An object that is drawn with a different transformation is measured again.
+    measured.clear()
+    widget.context.insert(0, Translate(5, 0))
+    assert measured == ["Goodbye", "World"]
+    assert fill._painted == (15, 38, 99, 112)
+
+
+def test_shared_path(widget):
+    """Changes to a path that is painted outside its context redraw the region affected
+    by the path."""
+    with widget.ClosedPath(10, 10) as path:
+        path.line_to(20, 20)
+    assert redraws(widget) == []
+
+    widget.context.fill()
+    assert redraws(widget) == [(10, 10, 10, 10)]
+
+    # The path is filled after the path context, so extending the path redraws the
+    # region filled by the root context.
+    EventLog.reset()
+    path.line_to(50, 50)
+    assert redraws(widget) == [(10, 10, 40, 40)]
+
+    # A fill context nested in a context that is the last object in its parent
+    EventLog.reset()
+    widget.context.begin_path()
+    with widget.Context() as context:
+        context.rect(200, 200, 10, 10)
+        with context.Fill() as fill:
+            fill.rect(300, 300, 10, 10)
+    assert redraws(widget) == [(300, 300, 10, 10)]
+
+
+def test_unbounded(widget):
+    """A drawing object whose extent isn't known redraws the entire canvas."""
+
+    class Custom(DrawingObject):
+        def _draw(self, impl, **kwargs):
+            pass
+
+    widget.context.append(Custom())
+    assert redraws(widget) == [None]
+
+    # Everything painted after the object is also unbounded.
+    EventLog.reset()
+    widget.context.fill()
+    assert redraws(widget) == [None]
+
+
+def test_clipped_draw(widget):
+    """Contexts outside the region being drawn are skipped."""
+    with widget.Fill(color="red") as first:
+        first.rect(10, 10, 10, 10)
+    with widget.Fill(color="blue") as second:
+        second.rect(100, 100, 10, 10)
+    with widget.ClosedPath(100, 100) as path:
+        path.line_to(110, 110)
+
+    full = widget._impl.draw_instructions
+    region = widget._impl.draw_region(0, 0, 50, 50)
+
+    # The second fill isn't drawn; the closed path is, because it leaves a path behind.
+    assert region == full[:6] + full[11:]
+    assert ("line to", {"x": 110, "y": 110}) in region
+
+    # A region containing everything draws everything.
+    assert widget._impl.draw_region(0, 0, 1000, 1000) == full
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_nested_fill_draw(widget, cache):
+    """The arguments of a nested context take precedence over those of the contexts
+    that contain it, however the nested context is drawn."""
+    with widget.Fill(color="red") as outer:
+        with outer.Context(cache=cache) as middle:
+            with middle.Fill(color="blue") as inner:
+                inner.write_text("Hello", 10, 20)
+        outer.rect(200, 200, 10, 10)
+
+    def text_colors(instructions):
+        return [
+            kwargs["fill_color"]
+            for name, kwargs in instructions
+            if name == "write text"
+        ]
+
+    blue = rgb(0, 0, 255)
+    assert text_colors(widget._impl.draw_instructions) == [blue]
+    # The middle context is entirely inside the region, so it's drawn as a whole
+    # within a partially drawn parent.
+    assert text_colors(widget._impl.draw_region(0, 0, 100, 100)) == [blue]
+    assert text_colors(widget._impl.draw_instructions) == [blue]
+    if cache:
+        assert EventLog.performed_actions(widget, "render cache")
+
+
+def test_hold_redraw(widget):
+    """Redraws can be held, and are performed once when the hold is released."""
+    with widget.hold_redraw():
+        with widget.Fill() as fill:
+            fill.rect(10, 10, 10, 10)
+        with widget.hold_redraw():
+            widget.context.rect(100, 100, 10, 10)
+            widget.context.fill()
+        # Releasing a nested hold doesn't redraw.
+        assert redraws(widget) == []
+    assert redraws(widget) == [(10, 10, 100, 100)]
+
+    # A full redraw while redraws are held redraws the entire canvas.
+    EventLog.reset()
+    with widget.hold_redraw():
+        fill.rect(30, 30, 10, 10)
+        widget.redraw()
+    assert redraws(widget) == [None]
+
+    # If nothing has changed, nothing is redrawn.
+    EventLog.reset()
+    with widget.hold_redraw():
+        widget.context.begin_path()
+    assert redraws(widget) == []
+
+
+def test_frame(widget):
+    """The content of a canvas can be replaced with a single redraw."""
+    with widget.Fill() as fill:
+        fill.rect(10, 10, 10, 10)
+
+    EventLog.reset()
+    with widget.frame() as context:
+        assert context is widget.context
+        assert len(context) == 0
+        with context.Fill() as fill:
+            fill.rect(100, 100, 10, 10)
+        assert redraws(widget) == []
+
+    # Both the old and the new content are redrawn.
+    assert redraws(widget) == [(10, 10, 100, 100)]
+
+
+async def test_coalesced_redraw(widget):
+    """When the event loop is running, redraws are performed on the next iteration of
+    the event loop."""
+    with widget.Fill() as fill:
+        fill.rect(10, 10, 10, 10)
+    fill.rect(100, 100, 10, 10)
+    fill.redraw()
+    assert redraws(widget) == []
+
+    await asyncio.sleep(0)
+    assert redraws(widget) == [(10, 10, 100, 100)]
+
+    # Redraws held across an iteration of the event loop are performed when the hold
+    # is released.
+    EventLog.reset()
+    with widget.hold_redraw():
+        widget.context.rect(200, 200, 10, 10)
+        widget.context.fill()
+        await asyncio.sleep(0)
+        assert redraws(widget) == []
+    await asyncio.sleep(0)
+    assert redraws(widget) == [(200, 200, 10, 10)]
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 import toga
@@ -1221,6 +1223,52 @@ def test_refresh_child(widget):
     assert_action_performed(widget, "refresh")
 
 
+def test_deferred_layout(app):
+    """Layout can be deferred while a widget tree is modified."""
+    window = toga.Window()
+    root = toga.Box()
+    window.content = root
+
+    with patch.object(Pack, "layout", autospec=True, side_effect=Pack.layout) as layout:
+        with toga.Widget.deferred_layout():
+            with toga.Widget.deferred_layout():
+                children = [toga.Box() for _ in range(10)]
+                root.add(*children)
+                for child in children:
+                    child.style.padding = 5
+            root.remove(children[0])
+
+            # Nothing has been laid out
+            layout.assert_not_called()
+
+        # The tree was laid out once, when the outermost block exited.
+        layout.assert_called_once()
+        assert children[1].layout.absolute_content_left == 5
+
+        # Once the block has exited, changes cause an immediate layout.
+        layout.reset_mock()
+        children[1].style.padding_left = 10
+        layout.assert_called_once()
+        assert children[1].layout.absolute_content_left == 10
+
+
+def test_deferred_layout_reparent(app):
+    """A tree that is re-parented while layout is deferred is laid out using its new
+    root."""
+    window = toga.Window()
+    root = toga.Box()
+    window.content = root
+    other = toga.Box(style=Pack(padding=20))
+    other._impl.container = window._impl.container
+
+    with toga.Widget.deferred_layout():
+        child = toga.Box(style=Pack(padding=5))
+        other.add(child)
+        root.add(other)
+
+    assert child.layout.absolute_content_left == 25
+
+
 def test_focus(widget):
     """A widget can be given focus."""
     widget.focus()
@@ -285,6 +285,36 @@ def test_insert_item(widget, source, on_change_handler):
     assert widget.value == selection
 
 
+def test_extend_items(widget, source, on_change_handler):
+    """Multiple rows can be added to the source at once."""
+    # Store the original selection
+    selection = widget.value
+
+    rows = source.extend([dict(key="new", value=999), dict(key="newer", value=998)])
+
+    # The widget adds the items
+    assert_action_performed_with(widget, "insert items", index=3, items=rows)
+
+    # This doesn't change the widget.
+    on_change_handler.assert_not_called()
+    assert widget.value == selection
+
+
+def test_remove_selected_range(widget, source, on_change_handler):
+    """If you remove a range containing the selected item, the selection is reset."""
+    widget.value = source[1]
+    on_change_handler.reset_mock()
+
+    rows = source[0:2]
+    del source[0:2]
+
+    assert_action_performed_with(widget, "remove items", index=0, items=rows)
+
+    # The selection has been reset to the first remaining item.
+    on_change_handler.assert_called_once_with(widget)
+    assert widget.value == source[0]
+
+
 def test_remove(widget, source, on_change_handler):
     """If you remove an item that isn't selected, no change is generated."""
     # Store the original selection
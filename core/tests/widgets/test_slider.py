@@ -4,6 +4,7 @@ import pytest
 from pytest import approx, fixture, raises
 
 import toga
+from toga.widgets.slider import IntSliderImpl
 from toga_dummy.utils import assert_action_performed, attribute_value
 
 INITIAL_VALUE = 50
@@ -389,7 +390,7 @@ def assert_value(slider, on_change, value, *, tick_value=None, change_count=0):
     assert on_change.call_count == change_count
 
 
-class DummyIntImpl(toga.widgets.slider.IntSliderImpl):
+class DummyIntImpl(IntSliderImpl):
     def __init__(self):
         super().__init__()
         self.interface = Mock()
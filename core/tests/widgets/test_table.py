@@ -3,7 +3,7 @@ from unittest.mock import Mock
 import pytest
 
 import toga
-from toga.sources import ListSource
+from toga.sources import ListSource, VirtualListSource
 from toga_dummy.utils import (
     assert_action_not_performed,
     assert_action_performed,
@@ -217,6 +217,27 @@ def test_set_data(table, on_select_handler, data, all_attributes, extra_attribut
         assert table.data[2].extra == "extra3"
 
 
+def test_set_virtual_data(table):
+    """A virtual source can be used as table data without materializing it."""
+    fetch = Mock(return_value=[])
+    source = VirtualListSource(accessors=["key", "value"], length=1000, fetch=fetch)
+
+    table.data = source
+
+    assert table.data is source
+    assert_action_performed_with(table, "change source", source=source)
+    fetch.assert_not_called()
+
+
+def test_bulk_data_changes(table):
+    """Bulk changes to the data are passed to the backend as ranges."""
+    rows = table.data.extend([("fourth", 444), ("fifth", 555)])
+    assert_action_performed_with(table, "insert rows", index=3, items=rows)
+
+    del table.data[1:3]
+    assert_action_performed_with(table, "remove rows", index=1)
+
+
 def test_single_selection(table, on_select_handler):
     """The current selection can be retrieved."""
     # Selection is initially empty
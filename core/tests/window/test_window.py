@@ -1,5 +1,5 @@
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -239,6 +239,24 @@ def test_set_size_with_content(window):
     assert_action_performed(content, "refresh")
 
 
+def test_batch_update(window):
+    """Layout of the window content is deferred during a batch update."""
+    content = toga.Box()
+    window.content = content
+
+    with patch.object(
+        toga.style.Pack, "layout", autospec=True, side_effect=toga.style.Pack.layout
+    ) as layout:
+        with window.batch_update() as batch_window:
+            assert batch_window is window
+            for _ in range(5):
+                content.add(toga.Box(style=toga.style.Pack(width=10)))
+            layout.assert_not_called()
+
+        layout.assert_called_once()
+    assert content.children[4].layout.absolute_content_left == 40
+
+
 def test_show_hide(window, app):
     """The window can be shown and hidden."""
     assert window.app == app
@@ -78,6 +78,15 @@ class App(LoggedObject):
             if hasattr(window._impl, "create_menus"):
                 window._impl.create_menus()
 
+    def update_menus(self, change):
+        self._action("update App menus", change=change)
+        self.n_menu_items = len(self.interface.commands)
+
+        # Replicate the behavior of platforms that have window-level menu handling.
+        for window in self.interface.app.windows:
+            if hasattr(window._impl, "create_menus"):
+                window._impl.create_menus()
+
     ######################################################################
     # App lifecycle
     ######################################################################
@@ -1,3 +1,6 @@
+import importlib
+from typing import TYPE_CHECKING
+
 from toga import NotImplementedWarning
 
 from . import dialogs
@@ -10,34 +13,36 @@ from .hardware.location import Location
 from .icons import Icon
 from .images import Image
 from .paths import Paths
-from .widgets.activityindicator import ActivityIndicator
 from .widgets.base import Widget
-from .widgets.box import Box
-from .widgets.button import Button
-from .widgets.canvas import Canvas
-from .widgets.dateinput import DateInput
-from .widgets.detailedlist import DetailedList
-from .widgets.divider import Divider
-from .widgets.imageview import ImageView
-from .widgets.label import Label
-from .widgets.mapview import MapView
-from .widgets.multilinetextinput import MultilineTextInput
-from .widgets.numberinput import NumberInput
-from .widgets.optioncontainer import OptionContainer
-from .widgets.passwordinput import PasswordInput
-from .widgets.progressbar import ProgressBar
-from .widgets.scrollcontainer import ScrollContainer
-from .widgets.selection import Selection
-from .widgets.slider import Slider
-from .widgets.splitcontainer import SplitContainer
-from .widgets.switch import Switch
-from .widgets.table import Table
-from .widgets.textinput import TextInput
-from .widgets.timeinput import TimeInput
-from .widgets.tree import Tree
-from .widgets.webview import WebView
 from .window import DocumentMainWindow, MainWindow, Window
 
+if TYPE_CHECKING:
+    from .widgets.activityindicator import ActivityIndicator
+    from .widgets.box import Box
+    from .widgets.button import Button
+    from .widgets.canvas import Canvas, OffscreenCanvas
+    from .widgets.dateinput import DateInput
+    from .widgets.detailedlist import DetailedList
+    from .widgets.divider import Divider
+    from .widgets.imageview import ImageView
+    from .widgets.label import Label
+    from .widgets.mapview import MapView
+    from .widgets.multilinetextinput import MultilineTextInput
+    from .widgets.numberinput import NumberInput
+    from .widgets.optioncontainer import OptionContainer
+    from .widgets.passwordinput import PasswordInput
+    from .widgets.progressbar import ProgressBar
+    from .widgets.scrollcontainer import ScrollContainer
+    from .widgets.selection import Selection
+    from .widgets.slider import Slider
+    from .widgets.splitcontainer import SplitContainer
+    from .widgets.switch import Switch
+    from .widgets.table import Table
+    from .widgets.textinput import TextInput
+    from .widgets.timeinput import TimeInput
+    from .widgets.tree import Tree
+    from .widgets.webview import WebView
+
 
 def not_implemented(feature):
     NotImplementedWarning.warn("Dummy", feature)
@@ -52,6 +57,7 @@ __all__ = [
     "Font",
     "Icon",
     "Image",
+    "OffscreenCanvas",
     "Paths",
     "dialogs",
     # Hardware
@@ -93,5 +99,47 @@ __all__ = [
 ]
 
 
-def __getattr__(name):  # pragma: no cover
-    raise NotImplementedError(f"Toga's Dummy backend doesn't implement {name}")
+# Widgets are only imported when they are first used, so that an app doesn't need to
+# load the native libraries used by widgets it doesn't use. This is the module that
+# defines each of them.
+_LAZY_IMPORTS = {
+    "ActivityIndicator": ".widgets.activityindicator",
+    "Box": ".widgets.box",
+    "Button": ".widgets.button",
+    "Canvas": ".widgets.canvas",
+    "OffscreenCanvas": ".widgets.canvas",
+    "DateInput": ".widgets.dateinput",
+    "DetailedList": ".widgets.detailedlist",
+    "Divider": ".widgets.divider",
+    "ImageView": ".widgets.imageview",
+    "Label": ".widgets.label",
+    "MapView": ".widgets.mapview",
+    "MultilineTextInput": ".widgets.multilinetextinput",
+    "NumberInput": ".widgets.numberinput",
+    "OptionContainer": ".widgets.optioncontainer",
+    "PasswordInput": ".widgets.passwordinput",
+    "ProgressBar": ".widgets.progressbar",
+    "ScrollContainer": ".widgets.scrollcontainer",
+    "Selection": ".widgets.selection",
+    "Slider": ".widgets.slider",
+    "SplitContainer": ".widgets.splitcontainer",
+    "Switch": ".widgets.switch",
+    "Table": ".widgets.table",
+    "TextInput": ".widgets.textinput",
+    "TimeInput": ".widgets.timeinput",
+    "Tree": ".widgets.tree",
+    "WebView": ".widgets.webview",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:  # pragma: no cover
+        raise NotImplementedError(
+            f"Toga's Dummy backend doesn't implement {name}"
+        ) from None
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    # Store the value, so that this is only called the first time it's accessed.
+    globals()[name] = value
+    return value
@@ -28,6 +28,7 @@ class DummyImage:
 
 class Image(LoggedObject):
     RAW_TYPE = DummyImage
+    SUPPORTS_PIXELS = True
 
     def __init__(
         self,
@@ -35,6 +36,7 @@ class Image(LoggedObject):
         path: Path = None,
         data: bytes = None,
         raw: BytesIO = None,
+        pixels: toga.images.ImagePixels = None,
     ):
         super().__init__()
         self.interface = interface
@@ -47,6 +49,18 @@ class Image(LoggedObject):
         elif data:
             self._action("load image data", data=data)
             self.native = DummyImage(PIL.Image.open(BytesIO(data)))
+        elif pixels:
+            self._action("load image pixels", pixels=pixels)
+            self.native = DummyImage(
+                PIL.Image.frombytes(
+                    pixels.format,
+                    (pixels.width, pixels.height),
+                    pixels.data,
+                    "raw",
+                    pixels.format,
+                    pixels.stride,
+                )
+            )
         else:
             self._action("load image from raw")
             self.native = raw
@@ -64,5 +78,13 @@ class Image(LoggedObject):
     def get_data(self):
         return self.native.data
 
+    def get_pixels(self):
+        self._action("get pixels")
+        image = self.native.raw
+        if image.mode not in {"RGB", "RGBA"}:
+            image = image.convert("RGBA")
+        stride = image.width * len(image.mode)
+        return image.tobytes(), image.width, image.height, stride, image.mode
+
     def save(self, path):
         self._action("save", path=path)
@@ -12,8 +12,48 @@ class Canvas(Widget):
 
     def redraw(self):
         self._action("redraw")
-        self.draw_instructions = []
-        self.interface.context._draw(self, draw_instructions=self.draw_instructions)
+
+    def redraw_rect(self, x, y, width, height):
+        self._action("redraw", rect=(x, y, width, height))
+
+    @property
+    def draw_instructions(self):
+        # The instructions that would be used to draw the entire canvas.
+        draw_instructions = []
+        self.interface._draw(self, draw_instructions=draw_instructions)
+        return draw_instructions
+
+    def draw_region(self, x, y, width, height):
+        """The instructions that would be used to draw a region of the canvas."""
+        draw_instructions = []
+        self.interface._draw(
+            self,
+            clip=(x, y, x + width, y + height),
+            draw_instructions=draw_instructions,
+        )
+        return draw_instructions
+
+    def draw_cached(
+        self, cache, x, y, width, height, draw, draw_instructions, **kwargs
+    ):
+        # The "rendering" of a context is the list of instructions used to draw it.
+        if cache is None:
+            self._action("render cache", rect=(x, y, width, height))
+            cache = []
+            draw(draw_instructions=cache, **kwargs)
+        draw_instructions.extend(cache)
+        return cache
+
+    def draw_ops(self, ops, **kwargs):
+        # Consecutive operations usually share the same arguments, so the arguments
+        # only need to be combined when they change. The arguments of an operation
+        # take precedence over the arguments inherited by the compiled context.
+        op_kwargs = None
+        for name, args, kwargs_for_op in ops:
+            if kwargs_for_op is not op_kwargs:
+                op_kwargs = kwargs_for_op
+                combined = {**kwargs, **op_kwargs}
+            getattr(self, name)(*args, **combined)
 
     # Context management
     def push_context(self, draw_instructions, **kwargs):
@@ -159,6 +199,36 @@ class Canvas(Widget):
             )
         )
 
+    # Bulk shapes
+    def polyline(self, xs, ys, draw_instructions, **kwargs):
+        draw_instructions.append(
+            ("polyline", dict(**{"xs": list(xs), "ys": list(ys)}, **kwargs))
+        )
+
+    def points(self, xs, ys, size, draw_instructions, **kwargs):
+        draw_instructions.append(
+            (
+                "points",
+                dict(**{"xs": list(xs), "ys": list(ys), "size": size}, **kwargs),
+            )
+        )
+
+    def rects(self, xs, ys, widths, heights, draw_instructions, **kwargs):
+        draw_instructions.append(
+            (
+                "rects",
+                dict(
+                    **{
+                        "xs": list(xs),
+                        "ys": list(ys),
+                        "widths": list(widths),
+                        "heights": list(heights),
+                    },
+                    **kwargs,
+                ),
+            )
+        )
+
     # Drawing Paths
     def fill(self, color, fill_rule, draw_instructions, **kwargs):
         draw_instructions.append(
@@ -278,3 +348,22 @@ class Canvas(Widget):
 
     def simulate_alt_drag(self, x, y):
         self.interface.on_alt_drag(x=x, y=y)
+
+
+class OffscreenCanvas(Canvas):
+    VECTOR_FORMATS = {".pdf", ".svg"}
+
+    def create(self):
+        self._action("create OffscreenCanvas")
+
+    def get_image_data(self):
+        self._action(
+            "render", size=self.interface.size, draw_instructions=self.draw_instructions
+        )
+        path = Path(toga_dummy.__file__).parent / "resources/toga.png"
+        return path.read_bytes()
+
+    def save_vector(self, path):
+        self._action("save vector", path=path)
+        # The "vector" format is the list of instructions used to draw the canvas.
+        path.write_text(repr(self.draw_instructions), encoding="utf-8")
@@ -12,12 +12,18 @@ class DetailedList(Widget):
     def insert(self, index, item):
         self._action("insert item", index=index, item=item)
 
+    def insert_range(self, index, items):
+        self._action("insert items", index=index, items=items)
+
     def change(self, item):
         self._action("change item", item=item)
 
     def remove(self, index, item):
         self._action("remove item", index=index, item=item)
 
+    def remove_range(self, index, items):
+        self._action("remove items", index=index, items=items)
+
     def clear(self):
         self._action("clear")
 
@@ -13,6 +13,13 @@ class Selection(Widget):
         if len(self._items) == 1:
             self.simulate_selection(self._items[0])
 
+    def insert_range(self, index, items):
+        self._action("insert items", index=index, items=items)
+        self._items[index:index] = items
+        # If these are the first items to be inserted, select the first one.
+        if len(self._items) == len(items):
+            self.simulate_selection(self._items[0])
+
     def change(self, item):
         self._action("change item", item=item)
 
@@ -28,6 +35,18 @@ class Selection(Widget):
                 selected = None
             self.simulate_selection(selected)
 
+    def remove_range(self, index, items):
+        self._action("remove items", index=index, items=items)
+        del self._items[index : index + len(items)]
+
+        # If we deleted the selected item, reset the selection.
+        if self._get_value("selected_item", None) in items:
+            try:
+                selected = self._items[0]
+            except IndexError:
+                selected = None
+            self.simulate_selection(selected)
+
     def clear(self):
         self._action("clear")
         self._items = []
@@ -12,12 +12,18 @@ class Table(Widget):
     def insert(self, index, item):
         self._action("insert row", index=index, item=item)
 
+    def insert_range(self, index, items):
+        self._action("insert rows", index=index, items=items)
+
     def change(self, item):
         self._action("change row", item=item)
 
     def remove(self, index, item):
         self._action("remove row", item=item, index=index)
 
+    def remove_range(self, index, items):
+        self._action("remove rows", index=index, items=items)
+
     def clear(self):
         self._action("clear")
 
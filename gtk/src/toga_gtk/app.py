@@ -7,7 +7,7 @@ import gbulb
 
 import toga
 from toga.app import App as toga_App, overridden
-from toga.command import Command, Separator
+from toga.command import Command, Group, Separator
 from toga.handlers import simple_handler
 
 from .keys import gtk_accel
@@ -100,65 +100,85 @@ class App:
                 ),
             )  # pragma: no cover
 
-    def _submenu(self, group, menubar):
-        try:
-            submenu, section = self._menu_groups[group]
-        except KeyError:
-            # It's a new menu/group, so it must start a new section.
-            section = Gio.Menu()
-            if group is None:
-                # Menu is a top-level menu; so it's a child of the menu bar
-                submenu = menubar
+    def _menu_item(self, cmd):
+        # Create the menu item for a command, installing an action for the command
+        # if it doesn't already have one.
+        cmd_id = "command-%s" % id(cmd)
+        if cmd not in self._menu_actions:
+            action = Gio.SimpleAction.new(cmd_id, None)
+            action.connect("activate", cmd._impl.gtk_activate)
+
+            cmd._impl.native.append(action)
+            cmd._impl.set_enabled(cmd.enabled)
+            self._menu_items[action] = cmd
+            self._menu_actions[cmd] = action
+            self.native.add_action(action)
+
+        item = Gio.MenuItem.new(cmd.text, "app." + cmd_id)
+        if cmd.shortcut:
+            item.set_attribute_value(
+                "accel", GLib.Variant("s", gtk_accel(cmd.shortcut))
+            )
+        return item
+
+    def _remove_menu_item(self, cmd):
+        # Remove the action for a command that is no longer in a menu.
+        action = self._menu_actions.pop(cmd, None)
+        if action is not None:
+            del self._menu_items[action]
+            cmd._impl.native.remove(action)
+            self.native.remove_action(action.get_name())
+
+    def _populate_menus(self, groups):
+        # Rebuild the content of the menus for the given groups; ``None`` is the menu
+        # bar. Only the items of those groups are sorted; the menus for any other
+        # groups are left as they are.
+        for group in groups:
+            items = self.interface.commands.group_items(group)
+            menu = self._menus.get(group)
+            if menu is None:
+                menu = self._menus[group] = Gio.Menu()
             else:
-                _, parent_section = self._submenu(group.parent, menubar)
-                submenu = Gio.Menu()
+                menu.remove_all()
 
-                text = group.text
-                if text == "*":
-                    text = self.interface.formal_name
-                parent_section.append_submenu(text, submenu)
-
-            # Add the initial section to the submenu,
-            # and install the menu item in the group cache.
-            submenu.append_section(None, section)
-            self._menu_groups[group] = submenu, section
-
-        return submenu, section
+            section = Gio.Menu()
+            menu.append_section(None, section)
+            for item in items:
+                if isinstance(item, Separator):
+                    section = Gio.Menu()
+                    menu.append_section(None, section)
+                elif isinstance(item, Group):
+                    submenu = self._menus.get(item)
+                    if submenu is None:
+                        submenu = self._menus[item] = Gio.Menu()
+                    text = item.text
+                    if text == "*":
+                        text = self.interface.formal_name
+                    section.append_submenu(text, submenu)
+                else:
+                    section.append_item(self._menu_item(item))
 
     def create_menus(self):
         # Although GTK menus manifest on the Window, they're defined at the
         # application level, and are automatically added to any ApplicationWindow.
         # (or to the top of the screen if the GTK theme requires)
 
-        # Only create the menu if the menu item index has been created.
+        # Remove the actions for any existing menu items.
+        for cmd in list(getattr(self, "_menu_actions", {})):
+            self._remove_menu_item(cmd)
         self._menu_items = {}
-        self._menu_groups = {}
+        self._menu_actions = {}
+        self._menus = {}
 
-        # Create the menu for the top level menubar.
-        menubar = Gio.Menu()
+        # Create the menu for the top level menubar, and every group.
+        groups = {None}
         for cmd in self.interface.commands:
-            submenu, section = self._submenu(cmd.group, menubar)
-            if isinstance(cmd, Separator):
-                section = Gio.Menu()
-                submenu.append_section(None, section)
-                self._menu_groups[cmd.group] = (submenu, section)
-            else:
-                cmd_id = "command-%s" % id(cmd)
-                action = Gio.SimpleAction.new(cmd_id, None)
-                action.connect("activate", cmd._impl.gtk_activate)
-
-                cmd._impl.native.append(action)
-                cmd._impl.set_enabled(cmd.enabled)
-                self._menu_items[action] = cmd
-                self.native.add_action(action)
-
-                item = Gio.MenuItem.new(cmd.text, "app." + cmd_id)
-                if cmd.shortcut:
-                    item.set_attribute_value(
-                        "accel", GLib.Variant("s", gtk_accel(cmd.shortcut))
-                    )
-
-                section.append_item(item)
+            group = cmd.group
+            while group is not None:
+                groups.add(group)
+                group = group.parent
+        self._populate_menus(groups)
+        menubar = self._menus[None]
 
         # Set the menu for the app.
         self.native.set_menubar(menubar)
@@ -171,6 +191,17 @@ class App:
         settings = Gtk.Settings.get_default()
         settings.set_property("gtk-shell-shows-menubar", False)
 
+    def update_menus(self, change):
+        # Gio menus update in place; only the menus whose content has changed need
+        # to be rebuilt.
+        for cmd in change.removed:
+            self._remove_menu_item(cmd)
+        removed_groups = set(change.removed_groups)
+        for group in removed_groups:
+            self._menus.pop(group, None)
+
+        self._populate_menus(change.groups - removed_groups)
+
     ######################################################################
     # App lifecycle
     ######################################################################
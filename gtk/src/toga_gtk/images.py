@@ -5,8 +5,9 @@ from toga_gtk.libs import GdkPixbuf, Gio, GLib
 
 class Image:
     RAW_TYPE = GdkPixbuf.Pixbuf
+    SUPPORTS_PIXELS = True
 
-    def __init__(self, interface, path=None, data=None, raw=None):
+    def __init__(self, interface, path=None, data=None, raw=None, pixels=None):
         self.interface = interface
 
         if path:
@@ -20,6 +21,16 @@ class Image:
                 self.native = GdkPixbuf.Pixbuf.new_from_stream(input_stream, None)
             except GLib.GError:
                 raise ValueError("Unable to load image from data")
+        elif pixels:
+            self.native = GdkPixbuf.Pixbuf.new_from_bytes(
+                GLib.Bytes.new(pixels.data.tobytes()),
+                GdkPixbuf.Colorspace.RGB,
+                pixels.format == "RGBA",
+                8,
+                pixels.width,
+                pixels.height,
+                pixels.stride,
+            )
         else:
             self.native = raw
 
@@ -37,6 +48,16 @@ class Image:
             # This shouldn't ever happen, and it's difficult to manufacture in test conditions
             raise ValueError("Unable to get PNG data for image")
 
+    def get_pixels(self):
+        # Pixbufs always have 8 bits per channel, with non-premultiplied alpha.
+        return (
+            self.native.read_pixel_bytes().get_data(),
+            self.native.get_width(),
+            self.native.get_height(),
+            self.native.get_rowstride(),
+            "RGBA" if self.native.get_has_alpha() else "RGB",
+        )
+
     def save(self, path):
         path = Path(path)
         try:
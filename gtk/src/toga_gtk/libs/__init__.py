@@ -1,4 +1,10 @@
+from . import gtk
 from .fontconfig import FontConfig  # noqa: F401, F403
 from .gtk import *  # noqa: F401, F403
 from .styles import *  # noqa: F401, F403
 from .utils import *  # noqa: F401, F403
+
+
+def __getattr__(name):
+    # Some libraries are only imported when they are first used.
+    return getattr(gtk, name)
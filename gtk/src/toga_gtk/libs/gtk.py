@@ -23,28 +23,15 @@ IS_WAYLAND = not isinstance(Gdk.Display.get_default(), GdkX11.X11Display)
 # The following imports will fail if the underlying libraries or their API
 # wrappers aren't installed; handle failure gracefully (see
 # https://github.com/beeware/toga/issues/26)
-try:
-    try:
-        gi.require_version("WebKit2", "4.1")
-    except ValueError:  # pragma: no cover
-        gi.require_version("WebKit2", "4.0")
-    from gi.repository import WebKit2  # noqa: F401
-except (ImportError, ValueError):  # pragma: no cover
-    WebKit2 = None
-
+#
+# Pango is a dependency of GTK, and fonts need Pango, PangoCairo and PangoFc as soon
+# as the first widget is styled, so they are imported eagerly.
 try:
     gi.require_version("Pango", "1.0")
     from gi.repository import Pango  # noqa: F401
 except (ImportError, ValueError):  # pragma: no cover
     Pango = None
 
-try:
-    import cairo  # noqa: F401
-
-    gi.require_foreign("cairo")
-except ImportError:  # pragma: no cover
-    cairo = None
-
 try:
     gi.require_version("PangoCairo", "1.0")
     from gi.repository import PangoCairo  # noqa: F401
@@ -56,3 +43,43 @@ try:
     from gi.repository import PangoFc  # noqa: F401
 except (ImportError, ValueError):  # pragma: no cover
     PangoFc = None
+
+
+def _import_cairo():
+    try:
+        import cairo
+
+        gi.require_foreign("cairo")
+    except ImportError:  # pragma: no cover
+        cairo = None
+    return cairo
+
+
+def _import_webkit2():
+    try:
+        try:
+            gi.require_version("WebKit2", "4.1")
+        except ValueError:  # pragma: no cover
+            gi.require_version("WebKit2", "4.0")
+        from gi.repository import WebKit2
+    except (ImportError, ValueError):  # pragma: no cover
+        WebKit2 = None
+    return WebKit2
+
+
+# Loading WebKit is slow, so it is only imported when it's first used. The Python
+# bindings for cairo are only needed by the Canvas widget.
+_LAZY_IMPORTS = {
+    "cairo": _import_cairo,
+    "WebKit2": _import_webkit2,
+}
+
+
+def __getattr__(name):
+    try:
+        import_library = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # Store the library, so that it's only imported the first time it's accessed.
+    library = globals()[name] = import_library()
+    return library
@@ -1,6 +1,11 @@
+import re
+from itertools import count
+
 from toga.colors import TRANSPARENT
 from toga.fonts import SYSTEM_DEFAULT_FONT_SIZE
 
+from .gtk import Gdk, Gtk
+
 TOGA_DEFAULT_STYLES = b"""
 .toga-detailed-list-floating-buttons {
     min-width: 24px;
@@ -50,3 +55,92 @@ def get_font_css(value):
         style["font-size"] = f"{value.size}pt"
 
     return style
+
+
+class StyleClass:
+    def __init__(self, name, provider, key):
+        """A generated CSS class, styled by a provider that is shared by every widget
+        that has the class.
+
+        :param name: The name of the CSS class.
+        :param provider: The ``Gtk.CssProvider`` that defines the style of the class.
+        :param key: The (selector, declarations) pair that the class was created for.
+        """
+        self.name = name
+        self.provider = provider
+        self.key = key
+        self.references = 0
+
+    def __repr__(self):
+        return f"<StyleClass {self.name!r} references={self.references}>"
+
+
+class CssProviderPool:
+    def __init__(self):
+        """A pool of CSS providers, shared between widgets.
+
+        Each distinct CSS declaration is parsed once, into a provider that is
+        installed for the whole screen. The provider styles a generated CSS class;
+        widgets are styled by adding that class to their style context. Providers are
+        reference counted, and are removed from the screen once no widget uses them.
+        """
+        self._classes = {}
+        self._names = count()
+
+    def __len__(self):
+        return len(self._classes)
+
+    def acquire(self, css, selector=".toga"):
+        """Obtain a reference to the CSS class that applies the given styles.
+
+        :param css: A dictionary of string key-value pairs, describing the CSS.
+        :param selector: The CSS selector used to target the style. Each ``.toga``
+            class in the selector will only match widgets that also have the generated
+            class.
+        :returns: The :class:`StyleClass` for the styles.
+        """
+        styles = " ".join(f"{key}: {value};" for key, value in css.items())
+        key = (selector, styles)
+        try:
+            style_class = self._classes[key]
+        except KeyError:
+            name = f"toga-css-{next(self._names)}"
+            qualified = re.sub(r"\.toga(?![\w-])", f".toga.{name}", selector)
+            provider = Gtk.CssProvider()
+            provider.load_from_data((qualified + " {" + styles + "}").encode())
+            Gtk.StyleContext.add_provider_for_screen(
+                Gdk.Screen.get_default(),
+                provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+            )
+            style_class = self._classes[key] = StyleClass(name, provider, key)
+
+        style_class.references += 1
+        return style_class
+
+    def release(self, style_class):
+        """Release a reference to a CSS class. Once a class has no references, its
+        provider is removed from the screen.
+
+        :param style_class: A :class:`StyleClass` returned by :meth:`acquire`.
+        """
+        style_class.references -= 1
+        if style_class.references == 0:
+            del self._classes[style_class.key]
+            Gtk.StyleContext.remove_provider_for_screen(
+                Gdk.Screen.get_default(), style_class.provider
+            )
+
+    def release_all(self, style_classes):
+        """Release a reference to each of a collection of CSS classes.
+
+        :param style_classes: A dictionary whose values are :class:`StyleClass`
+            instances. The dictionary is emptied.
+        """
+        while style_classes:
+            _, style_class = style_classes.popitem()
+            self.release(style_class)
+
+
+#: The pool of CSS providers used to style Toga widgets.
+css_provider_pool = CssProviderPool()
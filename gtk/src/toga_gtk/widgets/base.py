@@ -1,8 +1,14 @@
+import weakref
 from abc import abstractmethod
 
 from travertino.size import at_least
 
-from ..libs import Gtk, get_background_color_css, get_color_css, get_font_css
+from ..libs import (
+    css_provider_pool,
+    get_background_color_css,
+    get_color_css,
+    get_font_css,
+)
 
 
 class Widget:
@@ -13,6 +19,11 @@ class Widget:
         self._container = None
         self.native = None
         self.style_providers = {}
+        # Release the widget's CSS classes when the widget is deleted. There's no
+        # need to do this when the interpreter exits.
+        weakref.finalize(
+            self, css_provider_pool.release_all, self.style_providers
+        ).atexit = False
         self.create()
 
         # Ensure the native widget has links to the interface and impl
@@ -91,13 +102,11 @@ class Widget:
     def apply_css(self, property, css, native=None, selector=".toga"):
         """Apply a CSS style controlling a specific property type.
 
-        GTK controls appearance with CSS; each GTK widget can have an
-        independent style sheet, composed out of multiple providers.
-
-        Toga uses a separate provider for each property that needs to be
-        controlled (e.g., color, font, ...). When that property is modified, the
-        old provider for that property is removed; if new CSS has been provided,
-        a new provider is constructed and added to the widget.
+        GTK controls appearance with CSS. Toga styles each property that needs to be
+        controlled (e.g., color, font, ...) with a generated CSS class. The CSS for
+        each distinct style is parsed once, into a provider that is shared by every
+        widget using that style; so changing a property adds the class for the new
+        style to the widget, and removes the class for the old style.
 
         It is assumed that every Toga widget will have the class ``toga``.
 
@@ -114,28 +123,23 @@ class Widget:
             native = self.native
 
         style_context = native.get_style_context()
-        style_provider = self.style_providers.pop((property, id(native)), None)
-
-        # If there was a previous style provider for the given property, remove
-        # it from the GTK widget
-        if style_provider:
-            style_context.remove_provider(style_provider)
+        old_class = self.style_providers.pop((property, id(native)), None)
+        new_class = None
 
-        # If there's new CSS to apply, construct a new provider, and install it.
+        # If there's new CSS to apply, add the class that applies it to the widget.
         if css is not None:
-            # Create a new CSS StyleProvider
-            style_provider = Gtk.CssProvider()
-            styles = " ".join(f"{key}: {value};" for key, value in css.items())
-            declaration = selector + " {" + styles + "}"
-            style_provider.load_from_data(declaration.encode())
-
-            # Add the provider to the widget
-            style_context.add_provider(
-                style_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-            )
-            # Store the provider so it can be removed later
-            self.style_providers[(property, id(native))] = style_provider
+            new_class = css_provider_pool.acquire(css, selector=selector)
+            if new_class is not old_class:
+                style_context.add_class(new_class.name)
+            # Store the class so it can be removed later
+            self.style_providers[(property, id(native))] = new_class
+
+        # If there was a previous class for the given property, remove it from the
+        # GTK widget
+        if old_class:
+            if old_class is not new_class:
+                style_context.remove_class(old_class.name)
+            css_provider_pool.release(old_class)
 
     ######################################################################
     # APPLICATOR
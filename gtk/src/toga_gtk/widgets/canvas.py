@@ -1,6 +1,7 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 from io import BytesIO
-from math import ceil
+from math import ceil, floor
 
 from travertino.size import at_least
 
@@ -13,87 +14,118 @@ from toga_gtk.libs import Gdk, Gtk, Pango, PangoCairo, cairo
 from .base import Widget
 
 
-class Canvas(Widget):
-    def create(self):
-        if cairo is None:  # pragma: no cover
-            raise RuntimeError(
-                "Unable to import Cairo. Ensure that the system package "
-                "providing Cairo and its GTK bindings have been installed."
-            )
+class CairoCanvas:
+    """The drawing operations of a canvas, performed on a Cairo context."""
 
-        self.native = Gtk.DrawingArea()
+    # The maximum number of fonts, and of laid out strings of text, that are cached by
+    # each canvas.
+    FONT_CACHE_SIZE = 32
+    TEXT_CACHE_SIZE = 256
 
-        self.native.connect("draw", self.gtk_draw_callback)
-        self.native.connect("size-allocate", self.gtk_on_size_allocate)
-        self.native.connect("button-press-event", self.mouse_down)
-        self.native.connect("button-release-event", self.mouse_up)
-        self.native.connect("motion-notify-event", self.mouse_move)
-        self.native.set_events(
-            Gdk.EventMask.BUTTON_PRESS_MASK
-            | Gdk.EventMask.BUTTON_RELEASE_MASK
-            | Gdk.EventMask.BUTTON_MOTION_MASK
-        )
-
-    def gtk_draw_callback(self, widget, cairo_context):
-        """Creates a draw callback.
+    def _reset_text_cache(self):
+        # The Pango context and metrics for each font, and the layout of each string of
+        # text in each font, that have been recently drawn or measured.
+        self._fonts = OrderedDict()
+        self._text_layouts = OrderedDict()
 
-        Gtk+ uses a drawing callback to draw on a DrawingArea. Assignment of the
-        callback function creates a Gtk+ canvas and Gtk+ context automatically using the
-        canvas and cairo_context function arguments. This method calls the draw method
-        on the interface Canvas to draw the objects.
-        """
+    # The largest offscreen image, in device pixels, that is used to cache the
+    # rendering of a context. Larger contexts are drawn directly.
+    MAX_CACHE_PIXELS = 4096 * 4096
 
-        # Explicitly render the background
-        sc = self.native.get_style_context()
-        bg = sc.get_property("background-color", sc.get_state())
-        cairo_context.set_source_rgba(
-            255 * bg.red,
-            255 * bg.green,
-            255 * bg.blue,
-            bg.alpha,
-        )
-        width = self.native.get_allocation().width
-        height = self.native.get_allocation().height
-        cairo_context.rectangle(0, 0, width, height)
-        cairo_context.fill()
-
-        self.original_transform_matrix = cairo_context.get_matrix()
-        self.interface.context._draw(self, cairo_context=cairo_context)
+    def draw_cached(self, cache, x, y, width, height, draw, cairo_context, **kwargs):
+        # Only the part of the context that is visible (inside the canvas, and inside
+        # the region being drawn) is rendered. The rendering is reused for as long as
+        # it covers the visible part of the context.
+        cairo_context.save()
+        cairo_context.set_matrix(self.original_transform_matrix)
+        clip_left, clip_top, clip_right, clip_bottom = cairo_context.clip_extents()
+        cairo_context.restore()
+        left = max(x, floor(clip_left))
+        top = max(y, floor(clip_top))
+        right = min(x + width, ceil(clip_right))
+        bottom = min(y + height, ceil(clip_bottom))
+        if right <= left or bottom <= top:
+            return cache
+
+        scale = cairo_context.get_target().get_device_scale()
+        if cache is not None:
+            surface, (cache_left, cache_top, cache_right, cache_bottom) = cache
+            if (
+                surface.get_device_scale() != scale
+                or left < cache_left
+                or top < cache_top
+                or right > cache_right
+                or bottom > cache_bottom
+            ):
+                cache = None
+
+        if cache is None:
+            surface_width = ceil((right - left) * scale[0])
+            surface_height = ceil((bottom - top) * scale[1])
+            if surface_width * surface_height > self.MAX_CACHE_PIXELS:
+                draw(cairo_context=cairo_context, **kwargs)
+                return None
+
+            surface = cairo.ImageSurface(
+                cairo.FORMAT_ARGB32, surface_width, surface_height
+            )
+            surface.set_device_scale(*scale)
+            cache_context = cairo.Context(surface)
+
+            # Draw with the current transformation, relative to the canvas, offset to
+            # the origin of the cached region.
+            offset = cairo.Matrix(x0=-left, y0=-top)
+            inverse = self.original_transform_matrix.multiply(cairo.Matrix())
+            inverse.invert()
+            cache_context.set_matrix(
+                cairo_context.get_matrix().multiply(inverse).multiply(offset)
+            )
 
-    def gtk_on_size_allocate(self, widget, allocation):
-        """Called on widget resize, and calls the handler set on the interface, if
-        any."""
-        self.interface.on_resize(width=allocation.width, height=allocation.height)
+            original_transform_matrix = self.original_transform_matrix
+            self.original_transform_matrix = offset
+            try:
+                draw(cairo_context=cache_context, **kwargs)
+            finally:
+                self.original_transform_matrix = original_transform_matrix
+            cache = surface, (left, top, right, bottom)
 
-    def mouse_down(self, obj, event):
-        if event.button == 1:
-            if event.type == Gdk.EventType._2BUTTON_PRESS:
-                self.interface.on_activate(event.x, event.y)
+        surface, (cache_left, cache_top, _, _) = cache
+        cairo_context.save()
+        cairo_context.set_matrix(self.original_transform_matrix)
+        cairo_context.set_source_surface(surface, cache_left, cache_top)
+        cairo_context.paint()
+        cairo_context.restore()
+        return cache
+
+    def draw_ops(self, ops, cairo_context, **kwargs):
+        # Operations that map directly onto a Cairo call are dispatched without going
+        # through the methods of this class.
+        direct = {
+            "push_context": cairo_context.save,
+            "pop_context": cairo_context.restore,
+            "begin_path": cairo_context.new_path,
+            "close_path": cairo_context.close_path,
+            "move_to": cairo_context.move_to,
+            "line_to": cairo_context.line_to,
+            "bezier_curve_to": cairo_context.curve_to,
+            "rect": cairo_context.rectangle,
+            "rotate": cairo_context.rotate,
+            "scale": cairo_context.scale,
+            "translate": cairo_context.translate,
+        }
+        # The arguments of an operation take precedence over the arguments inherited
+        # by the compiled context. Consecutive operations usually share the same
+        # arguments, so they only need to be combined when they change.
+        op_kwargs = None
+        for name, args, kwargs_for_op in ops:
+            method = direct.get(name)
+            if method is None:
+                if kwargs_for_op is not op_kwargs:
+                    op_kwargs = kwargs_for_op
+                    combined = {**kwargs, **op_kwargs}
+                getattr(self, name)(*args, cairo_context=cairo_context, **combined)
             else:
-                self.interface.on_press(event.x, event.y)
-        elif event.button == 3:
-            self.interface.on_alt_press(event.x, event.y)
-        else:  # pragma: no cover
-            # Don't handle other button presses
-            pass
-
-    def mouse_move(self, obj, event):
-        if event.state == Gdk.ModifierType.BUTTON1_MASK:
-            self.interface.on_drag(event.x, event.y)
-        if event.state == Gdk.ModifierType.BUTTON3_MASK:
-            self.interface.on_alt_drag(event.x, event.y)
-
-    def mouse_up(self, obj, event):
-        if event.button == 1:
-            self.interface.on_release(event.x, event.y)
-        elif event.button == 3:
-            self.interface.on_alt_release(event.x, event.y)
-        else:  # pragma: no cover
-            # Don't handle other button presses
-            pass
-
-    def redraw(self):
-        self.native.queue_draw()
+                method(*args)
 
     # Context management
     def push_context(self, cairo_context, **kwargs):
@@ -178,6 +210,28 @@ class Canvas(Widget):
     def rect(self, x, y, width, height, cairo_context, **kwargs):
         cairo_context.rectangle(x, y, width, height)
 
+    # Bulk shapes
+
+    def polyline(self, xs, ys, cairo_context, **kwargs):
+        points = zip(xs, ys)
+        for x, y in points:
+            cairo_context.move_to(x, y)
+            break
+        line_to = cairo_context.line_to
+        for x, y in points:
+            line_to(x, y)
+
+    def points(self, xs, ys, size, cairo_context, **kwargs):
+        half = size / 2
+        rectangle = cairo_context.rectangle
+        for x, y in zip(xs, ys):
+            rectangle(x - half, y - half, size, size)
+
+    def rects(self, xs, ys, widths, heights, cairo_context, **kwargs):
+        rectangle = cairo_context.rectangle
+        for x, y, width, height in zip(xs, ys, widths, heights):
+            rectangle(x, y, width, height)
+
     # Drawing Paths
 
     def fill(self, color, fill_rule, cairo_context, **kwargs):
@@ -222,10 +276,9 @@ class Canvas(Widget):
     # No need to check whether Pango or PangoCairo are None, because if they were, the
     # user would already have received an exception when trying to create a Font.
     def _text_path(self, text, x, y, font, baseline, cairo_context):
-        pango_context = self._pango_context(font)
-        metrics = self._font_metrics(pango_context)
-        lines = text.splitlines()
-        total_height = metrics.line_height * len(lines)
+        text_layout = self._text_layout(text, font)
+        metrics = text_layout.metrics
+        total_height = metrics.line_height * len(text_layout.lines)
 
         if baseline == Baseline.TOP:
             top = y + metrics.ascent
@@ -237,11 +290,48 @@ class Canvas(Widget):
             # Default to Baseline.ALPHABETIC
             top = y
 
-        layout = Pango.Layout(pango_context)
-        for line_num, line in enumerate(lines):
-            layout.set_text(line)
+        for line_num, layout in enumerate(text_layout.lines):
             cairo_context.move_to(x, top + (metrics.line_height * line_num))
-            PangoCairo.layout_line_path(cairo_context, layout.get_line(0))
+            PangoCairo.layout_line_path(cairo_context, layout.get_line_readonly(0))
+
+    def _text_layout(self, text, font):
+        """Lay out a string of text, re-using a recent layout of the same text in the
+        same font if there is one."""
+        key = (font.interface, text)
+        try:
+            text_layout = self._text_layouts[key]
+        except KeyError:
+            pango_context, metrics = self._font(font)
+            lines = []
+            widths = []
+            for line in text.splitlines():
+                layout = Pango.Layout(pango_context)
+                layout.set_text(line)
+                ink, logical = layout.get_extents()
+                lines.append(layout)
+                widths.append(logical.width / Pango.SCALE)
+
+            text_layout = TextLayout(metrics, lines, widths)
+            self._text_layouts[key] = text_layout
+            while len(self._text_layouts) > self.TEXT_CACHE_SIZE:
+                self._text_layouts.popitem(last=False)
+        else:
+            self._text_layouts.move_to_end(key)
+        return text_layout
+
+    def _font(self, font):
+        """The Pango context and metrics for a font."""
+        try:
+            pango_context, metrics = self._fonts[font.interface]
+        except KeyError:
+            pango_context = self._pango_context(font)
+            metrics = self._font_metrics(pango_context)
+            self._fonts[font.interface] = (pango_context, metrics)
+            while len(self._fonts) > self.FONT_CACHE_SIZE:
+                self._fonts.popitem(last=False)
+        else:
+            self._fonts.move_to_end(font.interface)
+        return pango_context, metrics
 
     def _pango_context(self, font):
         # TODO: detect the actual default family and size (see tests_backend/fonts.py).
@@ -254,7 +344,7 @@ class Canvas(Widget):
                 variant=font.interface.variant,
             )._impl
 
-        pango_context = self.native.create_pango_context()
+        pango_context = self._create_pango_context()
         pango_context.set_font_description(font.native)
         return pango_context
 
@@ -270,19 +360,111 @@ class Canvas(Widget):
         return FontMetrics(ascent, descent, line_height)
 
     def measure_text(self, text, font):
-        pango_context = self._pango_context(font)
-        layout = Pango.Layout(pango_context)
+        text_layout = self._text_layout(text, font)
+        return (
+            ceil(max(width for width in text_layout.widths)),
+            text_layout.metrics.line_height * len(text_layout.widths),
+        )
 
-        widths = []
-        for line in text.splitlines():
-            layout.set_text(line)
-            ink, logical = layout.get_extents()
-            widths.append(logical.width / Pango.SCALE)
 
-        return (
-            ceil(max(width for width in widths)),
-            self._font_metrics(pango_context).line_height * len(widths),
+class Canvas(CairoCanvas, Widget):
+    def create(self):
+        if cairo is None:  # pragma: no cover
+            raise RuntimeError(
+                "Unable to import Cairo. Ensure that the system package "
+                "providing Cairo and its GTK bindings have been installed."
+            )
+
+        self.native = Gtk.DrawingArea()
+
+        self.native.connect("draw", self.gtk_draw_callback)
+        self.native.connect("size-allocate", self.gtk_on_size_allocate)
+        self.native.connect("button-press-event", self.mouse_down)
+        self.native.connect("button-release-event", self.mouse_up)
+        self.native.connect("motion-notify-event", self.mouse_move)
+        self.native.connect("screen-changed", self.gtk_on_screen_changed)
+        self.native.set_events(
+            Gdk.EventMask.BUTTON_PRESS_MASK
+            | Gdk.EventMask.BUTTON_RELEASE_MASK
+            | Gdk.EventMask.BUTTON_MOTION_MASK
         )
+        self._reset_text_cache()
+
+    def gtk_on_screen_changed(self, widget, previous_screen):
+        # Pango contexts depend on the resolution and font options of the screen.
+        self._reset_text_cache()
+
+    def gtk_draw_callback(self, widget, cairo_context):
+        """Creates a draw callback.
+
+        Gtk+ uses a drawing callback to draw on a DrawingArea. Assignment of the
+        callback function creates a Gtk+ canvas and Gtk+ context automatically using the
+        canvas and cairo_context function arguments. This method calls the draw method
+        on the interface Canvas to draw the objects.
+        """
+
+        # Explicitly render the background
+        sc = self.native.get_style_context()
+        bg = sc.get_property("background-color", sc.get_state())
+        cairo_context.set_source_rgba(
+            255 * bg.red,
+            255 * bg.green,
+            255 * bg.blue,
+            bg.alpha,
+        )
+        width = self.native.get_allocation().width
+        height = self.native.get_allocation().height
+        cairo_context.rectangle(0, 0, width, height)
+        cairo_context.fill()
+
+        self.original_transform_matrix = cairo_context.get_matrix()
+        # Only the objects that intersect the region being drawn need to be replayed.
+        self.interface._draw(
+            self,
+            clip=cairo_context.clip_extents(),
+            cairo_context=cairo_context,
+        )
+
+    def gtk_on_size_allocate(self, widget, allocation):
+        """Called on widget resize, and calls the handler set on the interface, if
+        any."""
+        self.interface.on_resize(width=allocation.width, height=allocation.height)
+
+    def mouse_down(self, obj, event):
+        if event.button == 1:
+            if event.type == Gdk.EventType._2BUTTON_PRESS:
+                self.interface.on_activate(event.x, event.y)
+            else:
+                self.interface.on_press(event.x, event.y)
+        elif event.button == 3:
+            self.interface.on_alt_press(event.x, event.y)
+        else:  # pragma: no cover
+            # Don't handle other button presses
+            pass
+
+    def mouse_move(self, obj, event):
+        if event.state == Gdk.ModifierType.BUTTON1_MASK:
+            self.interface.on_drag(event.x, event.y)
+        if event.state == Gdk.ModifierType.BUTTON3_MASK:
+            self.interface.on_alt_drag(event.x, event.y)
+
+    def mouse_up(self, obj, event):
+        if event.button == 1:
+            self.interface.on_release(event.x, event.y)
+        elif event.button == 3:
+            self.interface.on_alt_release(event.x, event.y)
+        else:  # pragma: no cover
+            # Don't handle other button presses
+            pass
+
+    def redraw(self):
+        self.native.queue_draw()
+
+    def redraw_rect(self, x, y, width, height):
+        self.native.queue_draw_area(x, y, width, height)
+
+    def _create_pango_context(self):
+        return self.native.create_pango_context()
 
     def get_image_data(self):
         width = self.native.get_allocation().width
@@ -308,8 +490,64 @@ class Canvas(Widget):
         self.interface.intrinsic.width = at_least(height)
 
 
+class OffscreenCanvas(CairoCanvas):
+    """A canvas that is rendered onto a Cairo surface, rather than a widget."""
+
+    # The file formats that are rendered as vector graphics, and the name of the Cairo
+    # surface that renders them.
+    VECTOR_FORMATS = {
+        ".pdf": "PDFSurface",
+        ".svg": "SVGSurface",
+    }
+
+    def __init__(self, interface):
+        if cairo is None:  # pragma: no cover
+            raise RuntimeError(
+                "Unable to import Cairo. Ensure that the system package "
+                "providing Cairo and its GTK bindings have been installed."
+            )
+
+        self.interface = interface
+        self.interface._impl = self
+        self._reset_text_cache()
+
+    def _create_pango_context(self):
+        # There's no widget (and no screen) to take the font settings from, so use the
+        # defaults of the font map. This doesn't require GTK to be initialized, so
+        # offscreen canvases can be drawn on any thread.
+        return PangoCairo.FontMap.get_default().create_context()
+
+    def _render(self, surface):
+        cairo_context = cairo.Context(surface)
+        self.original_transform_matrix = cairo_context.get_matrix()
+        self.interface._draw(self, cairo_context=cairo_context)
+
+    def get_image_data(self):
+        width, height = (ceil(size) for size in self.interface.size)
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+        self._render(surface)
+
+        data = BytesIO()
+        surface.write_to_png(data)
+        return data.getbuffer()
+
+    def save_vector(self, path):
+        surface_class = getattr(cairo, self.VECTOR_FORMATS[path.suffix.lower()])
+        surface = surface_class(str(path), *self.interface.size)
+        self._render(surface)
+        surface.finish()
+
+
 @dataclass
 class FontMetrics:
     ascent: float
     descent: float
     line_height: int
+
+
+@dataclass
+class TextLayout:
+    metrics: FontMetrics
+    # A Pango layout for each line of the text, and the width of each line.
+    lines: list
+    widths: list
@@ -205,9 +205,9 @@ class DetailedList(Widget):
         return DetailedListRow(self.interface, item)
 
     def change_source(self, source):
-        self.store.remove_all()
-        for item in source:
-            self.store.append(self.row_factory(item))
+        self.store.splice(
+            0, self.store.get_n_items(), [self.row_factory(item) for item in source]
+        )
 
     def insert(self, index, item):
         self.hide_actions()
@@ -216,6 +216,12 @@ class DetailedList(Widget):
         self.native_detailedlist.show_all()
         self.update_refresh_button()
 
+    def insert_range(self, index, items):
+        self.hide_actions()
+        self.store.splice(index, 0, [self.row_factory(item) for item in items])
+        self.native_detailedlist.show_all()
+        self.update_refresh_button()
+
     def change(self, item):
         item._impl.update(self.interface, item)
 
@@ -224,6 +230,11 @@ class DetailedList(Widget):
         self.store.remove(index)
         self.update_refresh_button()
 
+    def remove_range(self, index, items):
+        self.hide_actions()
+        self.store.splice(index, len(items), [])
+        self.update_refresh_button()
+
     def clear(self):
         self.hide_actions()
         self.store.remove_all()
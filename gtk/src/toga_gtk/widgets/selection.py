@@ -64,6 +64,17 @@ class Selection(Widget):
         if self.native.get_active() == -1:
             self.native.set_active(0)
 
+    def insert_range(self, index, items):
+        with self.suspend_notifications():
+            for offset, item in enumerate(items):
+                self.native.insert_text(
+                    index + offset, self.interface._title_for_item(item)
+                )
+
+        # If you're inserting the first items, make sure one is selected
+        if self.native.get_active() == -1:
+            self.native.set_active(0)
+
     def remove(self, index, item):
         selection = self.native.get_active()
         with self.suspend_notifications():
@@ -74,6 +85,17 @@ class Selection(Widget):
         if index == selection:
             self.native.set_active(0)
 
+    def remove_range(self, index, items):
+        selection = self.native.get_active()
+        with self.suspend_notifications():
+            for _ in items:
+                self.native.remove(index)
+
+        # If we deleted the item that is currently selected, reset the
+        # selection to the first item
+        if index <= selection < index + len(items):
+            self.native.set_active(0)
+
     def clear(self):
         with self.suspend_notifications():
             self.native.remove_all()
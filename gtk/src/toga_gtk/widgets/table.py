@@ -1,4 +1,5 @@
 import warnings
+from contextlib import contextmanager
 
 from travertino.size import at_least
 
@@ -41,6 +42,10 @@ class TogaRow(GObject.Object):
 
 
 class Table(Widget):
+    # Ranges of at least this many rows are applied while the store is detached
+    # from the view, so the view doesn't process a change signal for every row.
+    DETACH_THRESHOLD = 100
+
     def create(self):
         self.store = None
         # Create a tree view, and put it in a scroll view.
@@ -53,7 +58,7 @@ class Table(Widget):
             self.selection.set_mode(Gtk.SelectionMode.MULTIPLE)
         else:
             self.selection.set_mode(Gtk.SelectionMode.SINGLE)
-        self.selection.connect("changed", self.gtk_on_select)
+        self._select_handler = self.selection.connect("changed", self.gtk_on_select)
 
         self._create_columns()
 
@@ -109,13 +114,12 @@ class Table(Widget):
             types.extend([GdkPixbuf.Pixbuf, str])
         self.store = Gtk.ListStore(*types)
 
-        for i, row in enumerate(self.interface.data):
-            self.insert(i, row)
+        self.insert_range(0, self.interface.data)
 
         self.native_table.set_model(self.store)
         self.refresh()
 
-    def insert(self, index, item):
+    def _row_values(self, item):
         row = TogaRow(item)
         values = [row]
         for accessor in self.interface.accessors:
@@ -125,8 +129,51 @@ class Table(Widget):
                     row.text(accessor, self.interface.missing_value),
                 ]
             )
+        return values
 
-        self.store.insert(index, values)
+    def insert(self, index, item):
+        self.store.insert(index, self._row_values(item))
+
+    @contextmanager
+    def _detached_store(self, count, moved):
+        # Small ranges, and updates made while the store is already detached (e.g.,
+        # when the source is being changed) are applied to the store directly.
+        if count < self.DETACH_THRESHOLD or self.native_table.get_model() is None:
+            yield
+            return
+
+        # Detaching the store clears the selection; restore it afterwards, and
+        # only notify the interface if some of the selected rows were removed.
+        # ``moved`` maps the position of a row in the store before the update to its
+        # position afterwards (or None if it was removed). The source may already
+        # have changed further (e.g., if the update is part of a batch), so it can't
+        # be used to find the rows.
+        _, paths = self.selection.get_selected_rows()
+        selected = [path.get_indices()[0] for path in paths]
+        with self.selection.handler_block(self._select_handler):
+            self.native_table.set_model(None)
+            try:
+                yield
+            finally:
+                self.native_table.set_model(self.store)
+                restored = 0
+                for row in map(moved, selected):
+                    if row is not None:
+                        self.selection.select_path(Gtk.TreePath.new_from_indices([row]))
+                        restored += 1
+        if restored != len(selected):
+            self.interface.on_select()
+
+    def insert_range(self, index, items):
+        rows = [self._row_values(item) for item in items]
+        count = len(rows)
+
+        def moved(row):
+            return row + count if row >= index else row
+
+        with self._detached_store(count, moved):
+            for offset, values in enumerate(rows):
+                self.store.insert(index + offset, values)
 
     def change(self, item):
         index = self.interface.data.index(item)
@@ -138,6 +185,22 @@ class Table(Widget):
     def remove(self, index, item):
         del self.store[index]
 
+    def remove_range(self, index, items):
+        count = len(items)
+
+        def moved(row):
+            if row < index:
+                return row
+            elif row < index + count:
+                return None
+            return row - count
+
+        with self._detached_store(count, moved):
+            itr = self.store.iter_nth_child(None, index)
+            for _ in items:
+                # ListStore.remove() moves the iterator on to the next row.
+                self.store.remove(itr)
+
     def clear(self):
         self.store.clear()
 
@@ -44,18 +44,18 @@ class MultilineTextInputProbe(SimpleProbe):
         # on the child ``text`` node, but Gtk doesn't expose that style
         # as something that can be inspected. As a workaround, we check
         # that the style property has been set on the base widget, and
-        # that there is a CSS style provider targeting both the base node
-        # and the ``text`` child node
+        # that the widget has a CSS style class targeting both the base
+        # node and the ``text`` child node
         try:
-            css_provider = self.impl.style_providers[
-                ("color", id(self.native_textview))
-            ]
+            style_class = self.impl.style_providers[("color", id(self.native_textview))]
         except KeyError:
-            # No style provider exists yet, so defaults will be in effect
+            # No style class exists yet, so defaults will be in effect
             pass
         else:
-            assert ".toga {\n" in css_provider.to_string()
-            assert ".toga text {\n" in css_provider.to_string()
+            style_context = self.native_textview.get_style_context()
+            assert style_class.name in style_context.list_classes()
+            selector, _ = style_class.key
+            assert selector == ".toga, .toga text"
 
         sc = self.native_textview.get_style_context()
         return toga_color(sc.get_property("color", sc.get_state()))
@@ -66,18 +66,20 @@ class MultilineTextInputProbe(SimpleProbe):
         # on the child ``text`` node, but Gtk doesn't expose that style
         # as something that can be inspected. As a workaround, we check
         # that the style property has been set on the base widget, and
-        # that there is a CSS style provider targeting both the base node
-        # and the ``text`` child node
+        # that the widget has a CSS style class targeting both the base
+        # node and the ``text`` child node
         try:
-            css_provider = self.impl.style_providers[
+            style_class = self.impl.style_providers[
                 ("background_color", id(self.native_textview))
             ]
         except KeyError:
-            # No style provider exists yet, so defaults will be in effect
+            # No style class exists yet, so defaults will be in effect
             pass
         else:
-            assert ".toga {\n" in css_provider.to_string()
-            assert ".toga text {\n" in css_provider.to_string()
+            style_context = self.native_textview.get_style_context()
+            assert style_class.name in style_context.list_classes()
+            selector, _ = style_class.key
+            assert selector == ".toga, .toga text"
 
         sc = self.native_textview.get_style_context()
         return toga_color(sc.get_property("background-color", sc.get_state()))
@@ -17,6 +17,11 @@ def nsdata_to_bytes(data: NSData) -> bytes:
     return cast(data.bytes, POINTER(c_char))[: data.length]
 
 
+# Ownership of native images: every Image owns one reference to its UIImage, which
+# is released when the Image is deleted. A UIImage may be shared by several images
+# (e.g., by images that are loaded from the core image cache); each of them takes its
+# own reference. The core image cache holds the Image that loaded the UIImage, rather
+# than the UIImage itself, so a cached UIImage remains valid until it is evicted.
 class Image:
     RAW_TYPE = UIImage
 